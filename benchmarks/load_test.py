@@ -0,0 +1,110 @@
+"""
+    Lasttest für monopoly_analysis.service gegen localhost.
+
+    Öffnet --concurrency Keep-Alive-Verbindungen und sendet insgesamt --requests Anfragen,
+    gemischt aus /landing und /roi über --configs verschiedene Regelvarianten. Gibt Durchsatz,
+    Latenz-Perzentile und die /metrics-Antwort des Dienstes aus.
+
+    Aufruf:
+        python -m monopoly_analysis.service --port 8765 &
+        python -m benchmarks.load_test --port 8765 --requests 5000 --concurrency 64
+
+        # oder Dienst im selben Prozess starten
+        python -m benchmarks.load_test --spawn --workers 4
+    """
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import asdict
+import numpy as np
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.service import request
+from monopoly_analysis.sweep import config_grid
+
+
+def _payloads(configs: list[RuleConfig], rng: random.Random):
+    # Typische Dashboard-Abfragen: Landewahrscheinlichkeiten oder ROI einer Straße,
+    # je Anfrage genau eine der configs
+    while True:
+        config = {"config": asdict(configs[rng.randrange(len(configs))])}
+        if rng.random() < 0.5:
+            yield "/landing", config
+        else:
+            yield "/roi", {**config, "fields": [rng.choice((1, 19, 24, 39))], "levels": [rng.randrange(6)]}
+
+
+async def run_load(host: str, port: int, n_requests: int, concurrency: int, n_configs: int, seed: int) -> dict:
+    configs = config_grid(jail_rounds=(1, 2, 3), chance_three_back=(True, False))[:n_configs]
+    rng = random.Random(seed)
+    payloads = _payloads(configs, rng)
+    latencies = []
+    failures = 0
+    remaining = n_requests
+
+    async def client() -> None:
+        nonlocal remaining, failures
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                path, payload = next(payloads)
+                start = time.perf_counter()
+                status, _ = await request(reader, writer, "POST", path, payload)
+                latencies.append(time.perf_counter() - start)
+                failures += status != 200
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    await writer.wait_closed()
+    milliseconds = np.array(latencies) * 1e3
+    return {
+        "requests": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "throughput_per_s": len(latencies) / elapsed,
+        "latency_ms": {f"p{q}": float(np.percentile(milliseconds, q)) for q in (50, 95, 99)},
+        "service": metrics,
+    }
+
+
+async def _main(args) -> dict:
+    if not args.spawn:
+        return await run_load(args.host, args.port, args.requests, args.concurrency, args.configs, args.seed)
+    from monopoly_analysis.service import QueryService
+    service = QueryService(args.workers)
+    server = await service.serve(args.host, 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return await run_load(args.host, port, args.requests, args.concurrency, args.configs, args.seed)
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--configs", type=int, default=6, help="Anzahl verschiedener Regelvarianten (1-6)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true", help="Dienst im selben Prozess starten")
+    parser.add_argument("--workers", type=int, help="Prozesse des gestarteten Dienstes")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_main(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
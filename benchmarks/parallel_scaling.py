@@ -0,0 +1,44 @@
+"""
+    Skalierungs-Benchmark für MonteCarloSimulator.run_parallel.
+
+    Misst den Durchsatz (Spieler-Züge/s) für 1, 2, 4, ... Worker bei fester Arbeit je
+    Worker (weak scaling) und gibt die Effizienz relativ zu einem Worker aus.
+
+    Aufruf:
+        python -m benchmarks.parallel_scaling --max-workers 32 --players-per-worker 1000000
+    """
+import argparse
+import os
+import time
+from monopoly_analysis.simulation import MonteCarloSimulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--players-per-worker", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    simulator = MonteCarloSimulator()
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    baseline = None
+    print(f"{'worker':>6} {'turns/s':>14} {'speedup':>8} {'effizienz':>9}")
+    for n_workers in worker_counts:
+        n_players = args.players_per_worker * n_workers
+        start = time.perf_counter()
+        result = simulator.run_parallel(n_players, args.steps, n_workers, burn_in=0, seed=args.seed)
+        throughput = result.n_turns / (time.perf_counter() - start)
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(f"{n_workers:>6} {throughput:>14,.0f} {speedup:>8.2f} {speedup / n_workers:>9.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+    Benchmark-Suite für die Hot Paths mit JSON-Historie und Regressions-Gate.
+
+    Misst Zustandsraum, Matrixaufbau (Referenz und vektorisiert), stationäre Lösung,
+    Simulation und Regelvarianten-Sweeps auf drei Skalen: single (Einzelspieler-Kette),
+    joint (gemeinsame Kette mehrerer Spieler) und deck (Kartengedächtnis, 30720 Zustände).
+    Vor dem Messen prüft die Suite, dass jede Matrixzeile innerhalb der Toleranz 1 ergibt.
+
+    Aufruf:
+        python -m benchmarks.suite run --scale single joint
+        python -m benchmarks.suite compare --threshold 10
+
+    Die Historie liegt standardmäßig unter ~/.cache/monopoly-analysis/benchmark-history.json
+    (oder $MONOPOLY_ANALYSIS_BENCHMARK_HISTORY), also außerhalb des Quellbaums.
+
+    compare vergleicht den letzten Lauf mit dem vorletzten (oder --baseline INDEX) und
+    beendet sich mit Code 1, wenn eine Kennzahl um mehr als --threshold Prozent langsamer ist.
+    """
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+import numpy as np
+import scipy
+import monopoly_analysis
+from monopoly_analysis import hitting_times, solvers
+from monopoly_analysis.deck_model import DeckAwareModel
+from monopoly_analysis.joint_chain import JointChain
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.simulation import MonteCarloSimulator
+from monopoly_analysis.sweep import config_grid, run_sweep
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+SCALES = ("single", "joint", "deck")
+DEFAULT_HISTORY = Path(os.environ.get("MONOPOLY_ANALYSIS_BENCHMARK_HISTORY",
+                                      Path.home() / ".cache" / "monopoly-analysis" / "benchmark-history.json"))
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    scale: str
+    setup: Callable[[], tuple]  # Liefert die Argumente für run (nicht gemessen)
+    run: Callable[..., object]
+    items: int = 1  # Arbeitseinheiten je Aufruf (für Durchsatz)
+    reset: Callable[[], None] | None = None  # Vor jeder Wiederholung, nicht gemessen
+
+
+def _normal_states(probabilities: Probabilities) -> list:
+    return [state for state in probabilities.create_state_space() if not state.in_jail]
+
+
+def _all_normal_transitions(probabilities: Probabilities, states: list) -> None:
+    for state in states:
+        probabilities._get_transitions_from_normal_state(state)
+
+
+def _clear_caches() -> None:
+    # Ohne Ergebnis-Caches, sonst misst jede Wiederholung nur Hash und Nachschlagen
+    solvers.clear_cache()
+    hitting_times.clear_cache()
+
+
+def _solve(matrix, codec, method: str):
+    return solvers.solve_stationary(matrix, codec, method=method)
+
+
+def _matrices(scale: str) -> dict[str, object]:
+    # Matrizen je Skala, die auf Zeilensumme 1 geprüft werden
+    probabilities = Probabilities()
+    if scale == "single":
+        return {"create_transition_matrix": probabilities.create_transition_matrix(probabilities.create_state_space()),
+                "TransitionMatrixBuilder.build": TransitionMatrixBuilder(probabilities).build()}
+    if scale == "joint":
+        return {"turn_matrix": JointChain(TransitionMatrixBuilder(probabilities).build(), 2).move_matrix}
+    return {"DeckAwareModel.build": DeckAwareModel(probabilities).build()}
+
+
+def check_row_sums(scales: tuple[str, ...] = SCALES, tolerance: float = 1e-3) -> dict[str, float]:
+    """
+        Größte Abweichung der Zeilensummen von 1 je Matrix.
+
+        Note:
+            Die Rohmatrizen summieren wegen auf 4 Stellen gerundeter Würfelwahrscheinlichkeiten
+            zu ≈1.0003, daher die Standardtoleranz 1e-3.
+
+        Raises:
+            ValueError: Wenn eine Zeile außerhalb der Toleranz liegt
+        """
+    deviations = {}
+    for scale in scales:
+        for name, matrix in _matrices(scale).items():
+            row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+            deviations[f"{scale}/{name}"] = deviation = float(np.abs(row_sums - 1).max())
+            if deviation > tolerance:
+                raise ValueError(f"{scale}/{name}: Zeilensumme weicht um {deviation:.2e} von 1 ab "
+                                 f"(Toleranz {tolerance:.0e})")
+    return deviations
+
+
+def benchmarks(scales: tuple[str, ...] = SCALES) -> list[Benchmark]:
+    probabilities = Probabilities()
+    codec = probabilities.codec
+    builder = TransitionMatrixBuilder(probabilities)
+    cases = []
+    if "single" in scales:
+        matrix = builder.build()
+        cases += [
+            Benchmark("create_state_space", "single", lambda: (), probabilities.create_state_space),
+            Benchmark("create_transition_matrix", "single", lambda: (probabilities.create_state_space(),),
+                      probabilities.create_transition_matrix),
+            Benchmark("_get_transitions_from_normal_state", "single",
+                      lambda: (probabilities, _normal_states(probabilities)), _all_normal_transitions,
+                      items=len(_normal_states(probabilities))),
+            Benchmark("TransitionMatrixBuilder.build", "single", lambda: (), builder.build),
+            Benchmark("solve_stationary[direct]", "single", lambda: (matrix, codec, "direct"), _solve,
+                      reset=_clear_caches),
+            Benchmark("solve_stationary[power]", "single", lambda: (matrix, codec, "power"), _solve,
+                      reset=_clear_caches),
+            Benchmark("simulation[10k×100]", "single", lambda: (10_000, 100, 0, 0), MonteCarloSimulator().run,
+                      items=1_000_000),
+            Benchmark("run_sweep[12]", "single",
+                      lambda: (config_grid(jail_rounds=(1, 2, 3), chance_three_back=(True, False),
+                                           chance_next_railroad=(True, False)),),
+                      run_sweep, items=12, reset=_clear_caches),
+        ]
+    if "joint" in scales:
+        matrix = builder.build()
+        chain = JointChain(matrix, 3)
+        cases += [
+            Benchmark("JointChain[2].stationary[power]", "joint", lambda: ("power",),
+                      JointChain(matrix, 2).stationary),
+            Benchmark("JointChain[3].apply_round", "joint", lambda: (chain.start_distribution(),), chain.apply_round),
+        ]
+    if "deck" in scales:
+        model = DeckAwareModel(probabilities)
+        cases += [
+            Benchmark("DeckAwareModel.build", "deck", lambda: (), model.build),
+            Benchmark("solve_stationary[krylov]", "deck", lambda: (model.build(), model.positions, "krylov"), _solve,
+                      reset=_clear_caches),
+        ]
+    return cases
+
+
+def measure(benchmark: Benchmark, repeats: int) -> dict[str, float]:
+    """
+        Führt einen Benchmark repeats-mal aus (nach einem Aufwärmlauf).
+
+        Returns:
+            {"min", "median" (Sekunden), "throughput" (Einheiten/s bezogen auf min), "repeats"}
+        """
+    args = benchmark.setup()
+    benchmark.run(*args)
+    times = []
+    for _ in range(repeats):
+        args = benchmark.setup()
+        if benchmark.reset is not None:
+            benchmark.reset()
+        start = time.perf_counter()
+        benchmark.run(*args)
+        times.append(time.perf_counter() - start)
+    return {"min": min(times), "median": statistics.median(times),
+            "throughput": benchmark.items / min(times), "repeats": repeats}
+
+
+def run(scales: tuple[str, ...] = SCALES,
+        repeats: int = 5,
+        row_tolerance: float = 1e-3,
+        only: str | None = None) -> dict:
+    """
+        Prüft die Zeilensummen und misst alle Benchmarks der gewählten Skalen.
+
+        Returns:
+            Ein Eintrag der Historie (Zeitstempel, Umgebung, Kennzahlen je "Skala/Name")
+        """
+    row_deviation = check_row_sums(scales, row_tolerance)
+    results = {}
+    for benchmark in benchmarks(scales):
+        key = f"{benchmark.scale}/{benchmark.name}"
+        if only is None or only in key:
+            results[key] = measure(benchmark, repeats)
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "version": monopoly_analysis.__version__,
+        "environment": {"python": platform.python_version(), "numpy": np.__version__, "scipy": scipy.__version__,
+                        "machine": platform.machine(), "processor": platform.processor()},
+        "row_deviation": row_deviation,
+        "results": results,
+    }
+
+
+def load_history(path: str | Path) -> list[dict]:
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def append_history(path: str | Path, entry: dict) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    history = load_history(path) + [entry]
+    # Erst temporär schreiben, damit ein Abbruch die Historie nicht beschädigt
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(history, indent=2, ensure_ascii=False))
+    temporary.replace(path)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 10.0, metric: str = "min") -> list[dict]:
+    """
+        Vergleicht zwei Läufe je Kennzahl.
+
+        Args:
+            baseline: Referenzlauf aus der Historie
+            current: Zu prüfender Lauf
+            threshold: Erlaubte Verlangsamung in Prozent
+            metric: "min" oder "median"
+
+        Returns:
+            Eine Zeile je gemeinsamer Kennzahl: {"name", "baseline", "current", "change" (Prozent),
+            "regression" (bool)}
+        """
+    rows = []
+    for name in sorted(baseline["results"].keys() & current["results"].keys()):
+        before = baseline["results"][name][metric]
+        after = current["results"][name][metric]
+        change = (after - before) / before * 100
+        rows.append({"name": name, "baseline": before, "current": after, "change": change,
+                     "regression": change > threshold})
+    return rows
+
+
+def _print_run(entry: dict) -> None:
+    print(f"{'Benchmark':<50} {'min [ms]':>10} {'median [ms]':>12} {'Einheiten/s':>14}")
+    for name, result in entry["results"].items():
+        print(f"{name:<50} {result['min'] * 1e3:>10.3f} {result['median'] * 1e3:>12.3f} "
+              f"{result['throughput']:>14,.0f}")
+
+
+def _print_comparison(rows: list[dict], threshold: float) -> None:
+    print(f"{'Benchmark':<50} {'vorher [ms]':>12} {'nachher [ms]':>13} {'Änderung':>9}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<50} {row['baseline'] * 1e3:>12.3f} {row['current'] * 1e3:>13.3f} "
+              f"{row['change']:>+8.1f}%{flag}")
+    n_regressions = sum(row["regression"] for row in rows)
+    print(f"{n_regressions} Regression(en) über {threshold:g} %")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmarks messen und an die Historie anhängen")
+    run_parser.add_argument("--scale", nargs="+", choices=SCALES, default=list(SCALES))
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--only", help="Nur Benchmarks, deren Name diesen Text enthält")
+    run_parser.add_argument("--row-tolerance", type=float, default=1e-3)
+    run_parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    run_parser.add_argument("--no-save", action="store_true", help="Nicht an die Historie anhängen")
+    run_parser.add_argument("--threshold", type=float, help="Direkt mit dem letzten Lauf vergleichen")
+
+    compare_parser = commands.add_parser("compare", help="Zwei Läufe der Historie vergleichen")
+    compare_parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    compare_parser.add_argument("--baseline", type=int, default=-2, help="Index des Referenzlaufs")
+    compare_parser.add_argument("--current", type=int, default=-1, help="Index des geprüften Laufs")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="Erlaubte Verlangsamung in Prozent")
+    compare_parser.add_argument("--metric", choices=("min", "median"), default="min")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        try:
+            entry = run(tuple(args.scale), args.repeats, args.row_tolerance, args.only)
+        except ValueError as error:
+            print(f"Fehler: {error}", file=sys.stderr)
+            return 1
+        _print_run(entry)
+        history = load_history(args.history)
+        if not args.no_save:
+            append_history(args.history, entry)
+        if args.threshold is not None and history:
+            rows = compare(history[-1], entry, args.threshold)
+            _print_comparison(rows, args.threshold)
+            return int(any(row["regression"] for row in rows))
+        return 0
+
+    history = load_history(args.history)
+    try:
+        baseline, current = history[args.baseline], history[args.current]
+    except IndexError:
+        print(f"Fehler: {args.history} enthält nur {len(history)} Lauf/Läufe", file=sys.stderr)
+        return 1
+    rows = compare(baseline, current, args.threshold, args.metric)
+    _print_comparison(rows, args.threshold)
+    return int(any(row["regression"] for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
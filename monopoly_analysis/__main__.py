@@ -0,0 +1,4 @@
+import sys
+from monopoly_analysis.cli import main
+
+sys.exit(main())
@@ -0,0 +1,154 @@
+from dataclasses import asdict, dataclass
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import numpy as np
+from monopoly_analysis import __version__
+from monopoly_analysis.game_board import RuleConfig
+
+FORMAT_VERSION = 1
+
+# Spalten der Zustandstabelle (Reihenfolge = Zeilen/Spalten der Matrix)
+STATE_DTYPE = np.dtype([("position", np.int16), ("counter", np.int8), ("in_jail", np.bool_)])
+
+ARRAY_NAMES = ("states", "transition_matrix", "distribution", "field_probabilities",
+               "hitting_times_turns", "hitting_times_rolls")
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """
+        Vorberechnete Ergebnisse einer Regelvariante, alle Arrays schreibgeschützt per Memory-Map.
+        """
+    path: Path
+    meta: dict
+    states: np.ndarray  # STATE_DTYPE, n_states
+    transition_matrix: np.ndarray  # n_states × n_states
+    distribution: np.ndarray  # Stationäre Verteilung je Zustand
+    field_probabilities: np.ndarray  # Stationäre Verteilung je Feld
+    hitting_times_turns: np.ndarray  # n_states × n_fields, erwartete Züge bis zur Landung
+    hitting_times_rolls: np.ndarray  # n_states × n_fields, erwartete Würfe bis zur Landung
+
+    @property
+    def config(self) -> RuleConfig:
+        return RuleConfig(**self.meta["config"])
+
+
+class ArtifactStore:
+    """
+        Versioniertes Verzeichnis mit einem Unterordner je Regelvariante:
+
+            <root>/<config_hash>/meta.json
+            <root>/<config_hash>/<name>.npy  (für jeden Eintrag in ARRAY_NAMES)
+
+        Geladen wird mit np.load(mmap_mode="r"): Viele Worker-Prozesse teilen sich dieselben
+        Seiten des Page-Cache, ohne Kopie und ohne Probabilities oder den Matrix-Aufbau
+        zu importieren. Artefakte mit anderer Format- oder Bibliotheksversion gelten als veraltet.
+        """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def path(self, config: RuleConfig | str) -> Path:
+        key = config if isinstance(config, str) else config.config_hash()
+        return self.root / key
+
+    def exists(self, config: RuleConfig | str) -> bool:
+        try:
+            self._read_meta(self.path(config))
+        except (FileNotFoundError, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    def _read_meta(path: Path) -> dict:
+        with open(path / "meta.json", encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta.get("format_version") != FORMAT_VERSION or meta.get("library_version") != __version__:
+            raise ValueError(f"Veraltetes Artefakt in {path}: Format {meta.get('format_version')}, "
+                             f"Version {meta.get('library_version')}")
+        return meta
+
+    def load(self, config: RuleConfig | str) -> Artifact:
+        """
+            Lädt ein Artefakt ohne Neuberechnung.
+
+            Args:
+                config: Regelvariante oder deren config_hash()
+
+            Returns:
+                Artifact: Arrays als schreibgeschützte Memory-Maps
+
+            Raises:
+                FileNotFoundError: Kein Artefakt für diese Regelvariante
+                ValueError: Artefakt mit anderer Format- oder Bibliotheksversion
+            """
+        path = self.path(config)
+        meta = self._read_meta(path)
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in ARRAY_NAMES}
+        return Artifact(path=path, meta=meta, **arrays)
+
+    def write(self, config: RuleConfig) -> Path:
+        """
+            Berechnet alle Arrays einer Regelvariante und schreibt sie als Artefakt.
+
+            Note:
+                Es wird in ein temporäres Verzeichnis geschrieben und dieses anschließend
+                umbenannt, damit gleichzeitige Leser nie ein halbes Artefakt sehen.
+            """
+        # Aufbau erst hier importieren: der Lesepfad braucht nur NumPy
+        from monopoly_analysis.hitting_times import HittingTimes
+        from monopoly_analysis.probabilities import Probabilities
+        from monopoly_analysis.solvers import solve_stationary
+        from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+        probabilities = Probabilities(config)
+        codec = probabilities.codec
+        matrix = TransitionMatrixBuilder(probabilities).build()
+        stationary = solve_stationary(matrix, codec)
+        hitting_times = HittingTimes(matrix, codec)
+
+        states = np.empty(codec.n_states, dtype=STATE_DTYPE)
+        states["position"], states["counter"], states["in_jail"] = codec.positions, codec.counters, codec.in_jail
+        arrays = {
+            "states": states,
+            "transition_matrix": matrix,
+            "distribution": stationary.distribution,
+            "field_probabilities": stationary.field_probabilities,
+            "hitting_times_turns": hitting_times.expected_hitting_times("turns"),
+            "hitting_times_rolls": hitting_times.expected_hitting_times("rolls"),
+        }
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "library_version": __version__,
+            "config_hash": config.config_hash(),
+            "config": asdict(config),
+            "arrays": {name: {"shape": list(array.shape), "dtype": array.dtype.str} for name, array in arrays.items()},
+        }
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        target = self.path(config)
+        staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=self.root))
+        try:
+            for name, array in arrays.items():
+                np.save(staging / f"{name}.npy", np.ascontiguousarray(array))
+            with open(staging / "meta.json", "w", encoding="utf-8") as file:
+                json.dump(meta, file, indent=2)
+            if target.exists():
+                shutil.rmtree(target)  # veraltetes Artefakt
+            os.replace(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not self.exists(config):  # ein paralleler Schreiber war schneller
+                raise
+        return target
+
+    def get_or_build(self, config: RuleConfig) -> Artifact:
+        """
+            Lädt das Artefakt oder schreibt es zuerst, falls es fehlt oder veraltet ist.
+            """
+        if not self.exists(config):
+            self.write(config)
+        return self.load(config)
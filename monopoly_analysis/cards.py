@@ -0,0 +1,44 @@
+import numpy as np
+
+
+def build_card_tables(game_version) -> tuple[np.ndarray, np.ndarray]:
+    """
+        Erstellt Nachschlagetabellen [Feld, Karte] → Zielfeld für beide Kartenstapel.
+
+        Args:
+            game_version: Spielbrett (z.B. game_board.GermanMonopoly)
+
+        Returns:
+            (chance_table, community_table): je (n_fields + 1) × total_cards, int16.
+            Der Code n_fields steht für "eingesperrt" (Gehe-ins-Gefängnis-Karte oder
+            Feld 30); die letzte Zeile bildet diesen Code auf sich selbst ab.
+
+        Note:
+            Kartenreihenfolge im Ereignisstapel: feste Ziele, nächster Bahnhof,
+            3 Felder zurück, danach Karten ohne Positionsänderung. Felder ohne Karten
+            bilden auf sich selbst ab, sodass beide Tabellen nacheinander angewendet
+            werden können (Ereignis → Gemeinschaft, z.B. 36 → 33).
+        """
+    n_fields = len(game_version.board_fields)
+    jail_code = n_fields
+    total_cards = game_version.total_cards
+    identity = np.arange(n_fields + 1, dtype=np.int16)
+
+    def card_target(field: int) -> int:
+        # Karte "Gefängnis" sperrt ein, Feld 30 ebenfalls
+        if field in (game_version.jail_field, game_version.go_in_jail_field):
+            return jail_code
+        return field
+
+    chance_table = np.repeat(identity[:, None], total_cards, axis=1)
+    chance_table[game_version.go_in_jail_field, :] = jail_code
+    for field in game_version.chance_fields:
+        targets = game_version.get_chance_card_targets(field)
+        chance_table[field, :len(targets)] = [card_target(target) for target in targets]
+
+    community_table = np.repeat(identity[:, None], total_cards, axis=1)
+    for field in game_version.community_fields:
+        targets = [card_target(target) for target in game_version.community_chest_fixed_targets]
+        community_table[field, :len(targets)] = targets
+
+    return chance_table, community_table
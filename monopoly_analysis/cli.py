@@ -0,0 +1,298 @@
+"""
+    Kommandozeile "monopoly-analysis" für Shell-Pipelines.
+
+    Abfragen werden aus dem Artefakt der Regelvariante beantwortet (siehe artifacts.ArtifactStore).
+    Der Lesepfad kommt ohne NumPy aus: .npy-Dateien werden direkt gelesen, NumPy, SciPy und
+    der Matrix-Aufbau werden erst importiert, wenn ein Artefakt fehlt oder simuliert wird.
+    Auch aus der Standardbibliothek lädt der Modulkopf nur, was jede Abfrage braucht (Pfade
+    über os.path statt pathlib, csv erst bei --format csv), da der Interpreterstart die
+    Antwortzeit dominiert.
+
+    Beispiele:
+        monopoly-analysis stationary
+        monopoly-analysis --set jail_rounds=2 --format csv hitting-times --from 10
+        monopoly-analysis roi --opponents 3 --level 3 --top 5
+        monopoly-analysis simulate --players 100000 --steps 200 --seed 1
+    """
+import argparse
+import ast
+import json
+import math
+import os
+import struct
+import sys
+from dataclasses import fields
+from monopoly_analysis import __version__
+from monopoly_analysis.game_board import GermanMonopoly, RuleConfig
+
+# Muss artifacts.FORMAT_VERSION entsprechen (dort nicht importierbar ohne NumPy)
+ARTIFACT_FORMAT_VERSION = 1
+DEFAULT_STORE = os.environ.get("MONOPOLY_ANALYSIS_STORE",
+                               os.path.join(os.path.expanduser("~"), ".cache", "monopoly-analysis"))
+
+# .npy-Datentypen → struct-Formatzeichen
+_STRUCT_CODES = {"<f8": "d", "<i8": "q", "<i4": "i", "<i2": "h", "|i1": "b", "|b1": "?"}
+
+
+class CachedArtifact:
+    """
+        Artefakt einer Regelvariante als Python-Listen, gelesen ohne NumPy.
+        """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self._arrays = {}
+
+    def __getitem__(self, name: str) -> list:
+        if name not in self._arrays:
+            self._arrays[name] = read_npy(os.path.join(self.path, f"{name}.npy"))
+        return self._arrays[name]
+
+
+def read_npy(path: str | os.PathLike) -> list:
+    """
+        Liest eine .npy-Datei (Version 1-3, C-Reihenfolge) ohne NumPy.
+
+        Returns:
+            list: 1-D als Liste von Zahlen, 2-D als Liste von Zeilen; strukturierte Arrays als
+            Liste von Tupeln
+        """
+    with open(path, "rb") as file:
+        data = file.read()
+    if data[:6] != b"\x93NUMPY":
+        raise ValueError(f"{path} ist keine .npy-Datei")
+    major = data[6]
+    header_size_format = "<H" if major == 1 else "<I"
+    start = 8 + struct.calcsize(header_size_format)
+    header_length = struct.unpack_from(header_size_format, data, 8)[0]
+    header = ast.literal_eval(data[start:start + header_length].decode("latin1"))
+    if header["fortran_order"]:
+        raise ValueError(f"{path}: Fortran-Reihenfolge wird nicht unterstützt")
+
+    descr = header["descr"]
+    record = "".join(_STRUCT_CODES[code] for _, code in descr) if isinstance(descr, list) else _STRUCT_CODES[descr]
+    shape = header["shape"]
+    values = list(struct.iter_unpack("<" + record, data[start + header_length:]))
+    if not isinstance(descr, list):
+        values = [value[0] for value in values]
+    if len(shape) == 2:
+        return [values[row * shape[1]:(row + 1) * shape[1]] for row in range(shape[0])]
+    return values
+
+
+def _check_rule_type(name: str, expected, value) -> None:
+    # JSON-Werte gegen die Annotation von RuleConfig (int, bool, tuple[int, ...])
+    def is_int(item) -> bool:
+        return isinstance(item, int) and not isinstance(item, bool)
+
+    if expected is bool:
+        valid, label = isinstance(value, bool), "true/false"
+    elif expected is int:
+        valid, label = is_int(value), "eine ganze Zahl"
+    elif getattr(expected, "__origin__", None) is tuple:
+        valid, label = isinstance(value, list) and all(map(is_int, value)), "eine Liste ganzer Zahlen"
+    else:
+        valid, label = True, ""
+    if not valid:
+        raise ValueError(f"Regel '{name}' erwartet {label}, nicht {json.dumps(value)}")
+
+
+def parse_config(assignments: list[str], config_json: str | None = None) -> RuleConfig:
+    """
+        RuleConfig aus JSON und "name=wert"-Zuweisungen (Werte als JSON, z.B. jail_rounds=2,
+        chance_three_back=false, chance_fields=[7,22,36]).
+
+        Raises:
+            ValueError: Unbekannte Regel, ungültiges JSON oder falscher Werttyp
+        """
+    values = json.loads(config_json) if config_json else {}
+    if not isinstance(values, dict):
+        raise ValueError("--config erwartet ein JSON-Objekt")
+    types = {field.name: field.type for field in fields(RuleConfig)}
+    for assignment in assignments:
+        name, separator, value = assignment.partition("=")
+        if not separator or name not in types:
+            raise ValueError(f"Ungültige Regel '{assignment}', erlaubt: {sorted(types)}")
+        values[name] = json.loads(value)
+    for name, value in values.items():
+        if name not in types:
+            raise ValueError(f"Ungültige Regel '{name}', erlaubt: {sorted(types)}")
+        _check_rule_type(name, types[name], value)
+    return RuleConfig(**values)
+
+
+def load_artifact(store: str | os.PathLike, config: RuleConfig, build: bool = True) -> CachedArtifact:
+    """
+        Artefakt aus dem Store; fehlt es oder ist es veraltet, wird es gebaut (lädt NumPy).
+
+        Raises:
+            FileNotFoundError: Kein gültiges Artefakt und build=False
+        """
+    path = os.path.join(store, config.config_hash())
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as file:
+            meta = json.load(file)
+        current = (isinstance(meta, dict) and meta.get("format_version") == ARTIFACT_FORMAT_VERSION
+                   and meta.get("library_version") == __version__)
+    except (OSError, json.JSONDecodeError):
+        # Fehlend, unlesbar oder abgeschnitten: wie veraltet behandeln und neu bauen
+        current = False
+    if not current:
+        if not build:
+            raise FileNotFoundError(f"Kein aktuelles Artefakt für {config.config_hash()} in {store}")
+        from monopoly_analysis.artifacts import ArtifactStore
+        ArtifactStore(store).write(config)
+    return CachedArtifact(path)
+
+
+def field_names(game_version: GermanMonopoly) -> dict[int, str]:
+    names = {field: street.name for field, street in game_version.streets.items()}
+    names.update(game_version.railroad_names)
+    names.update(game_version.utilities)
+    return names
+
+
+def landings_per_turn(artifact: CachedArtifact, n_fields: int) -> list[float]:
+    # Wie roi.landings_per_turn, aus den Listen des Artefakts
+    landings = [0.0] * n_fields
+    turn_end_mass = 0.0
+    for (position, counter, in_jail), probability in zip(artifact["states"], artifact["distribution"]):
+        if in_jail or counter == 0:
+            turn_end_mass += probability
+        if not in_jail:
+            landings[position] += probability
+    return [landing / turn_end_mass for landing in landings]
+
+
+def stationary_rows(artifact: CachedArtifact, game_version: GermanMonopoly, args) -> list[dict]:
+    names = field_names(game_version)
+    if args.states:
+        return [{"position": position, "counter": counter, "in_jail": in_jail, "probability": probability}
+                for (position, counter, in_jail), probability in zip(artifact["states"], artifact["distribution"])]
+    return [{"field": field, "name": names.get(field, ""), "probability": probability}
+            for field, probability in enumerate(artifact["field_probabilities"])]
+
+
+def hitting_time_rows(artifact: CachedArtifact, game_version: GermanMonopoly, args) -> list[dict]:
+    names = field_names(game_version)
+    states = artifact["states"]
+    if (args.start, 0, False) not in states:
+        # Ohne StateCodec, damit der Lesepfad ohne NumPy auskommt
+        if args.start == game_version.go_in_jail_field:
+            reason = f"Feld {args.start} = \"Gehe ins Gefängnis\" ist kein Zustand der Kette"
+        else:
+            reason = f"Feld {args.start} liegt nicht auf dem Brett (0-{len(game_version.board_fields) - 1})"
+        raise ValueError(f"Ungültiges Startfeld: {reason}")
+    start = states.index((args.start, 0, False))
+    times = artifact[f"hitting_times_{args.unit}"][start]
+    return [{"field": field, "name": names.get(field, ""), f"expected_{args.unit}": time}
+            for field, time in enumerate(times)]
+
+
+def roi_rows(artifact: CachedArtifact, game_version: GermanMonopoly, args) -> list[dict]:
+    """
+        Wie roi.evaluate_investments für ein Szenario, ohne NumPy.
+        """
+    rates = landings_per_turn(artifact, len(game_version.board_fields))
+    levels = range(6) if args.level is None else (args.level,)
+    rows = []
+    for field, street in sorted(game_version.streets.items()):
+        for level in levels:
+            rent = street.rents[level] * (2 if args.full_set and level == 0 else 1)
+            investment = street.price + level * street.house_cost
+            expected_rent = rates[field] * rent
+            for opponents in args.opponents:
+                income = expected_rent * opponents
+                rows.append({"field": field, "name": street.name, "level": level, "opponents": opponents,
+                             "investment": investment, "rent": rent, "expected_rent": expected_rent,
+                             "income_per_round": income, "roi": income / investment,
+                             "break_even_rounds": investment / income if income > 0 else math.inf})
+    rows.sort(key=lambda row: row[args.sort], reverse=args.sort in ("roi", "income_per_round"))
+    return rows[:args.top]
+
+
+def simulate_rows(game_version: GermanMonopoly, args) -> list[dict]:
+    # Simulation ist nie zwischengespeichert und lädt NumPy
+    from monopoly_analysis.simulation import MonteCarloSimulator
+    from monopoly_analysis.state_codec import StateCodec
+    result = MonteCarloSimulator(game_version).run(args.players, args.steps, args.burn_in, args.seed)
+    names = field_names(game_version)
+    frequencies = result.field_frequencies(StateCodec.from_board(game_version), len(game_version.board_fields))
+    return [{"field": field, "name": names.get(field, ""), "frequency": float(frequency)}
+            for field, frequency in enumerate(frequencies)]
+
+
+def write_rows(rows: list[dict], output_format: str, stream=None) -> None:
+    stream = stream if stream is not None else sys.stdout
+    if output_format == "csv":
+        import csv
+        writer = csv.DictWriter(stream, fieldnames=list(rows[0]) if rows else [], lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+    # JSON kennt kein Infinity: unerreichbare Felder als null
+    cleaned = [{key: None if isinstance(value, float) and math.isinf(value) else value
+                for key, value in row.items()} for row in rows]
+    json.dump(cleaned, stream, ensure_ascii=False, indent=None)
+    stream.write("\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="monopoly-analysis", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--store", default=DEFAULT_STORE,
+                        help="Artefakt-Verzeichnis (Standard: $MONOPOLY_ANALYSIS_STORE oder ~/.cache/monopoly-analysis)")
+    parser.add_argument("--config", help="Regelvariante als JSON-Objekt")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=WERT",
+                        help="Einzelne Regel überschreiben (Wert als JSON), mehrfach möglich")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--no-build", action="store_true", help="Fehlendes Artefakt nicht bauen, sondern abbrechen")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stationary = commands.add_parser("stationary", help="Stationäre Verteilung je Feld")
+    stationary.add_argument("--states", action="store_true", help="Je Zustand statt je Feld")
+
+    hitting = commands.add_parser("hitting-times", help="Erwartete Zeit bis zur ersten Landung je Feld")
+    hitting.add_argument("--from", dest="start", type=int, default=0, help="Startfeld (frei, Zähler 0)")
+    hitting.add_argument("--unit", choices=("turns", "rolls"), default="turns")
+
+    roi = commands.add_parser("roi", help="Erwartete Miete, ROI und Break-Even je Straße")
+    roi.add_argument("--opponents", type=int, nargs="+", default=[3])
+    roi.add_argument("--level", type=int, choices=range(6), help="Nur diese Ausbaustufe (5 = Hotel)")
+    roi.add_argument("--full-set", action="store_true", help="Vollständige Farbgruppe (doppelte Grundmiete)")
+    roi.add_argument("--sort", choices=("roi", "income_per_round", "break_even_rounds", "field"), default="roi")
+    roi.add_argument("--top", type=int)
+
+    simulate = commands.add_parser("simulate", help="Monte-Carlo-Landehäufigkeiten je Feld")
+    simulate.add_argument("--players", type=int, default=100_000)
+    simulate.add_argument("--steps", type=int, default=100)
+    simulate.add_argument("--burn-in", type=int, default=100)
+    simulate.add_argument("--seed", type=int)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        config = parse_config(args.set, args.config)
+        game_version = GermanMonopoly(config)
+        if args.command == "simulate":
+            rows = simulate_rows(game_version, args)
+        else:
+            artifact = load_artifact(args.store, config, build=not args.no_build)
+            handlers = {"stationary": stationary_rows, "hitting-times": hitting_time_rows, "roi": roi_rows}
+            rows = handlers[args.command](artifact, game_version, args)
+    except (ValueError, TypeError, FileNotFoundError) as error:
+        print(f"Fehler: {error}", file=sys.stderr)
+        return 2
+    try:
+        write_rows(rows, args.format)
+    except BrokenPipeError:
+        # Leser wie "head" hat die Pipe geschlossen: kein Fehler
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import numpy as np
+from scipy import sparse
+from monopoly_analysis.cards import build_card_tables
+from monopoly_analysis.probabilities import Probabilities
+
+
+class DeckAwareModel:
+    """
+        Markov-Kette mit Kartengedächtnis: Karten werden der Reihe nach gezogen und unter
+        den Stapel gelegt, statt jedes Mal unabhängig mit 1/16 gezogen zu werden.
+
+        Der Zustand erweitert den Einzelspieler-Zustand um die Zeiger auf die nächste
+        Ereignis- und Gemeinschaftskarte: Index = (Basiszustand · n_chance + Ereigniszeiger)
+        · n_community + Gemeinschaftszeiger. Bei 16 Karten je Stapel sind das 120 × 16 × 16
+        = 30720 Zustände; die Übergangsmatrix wird direkt als dünnbesetzte CSR-Matrix erzeugt.
+        """
+
+    def __init__(self,
+                 probabilities: Probabilities | None = None,
+                 chance_order: np.ndarray | None = None,
+                 community_order: np.ndarray | None = None):
+        """
+            Args:
+                probabilities: Liefert Spielbrett, Würfelwahrscheinlichkeiten und Zustandskodierung
+                chance_order: Reihenfolge des Ereignisstapels als Permutation der Kartenindizes
+                    aus cards.build_card_tables (Standard: unverändert)
+                community_order: Reihenfolge des Gemeinschaftsstapels
+            """
+        self.probabilities = probabilities if probabilities is not None else Probabilities()
+        self.game_version = self.probabilities.game_version
+        self.codec = self.probabilities.codec
+        self.n_fields = len(self.probabilities.board_fields)
+        self.jail_code = self.n_fields
+
+        total_cards = self.game_version.total_cards
+        self.chance_order = np.arange(total_cards) if chance_order is None else np.asarray(chance_order)
+        self.community_order = np.arange(total_cards) if community_order is None else np.asarray(community_order)
+        self.n_chance = len(self.chance_order)
+        self.n_community = len(self.community_order)
+        self.n_states = self.codec.n_states * self.n_chance * self.n_community
+
+        # Feld je erweitertem Zustand (für Feld-Marginale und Solver)
+        self.positions = np.repeat(self.codec.positions, self.n_chance * self.n_community)
+
+    @staticmethod
+    def random_deck_orders(total_cards: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """
+            Zufällig gemischte Reihenfolgen für beide Stapel.
+            """
+        return rng.permutation(total_cards), rng.permutation(total_cards)
+
+    def _resolve_cards(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+            Endfeld und neue Kartenzeiger für jedes (Landefeld, Ereigniszeiger, Gemeinschaftszeiger).
+
+            Returns:
+                (final_field, next_chance, next_community): je n_fields × n_chance × n_community,
+                final_field = jail_code bedeutet "eingesperrt"
+            """
+        chance_table, community_table = build_card_tables(self.game_version)
+        landing = np.arange(self.n_fields)[:, None, None]
+        chance_pointer = np.arange(self.n_chance)[None, :, None]
+        community_pointer = np.arange(self.n_community)[None, None, :]
+
+        is_chance = np.isin(landing, self.game_version.chance_fields)
+        after_chance = chance_table[landing, self.chance_order[chance_pointer]]
+        # Ereigniskarte kann auf ein Gemeinschaftsfeld führen (36 → 3 zurück → 33)
+        is_community = np.isin(after_chance, self.game_version.community_fields)
+        final_field = community_table[after_chance, self.community_order[community_pointer]]
+
+        next_chance = (chance_pointer + is_chance) % self.n_chance
+        next_community = (community_pointer + is_community) % self.n_community
+        return np.broadcast_arrays(final_field, next_chance, next_community)
+
+    def _base_moves(self) -> tuple[np.ndarray, ...]:
+        """
+            Alle Würfelausgänge je Basiszustand, wie in Probabilities._get_transitions_from_*.
+
+            Returns:
+                (source, landing, new_counter, direct_target, probability): je Eintrag ein
+                Wurf. landing = -1 bedeutet, dass sich der Spieler nicht bewegt und direkt in
+                direct_target (Basisindex) wechselt (Gefängnis bleiben, dritter Pasch).
+            """
+        codec = self.codec
+        jail_field = self.probabilities.jail_field
+        max_counter = codec.n_counters - 1
+        jail_target = codec.encode(jail_field, 0, True)
+
+        dice = [(dice_sum, prob, False) for dice_sum, prob in self.probabilities.non_doubles_probabilities.items()]
+        dice += [(dice_sum, prob, True) for dice_sum, prob in self.probabilities.doubles_probabilities.items()]
+        dice = [entry for entry in dice if entry[1] > 0]
+        dice_sums = np.array([entry[0] for entry in dice])[None, :]
+        dice_probs = np.array([entry[1] for entry in dice])[None, :]
+        is_double = np.array([entry[2] for entry in dice])[None, :]
+
+        source = np.arange(codec.n_states)[:, None]
+        position = codec.positions[:, None]
+        counter = codec.counters[:, None]
+        in_jail = codec.in_jail[:, None]
+        released = counter >= self.game_version.jail_rounds - 1
+
+        third_double = ~in_jail & is_double & (counter == max_counter)
+        stays_in_jail = in_jail & ~is_double & ~released
+        moves = ~(third_double | stays_in_jail)
+
+        landing = np.where(moves, (position + dice_sums) % self.n_fields, -1)
+        new_counter = np.where(in_jail, is_double & released, np.where(is_double, counter + 1, 0))
+        direct_target = np.where(stays_in_jail, codec.encode(jail_field, np.minimum(counter + 1, max_counter), True),
+                                 jail_target)
+
+        return tuple(np.broadcast_to(array, landing.shape).ravel() for array in
+                     (source, landing, new_counter, direct_target, dice_probs))
+
+    def build(self) -> sparse.csr_matrix:
+        """
+            Erstellt die Übergangsmatrix des Kartengedächtnis-Modells direkt als CSR.
+
+            Returns:
+                sparse.csr_matrix: n_states × n_states
+            """
+        codec = self.codec
+        n_pointers = self.n_chance * self.n_community
+        jail_target = codec.encode(self.probabilities.jail_field, 0, True)
+        final_field, next_chance, next_community = self._resolve_cards()
+        source, landing, new_counter, direct_target, probability = self._base_moves()
+
+        pointers = np.arange(n_pointers)
+        chance_pointer, community_pointer = np.divmod(pointers, self.n_community)
+        moving = landing >= 0
+
+        # Bewegungen: Karten am aktuellen Zeiger bestimmen Endfeld und neue Zeiger
+        move_landing = landing[moving][:, None]
+        field = final_field[move_landing, chance_pointer, community_pointer]
+        target_pointer = (next_chance[move_landing, chance_pointer, community_pointer] * self.n_community
+                          + next_community[move_landing, chance_pointer, community_pointer])
+        safe_field = np.minimum(field, self.n_fields - 1)
+        target_base = np.where(field == self.jail_code, jail_target,
+                               codec.index_table[safe_field, new_counter[moving][:, None], 0])
+        move_rows = source[moving][:, None] * n_pointers + pointers
+        move_cols = target_base * n_pointers + target_pointer
+        move_values = np.broadcast_to(probability[moving][:, None], move_rows.shape)
+
+        # Ohne Bewegung wird keine Karte gezogen, die Zeiger bleiben stehen
+        direct_rows = source[~moving][:, None] * n_pointers + pointers
+        direct_cols = direct_target[~moving][:, None] * n_pointers + pointers
+        direct_values = np.broadcast_to(probability[~moving][:, None], direct_rows.shape)
+
+        rows = np.concatenate((move_rows.ravel(), direct_rows.ravel()))
+        cols = np.concatenate((move_cols.ravel(), direct_cols.ravel()))
+        values = np.concatenate((move_values.ravel(), direct_values.ravel()))
+        return sparse.csr_matrix((values, (rows, cols)), shape=(self.n_states, self.n_states))
+
+    def base_distribution(self, distribution: np.ndarray) -> np.ndarray:
+        """
+            Summiert eine Verteilung über die Kartenzeiger (→ 120 Basiszustände).
+            """
+        return np.asarray(distribution).reshape(self.codec.n_states, -1).sum(axis=1)
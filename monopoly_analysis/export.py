@@ -0,0 +1,303 @@
+from dataclasses import asdict
+import json
+from pathlib import Path
+from typing import Iterable, Iterator
+import numpy as np
+from monopoly_analysis.game_board import GermanMonopoly, RuleConfig
+from monopoly_analysis.probabilities import MonopolyState
+from monopoly_analysis.state_codec import StateCodec
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+# Spalten von export_sweep; config, field und state sind dictionary-kodiert
+SWEEP_SCHEMA = {
+    "config": np.uint32,
+    "turn": np.int32,  # -1 = stationäre Verteilung
+    "field": np.uint8,
+    "state": np.int16,  # -1 bei by_field=True
+    "probability": np.float64,
+}
+
+
+def _dictionary_value(value):
+    # Einheitliche JSON-Form für Dictionary-Einträge
+    if isinstance(value, RuleConfig):
+        return value.config_hash()
+    if isinstance(value, MonopolyState):
+        return [value.position, value.counter, value.in_jail]
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def _key(value) -> str:
+    return json.dumps(_dictionary_value(value))
+
+
+def field_labels(game_version: GermanMonopoly | None = None) -> list[str]:
+    game_version = game_version if game_version is not None else GermanMonopoly()
+    names = {field: street.name for field, street in game_version.streets.items()}
+    names.update(game_version.railroad_names)
+    names.update(game_version.utilities)
+    return [names.get(field, f"Feld {field}") for field in game_version.board_fields]
+
+
+def state_labels(codec: StateCodec) -> list[list]:
+    return [[int(position), int(counter), bool(in_jail)]
+            for position, counter, in_jail in zip(codec.positions, codec.counters, codec.in_jail)]
+
+
+class ColumnarWriter:
+    """
+        Schreibt Zeilen spaltenweise in Chunks (<path>/chunk-NNNNNN.npz + manifest.json).
+
+        Der Speicherbedarf ist auf einen Chunk (chunk_rows Zeilen) begrenzt, unabhängig von der
+        Gesamtgröße. Dictionary-Spalten speichern nur ganzzahlige Codes; die Werte stehen einmal
+        im Manifest. Feste Dictionaries (z.B. Felder, Zustände) werden beim Anlegen übergeben,
+        wachsende (z.B. Regelvarianten) über encode() ergänzt.
+
+        Nach jedem Chunk wird das Manifest atomar neu geschrieben: Ein abgebrochener Export
+        bleibt bis zum letzten vollständigen Chunk lesbar.
+        """
+
+    def __init__(self,
+                 path: str | Path,
+                 schema: dict[str, type | np.dtype],
+                 dictionaries: dict[str, list] | None = None,
+                 chunk_rows: int = 1 << 20,
+                 compress: bool = False,
+                 metadata: dict | None = None):
+        """
+            Args:
+                path: Zielverzeichnis (wird angelegt, darf noch keinen Export enthalten)
+                schema: Spaltenname → Datentyp (für Dictionary-Spalten der Typ der Codes)
+                dictionaries: Dictionary-Spalten mit ihren Anfangswerten (leere Liste = wachsend)
+                chunk_rows: Zeilen je Chunk
+                compress: np.savez_compressed statt np.savez
+                metadata: Beliebige JSON-Daten für das Manifest
+            """
+        self.path = Path(path)
+        if (self.path / MANIFEST).exists():
+            raise ValueError(f"{self.path} enthält bereits einen Export")
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.schema = {name: np.dtype(dtype) for name, dtype in schema.items()}
+        self.chunk_rows = chunk_rows
+        self.compress = compress
+        self.metadata = metadata if metadata is not None else {}
+        self.dictionaries = {name: [_dictionary_value(value) for value in values]
+                             for name, values in (dictionaries or {}).items()}
+        unknown = set(self.dictionaries) - set(self.schema)
+        if unknown:
+            raise ValueError(f"Dictionary für unbekannte Spalten: {sorted(unknown)}")
+        self._codes = {name: {_key(value): code for code, value in enumerate(values)}
+                       for name, values in self.dictionaries.items()}
+        self._buffer = {name: np.empty(chunk_rows, dtype=dtype) for name, dtype in self.schema.items()}
+        self._filled = 0
+        self.chunks: list[dict] = []
+        self.n_rows = 0
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def encode(self, column: str, value) -> int:
+        """
+            Code eines Dictionary-Werts; neue Werte werden angehängt.
+            """
+        codes = self._codes[column]
+        key = _key(value)
+        if key not in codes:
+            if len(codes) > np.iinfo(self.schema[column]).max:
+                raise ValueError(f"Dictionary '{column}' passt nicht mehr in {self.schema[column]}")
+            codes[key] = len(codes)
+            self.dictionaries[column].append(_dictionary_value(value))
+        return codes[key]
+
+    def append(self, **columns) -> None:
+        """
+            Hängt Zeilen an. Alle Spalten des Schemas sind anzugeben; Skalare und Arrays werden
+            gegeneinander gebroadcastet, Dictionary-Spalten erwarten Codes.
+            """
+        if set(columns) != set(self.schema):
+            raise ValueError(f"Spalten {sorted(columns)} passen nicht zum Schema {sorted(self.schema)}")
+        arrays = dict(zip(columns, (array.ravel() for array in np.broadcast_arrays(*columns.values()))))
+        n_rows = len(next(iter(arrays.values())))
+        start = 0
+        while start < n_rows:
+            count = min(n_rows - start, self.chunk_rows - self._filled)
+            for name, array in arrays.items():
+                self._buffer[name][self._filled:self._filled + count] = array[start:start + count]
+            self._filled += count
+            start += count
+            if self._filled == self.chunk_rows:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self._filled:
+            return
+        columns = {name: buffer[:self._filled] for name, buffer in self._buffer.items()}
+        name = f"chunk-{len(self.chunks):06d}.npz"
+        temporary = self.path / f".{name}"
+        with open(temporary, "wb") as file:
+            (np.savez_compressed if self.compress else np.savez)(file, **columns)
+        temporary.replace(self.path / name)
+        # Min/Max je Spalte, damit der Leser ganze Chunks überspringen kann
+        self.chunks.append({"file": name, "rows": self._filled,
+                            "min": {column: values.min().item() for column, values in columns.items()},
+                            "max": {column: values.max().item() for column, values in columns.items()}})
+        self.n_rows += self._filled
+        self._filled = 0
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "columns": {name: dtype.str for name, dtype in self.schema.items()},
+            "dictionaries": self.dictionaries,
+            "metadata": self.metadata,
+            "rows": self.n_rows,
+            "chunks": self.chunks,
+        }
+        temporary = self.path / f".{MANIFEST}"
+        temporary.write_text(json.dumps(manifest), encoding="utf-8")
+        temporary.replace(self.path / MANIFEST)
+
+    def close(self) -> None:
+        self.flush()
+        self._write_manifest()
+
+
+class ColumnarReader:
+    """
+        Liest einen Export von ColumnarWriter lazy: nur die angefragten Spalten und nur Chunks,
+        deren Min/Max zu den Filtern passt, werden geladen.
+        """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        manifest = json.loads((self.path / MANIFEST).read_text(encoding="utf-8"))
+        if manifest["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"Exportformat {manifest['format_version']} in {self.path} wird nicht unterstützt")
+        self.columns = {name: np.dtype(dtype) for name, dtype in manifest["columns"].items()}
+        self.dictionaries = manifest["dictionaries"]
+        self.metadata = manifest["metadata"]
+        self.n_rows = manifest["rows"]
+        self.chunks = manifest["chunks"]
+        self._codes = {name: {json.dumps(value): code for code, value in enumerate(values)}
+                       for name, values in self.dictionaries.items()}
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def decode(self, column: str, codes: np.ndarray) -> list:
+        # Negative Codes stehen für "nicht belegt"
+        values = self.dictionaries[column]
+        return [values[code] if code >= 0 else None for code in np.asarray(codes).tolist()]
+
+    def _filter_codes(self, column: str, values) -> np.ndarray:
+        # Filterwerte → gespeicherte Werte; bei Dictionary-Spalten sind ganze Zahlen Codes
+        values = values if isinstance(values, (list, set, np.ndarray, range)) else [values]
+        if column not in self.dictionaries:
+            return np.asarray(list(values))
+        codes = []
+        for value in values:
+            if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+                codes.append(int(value))
+            elif _key(value) in self._codes[column]:
+                codes.append(self._codes[column][_key(value)])
+        return np.asarray(codes, dtype=np.int64)
+
+    def iter_chunks(self, columns: list[str] | None = None, **filters) -> Iterator[dict[str, np.ndarray]]:
+        """
+            Liefert je Chunk die gefilterten Zeilen als {Spalte: Array}.
+
+            Args:
+                columns: Zu ladende Spalten (Standard: alle)
+                **filters: Spalte → Wert oder Liste von Werten, z.B. config=RuleConfig(...),
+                    field=39, turn=range(10), state=MonopolyState(10, 0, True)
+            """
+        columns = list(columns) if columns is not None else list(self.columns)
+        unknown = (set(columns) | set(filters)) - set(self.columns)
+        if unknown:
+            raise ValueError(f"Unbekannte Spalten: {sorted(unknown)}")
+        wanted = {column: self._filter_codes(column, values) for column, values in filters.items()}
+
+        for chunk in self.chunks:
+            if any(not len(codes) or not ((codes >= chunk["min"][column]) & (codes <= chunk["max"][column])).any()
+                   for column, codes in wanted.items()):
+                continue
+            with np.load(self.path / chunk["file"]) as stored:
+                mask = None
+                for column, codes in wanted.items():
+                    selected = np.isin(stored[column], codes)
+                    mask = selected if mask is None else mask & selected
+                if mask is not None and not mask.any():
+                    continue
+                yield {column: stored[column] if mask is None else stored[column][mask] for column in columns}
+
+    def read(self, columns: list[str] | None = None, **filters) -> dict[str, np.ndarray]:
+        """
+            Wie iter_chunks, aber zu einem Array je Spalte zusammengefügt.
+            """
+        columns = list(columns) if columns is not None else list(self.columns)
+        parts = list(self.iter_chunks(columns, **filters))
+        return {column: (np.concatenate([part[column] for part in parts]) if parts
+                         else np.empty(0, dtype=self.columns[column]))
+                for column in columns}
+
+
+def export_sweep(configs: Iterable[RuleConfig],
+                 path: str | Path,
+                 n_turns: int = 0,
+                 by_field: bool = True,
+                 n_workers: int = 1,
+                 chunk_rows: int = 1 << 20,
+                 compress: bool = False) -> ColumnarReader:
+    """
+        Exportiert stationäre und (optional) transiente Verteilungen eines Sweeps als Stream.
+
+        Je Regelvariante: Zeilen mit turn = -1 für die stationäre Verteilung, dann Zug
+        1..n_turns ab Los (TransientAnalysis.stream). Es liegt immer nur eine Variante und ein
+        Verteilungsvektor im Speicher, dazu höchstens ein Chunk.
+
+        Args:
+            configs: Regelvarianten, auch als Generator
+            path: Zielverzeichnis
+            n_turns: Anzahl transienter Züge je Variante
+            by_field: True = je Feld, False = je Zustand (dann ist auch state belegt)
+            n_workers: Prozesse für den Aufbau (siehe sweep.iter_sweep)
+            chunk_rows: Zeilen je Chunk
+            compress: Komprimierte Chunks
+
+        Returns:
+            ColumnarReader auf den fertigen Export
+        """
+    from monopoly_analysis.sweep import iter_sweep
+    from monopoly_analysis.transient import TransientAnalysis
+
+    codec = StateCodec()
+    dictionaries = {"config": [], "field": field_labels(), "state": state_labels(codec)}
+    configs_meta = {}
+    with ColumnarWriter(path, SWEEP_SCHEMA, dictionaries, chunk_rows, compress,
+                        metadata={"configs": configs_meta, "by_field": by_field}) as writer:
+        for point in iter_sweep(configs, n_workers):
+            config_code = writer.encode("config", point.config)
+            configs_meta[point.config.config_hash()] = asdict(point.config)
+            point_codec = StateCodec.from_board(GermanMonopoly(point.config))
+            if by_field:
+                fields, states = np.arange(point_codec.n_fields), -1
+            else:
+                fields, states = point_codec.positions, np.arange(point_codec.n_states)
+
+            def write(turn: int, distribution: np.ndarray) -> None:
+                writer.append(config=config_code, turn=turn, field=fields, state=states, probability=distribution)
+
+            write(-1, point.field_probabilities if by_field else point.distribution)
+            if n_turns:
+                transient = TransientAnalysis(point.transition_matrix, point_codec)
+                for turn, distribution in enumerate(transient.stream(n_turns, by_field=by_field), start=1):
+                    write(turn, distribution)
+    return ColumnarReader(path)
@@ -0,0 +1,611 @@
+from dataclasses import dataclass, field
+from itertools import combinations
+import numpy as np
+from monopoly_analysis import game_board
+from monopoly_analysis.simulation import MonteCarloSimulator
+
+BANK = -1
+
+# Feldarten
+NONE, STREET, RAILROAD, UTILITY = 0, 1, 2, 3
+
+
+class Strategy:
+    """
+        Basisklasse für Spielstrategien. Alle Methoden arbeiten vektorisiert: Jedes Argument
+        ist ein Array mit einem Eintrag je anstehender Entscheidung (eine Partie, ein Spieler),
+        das Ergebnis ist ein bool-Array gleicher Länge.
+        """
+    name = "Strategie"
+
+    def wants_to_buy(self, field: np.ndarray, price: np.ndarray, cash: np.ndarray, round_: np.ndarray) -> np.ndarray:
+        return cash >= price
+
+    def pays_jail_fine(self, jail_round: np.ndarray, cash: np.ndarray, round_: np.ndarray) -> np.ndarray:
+        return np.zeros(len(cash), dtype=bool)
+
+    def wants_to_build(self, group: int, house_cost: int, cash: np.ndarray, round_: np.ndarray) -> np.ndarray:
+        return cash >= house_cost
+
+    def wants_to_trade(self, field: np.ndarray, offer: np.ndarray, cash: np.ndarray, round_: np.ndarray) -> np.ndarray:
+        # Kauft das letzte fehlende Feld einer Farbgruppe einem Mitspieler ab
+        return cash >= offer
+
+    def accepts_trade(self, field: np.ndarray, offer: np.ndarray, cash: np.ndarray, round_: np.ndarray) -> np.ndarray:
+        # Verkauft ein Feld, das dem Käufer eine Farbgruppe vervollständigt
+        return np.ones(len(cash), dtype=bool)
+
+
+@dataclass(frozen=True)
+class ThresholdStrategy(Strategy):
+    """
+        Parametrisierte Strategie mit Bargeld-Reserven.
+
+        Gekauft wird, wenn nach dem Kauf noch cash_reserve übrig bleibt (nur die Farbgruppen
+        in groups, None = alle). Gebaut wird bis max_level, solange build_reserve übrig
+        bleibt. Bis zur Runde pay_jail_until wird das Gefängnis sofort bezahlt. Fehlende
+        Gruppenfelder werden zugekauft, solange cash_reserve übrig bleibt; eigene Felder
+        werden nur bei sells_sets an Mitspieler abgegeben.
+        """
+    name: str = "Schwellenwert"
+    cash_reserve: int = 0
+    groups: tuple[str, ...] | None = None
+    buy_railroads: bool = True
+    buy_utilities: bool = True
+    build_reserve: int = 0
+    max_level: int = 5
+    pay_jail_until: int = 0
+    sells_sets: bool = True
+
+    buyable: np.ndarray = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self):
+        # Kaufbare Felder als Maske über alle Felder
+        board = game_board.GermanMonopoly()
+        buyable = np.zeros(len(board.board_fields), dtype=bool)
+        for board_field, street in board.streets.items():
+            buyable[board_field] = self.groups is None or street.color_group in self.groups
+        buyable[list(board.railroad_names)] = self.buy_railroads
+        buyable[list(board.utilities)] = self.buy_utilities
+        object.__setattr__(self, "buyable", buyable)
+
+    def wants_to_buy(self, field, price, cash, round_):
+        return (cash - price >= self.cash_reserve) & self.buyable[field]
+
+    def pays_jail_fine(self, jail_round, cash, round_):
+        return round_ < self.pay_jail_until
+
+    def wants_to_build(self, group, house_cost, cash, round_):
+        return cash - house_cost >= self.build_reserve
+
+    def wants_to_trade(self, field, offer, cash, round_):
+        return (cash - offer >= self.cash_reserve) & self.buyable[field]
+
+    def accepts_trade(self, field, offer, cash, round_):
+        return np.full(len(cash), self.sells_sets)
+
+
+STRATEGIES = (
+    ThresholdStrategy("Käufer"),
+    ThresholdStrategy("Vorsichtig", cash_reserve=300, build_reserve=300),
+    ThresholdStrategy("Orange-Rot", groups=("orange", "rot"), buy_utilities=False, pay_jail_until=15),
+    ThresholdStrategy("Sammler", max_level=0, pay_jail_until=1000),
+)
+
+
+@dataclass(frozen=True)
+class GameResult:
+    strategy_names: list[str]
+    seat_strategies: np.ndarray  # Partie × Sitz → Index in strategy_names
+    winner: np.ndarray  # Sitz des Gewinners je Partie
+    rounds: np.ndarray  # Gespielte Runden je Partie
+    capped: np.ndarray  # True = Rundenlimit erreicht, Gewinner nach Vermögen
+    cash: np.ndarray  # Bargeld am Ende, Partie × Sitz
+    net_worth: np.ndarray  # Vermögen am Ende (Bargeld + Kaufpreise + Häuser), Partie × Sitz
+
+    @property
+    def n_games(self) -> int:
+        return len(self.winner)
+
+    @property
+    def winner_strategy(self) -> np.ndarray:
+        return self.seat_strategies[np.arange(self.n_games), self.winner]
+
+    @property
+    def n_finished(self) -> int:
+        # Partien, die durch Bankrott bis auf einen Spieler entschieden wurden
+        return int((~self.capped).sum())
+
+    @property
+    def n_capped(self) -> int:
+        return int(self.capped.sum())
+
+    def win_rates(self, which: str = "all") -> dict[str, float]:
+        """
+            Anteil der Partien, die eine Strategie gewinnt (über alle ihre Sitze).
+
+            Args:
+                which: "all", "finished" (nur zu Ende gespielte Partien) oder "capped"
+                    (nur am Rundenlimit nach Vermögen entschiedene Partien)
+
+            Returns:
+                dict: Strategie → Siegquote; NaN, wenn keine Partie der Auswahl existiert
+            """
+        masks = {"all": np.ones(self.n_games, dtype=bool), "finished": ~self.capped, "capped": self.capped}
+        if which not in masks:
+            raise ValueError(f"Unbekannte Auswahl '{which}', erlaubt: {sorted(masks)}")
+        selected = masks[which]
+        wins = np.bincount(self.winner_strategy[selected], minlength=len(self.strategy_names))
+        with np.errstate(invalid="ignore"):
+            return dict(zip(self.strategy_names, wins / selected.sum()))
+
+
+@dataclass(frozen=True)
+class MatchupTable:
+    strategy_names: list[str]
+    win_rates: np.ndarray  # Zeile gegen Spalte: Anteil der Siege der Zeilenstrategie (Diagonale NaN)
+    finished_win_rates: np.ndarray  # Wie win_rates, nur über zu Ende gespielte Partien
+    capped_share: np.ndarray  # Anteil der Partien je Paarung, die das Rundenlimit erreichen
+    n_games: int  # Partien je Paarung
+
+
+class GameSimulator:
+    """
+        Vollständige Partien mit Geld, Besitz, Häusern und Bankrott für viele Partien parallel.
+
+        Der Zustand liegt als Struct-of-Arrays vor (GameState). Jede Iteration führt in allen
+        laufenden Partien einen Wurf des aktuellen Spielers aus. Würfel und Karten kommen aus
+        derselben Nachschlagetabelle wie MonteCarloSimulator, die Bewegung entspricht also der
+        Markov-Kette aus Probabilities.
+
+        Vereinfachungen: Nur positionsändernde Karten (wie Probabilities), keine Hypotheken
+        während des Spiels. Gehandelt wird nur das letzte fehlende Feld einer Farbgruppe
+        gegen trade_premium × Kaufpreis (Strategie.wants_to_trade / accepts_trade). Bei
+        negativem Bargeld werden Häuser und dann Straßen zum halben Preis an die Bank
+        verkauft; reicht das nicht, scheidet der Spieler aus, sein Besitz fällt an die Bank
+        und der Gläubiger erhält nur den gedeckten Teil.
+
+        Note:
+            Ohne Handel entstehen selten vollständige Farbgruppen: Mit den Standardstrategien
+            erreichen dann rund zwei Drittel der Vierer-Partien das Rundenlimit, auch bei
+            mehreren tausend Runden. Mit Handel enden über 99 % der Partien durch Bankrott
+            (Median rund 50 Runden). Abgebrochene Partien entscheidet das Vermögen;
+            GameResult und MatchupTable weisen sie getrennt aus.
+        """
+
+    def __init__(self,
+                 rules: game_board.RuleConfig | None = None,
+                 starting_cash: int = 1500,
+                 trade_premium: float | None = 2.0):
+        """
+            Args:
+                rules: Regelvariante (Standard: RuleConfig())
+                starting_cash: Startkapital je Spieler
+                trade_premium: Angebot für das letzte fehlende Feld einer Farbgruppe als
+                    Vielfaches des Kaufpreises; None = kein Handel
+            """
+        self.game_version = game_board.GermanMonopoly(rules)
+        self.starting_cash = starting_cash
+        self.trade_premium = trade_premium
+        self.mover = MonteCarloSimulator(self.game_version)
+        self.n_fields = len(self.game_version.board_fields)
+        self.jail_field = self.game_version.jail_field
+        self.jail_code = self.mover.jail_code
+        self.last_jail_round = self.game_version.jail_rounds - 1
+        self.dice_sum_table = (self.mover.offset_table // self.mover.n_card_pairs).astype(np.int64)
+        self.passes_table = self._create_passes_table()
+        self._create_field_tables()
+
+    def _create_passes_table(self) -> np.ndarray:
+        """
+            Parallel zu resolve_table: Rückt eine Karte dabei über Los vor?
+
+            Note:
+                "Rücke vor"-Karten (feste Ziele, nächster Bahnhof) überqueren Los, wenn das
+                Ziel vor dem Kartenfeld liegt; "3 Felder zurück" und Gefängnis nie.
+            """
+        mover = self.mover
+        total_cards = self.game_version.total_cards
+        n_advance = len(self.game_version.chance_card_fixed_targets) + self.game_version.chance_next_railroad
+        raw_landing = (np.arange(self.n_fields + 12) % self.n_fields)[:, None]
+        chance_cards, community_cards = np.divmod(np.arange(mover.n_card_pairs), total_cards)
+        after_chance = mover.chance_table[raw_landing, chance_cards[None, :]]
+        final = mover.community_table[after_chance, community_cards[None, :]]
+        chance_passes = (chance_cards[None, :] < n_advance) & (after_chance < raw_landing)
+        return (chance_passes | (final < after_chance)).ravel()
+
+    def _create_field_tables(self) -> None:
+        board = self.game_version
+        n_fields = self.n_fields
+        self.kind = np.zeros(n_fields, dtype=np.int8)
+        self.price = np.zeros(n_fields, dtype=np.int64)
+        self.house_cost = np.zeros(n_fields, dtype=np.int64)
+        self.rent_table = np.zeros((n_fields, 6), dtype=np.int64)
+        self.tax = np.zeros(n_fields, dtype=np.int64)
+        self.group = np.full(n_fields, -1)
+
+        self.group_names = list(dict.fromkeys(street.color_group for street in board.streets.values()))
+        for field, street in board.streets.items():
+            self.kind[field] = STREET
+            self.price[field] = street.price
+            self.house_cost[field] = street.house_cost
+            self.rent_table[field] = street.rents
+            self.group[field] = self.group_names.index(street.color_group)
+        self.railroads = np.array(sorted(board.railroad_names))
+        self.kind[self.railroads] = RAILROAD
+        self.price[self.railroads] = board.railroad_price
+        self.utilities = np.array(sorted(board.utilities))
+        self.kind[self.utilities] = UTILITY
+        self.price[self.utilities] = board.utility_price
+        for field, amount in board.tax_fields.items():
+            self.tax[field] = amount
+
+        # Mitglieder je Farbgruppe, aufgefüllt mit dem ersten Mitglied (ändert .all() nicht)
+        members = [np.flatnonzero(self.group == index) for index in range(len(self.group_names))]
+        width = max(map(len, members))
+        self.group_members = np.array([np.pad(fields, (0, width - len(fields)), mode="edge") for fields in members])
+        self.group_sizes = np.array([len(fields) for fields in members])
+        self.group_house_cost = self.house_cost[self.group_members[:, 0]]
+        self.group_fields = np.flatnonzero(self.group >= 0)
+        self.group_bits = 1 << np.arange(len(members), dtype=np.int64)
+        self.railroad_rents = np.array((0, *board.railroad_rents))
+        self.utility_multipliers = np.array((0, *board.utility_multipliers))
+
+    def run(self,
+            lineup: list[Strategy],
+            n_games: int,
+            max_rounds: int = 300,
+            seed: int | np.random.SeedSequence | None = None,
+            rotate_seats: bool = True) -> GameResult:
+        """
+            Spielt n_games Partien mit der gegebenen Sitzordnung.
+
+            Args:
+                lineup: Eine Strategie je Sitz (2-8 Spieler)
+                n_games: Anzahl Partien (eine Zeile je Partie)
+                max_rounds: Rundenlimit; danach gewinnt das größte Vermögen
+                seed: Startwert für np.random.default_rng
+                rotate_seats: Sitzordnung je Partie zyklisch verschieben, damit der
+                    Vorteil des ersten Spielers alle Strategien gleich trifft
+
+            Returns:
+                GameResult
+            """
+        rng = np.random.default_rng(seed)
+        strategies = list(dict.fromkeys(lineup))
+        n_players = len(lineup)
+        lineup_index = np.array([strategies.index(strategy) for strategy in lineup])
+        shift = np.arange(n_games) % n_players if rotate_seats else np.zeros(n_games, dtype=int)
+        seat_strategies = lineup_index[(np.arange(n_players)[None, :] + shift[:, None]) % n_players]
+
+        state = GameState.start(n_games, n_players, self.n_fields, self.starting_cash)
+        seat_strategy = seat_strategies.ravel()
+        max_turns = max_rounds * n_players
+        active = np.arange(n_games)
+        while len(active):
+            finished = self._roll(state, active, strategies, seat_strategy, rng, max_turns)
+            active = active[~finished]
+
+        cash = state.cash.reshape(n_games, n_players)
+        alive = state.alive.reshape(n_games, n_players)
+        net_worth = cash + self._property_values(state)
+        capped = alive.sum(axis=1) > 1
+        winner = np.where(capped, np.where(alive, net_worth, np.iinfo(np.int64).min).argmax(axis=1),
+                          alive.argmax(axis=1))
+        return GameResult([strategy.name for strategy in strategies], seat_strategies, winner,
+                          -(-state.turns // n_players), capped, cash, net_worth)
+
+    def _decide(self, strategies, strategy, mask, method, *args) -> np.ndarray:
+        # Ruft die Strategie-Methode je Strategie auf ihrer Teilmenge auf
+        decision = np.zeros(len(mask), dtype=bool)
+        for index, candidate in enumerate(strategies):
+            selected = mask & (strategy == index)
+            if selected.any():
+                decision[selected] = getattr(candidate, method)(*(arg[selected] for arg in args))
+        return decision
+
+    def _roll(self, state, games, strategies, seat_strategy, rng, max_turns) -> np.ndarray:
+        """
+            Ein Wurf des aktuellen Spielers in jeder Partie aus games.
+
+            Returns:
+                np.ndarray: bool je Partie, True = Partie beendet
+            """
+        mover = self.mover
+        n_players, n_fields = state.n_players, self.n_fields
+        player = state.current[games]
+        seat = games * n_players + player
+        strategy = seat_strategy[seat]
+        round_ = state.turns[games] // n_players
+        draws = rng.integers(0, mover.n_draws, size=len(games), dtype=mover.draw_dtype)
+        is_double = mover.double_table[draws]
+        dice_sum = self.dice_sum_table[draws]
+        position = state.position[seat]
+        cash = state.cash[seat]
+
+        # Gefängnis: Strategie entscheidet über sofortiges Bezahlen
+        jailed = state.in_jail[seat]
+        rounds_in_jail = state.jail_round[seat]
+        pays = np.zeros(len(games), dtype=bool)
+        if jailed.any():
+            pays = self._decide(strategies, strategy, jailed, "pays_jail_fine", rounds_in_jail, cash, round_)
+        last_round = rounds_in_jail >= self.last_jail_round
+        forced = jailed & ~pays & ~is_double & last_round
+        cash -= self.game_version.jail_fine * (pays | forced)
+        stays = jailed & ~pays & ~is_double & ~forced
+        third_double = ~jailed & is_double & (state.doubles[seat] == 2)
+        moves = ~(stays | third_double)
+
+        # Zielfeld inkl. Karten, Gehalt über Los
+        index = position * mover.n_card_pairs + mover.offset_table[draws]
+        resolved = mover.resolve_table[index].astype(np.int64)
+        to_jail = third_double | (moves & (resolved == self.jail_code))
+        passes_go = moves & ((position + dice_sum >= n_fields) | self.passes_table[index])
+        cash += self.game_version.salary * passes_go
+        landed = moves & ~to_jail
+        field = np.where(landed, resolved, np.where(moves | stays | third_double, self.jail_field, position))
+        cell = games * n_fields + field
+        field_owner = state.owner[cell]
+
+        # Kaufen
+        purchasable = landed & (self.kind[field] != NONE) & (field_owner == BANK)
+        if purchasable.any():
+            price = self.price[field]
+            buys = self._decide(strategies, strategy, purchasable, "wants_to_buy", field, price, cash, round_)
+            buys &= cash >= price
+            state.owner[cell[buys]] = player[buys]
+            cash -= price * buys
+            self._update_monopolies(state, games[buys])
+
+        # Miete und Steuern
+        pays_rent = np.flatnonzero(landed & (field_owner != BANK) & (field_owner != player))
+        rent = self._rent(state, games[pays_rent], field[pays_rent], field_owner[pays_rent], dice_sum[pays_rent])
+        cash[pays_rent] -= rent
+        cash -= self.tax[field] * landed
+        state.cash[seat] = cash
+        creditor_seat = games[pays_rent] * n_players + field_owner[pays_rent]
+        np.add.at(state.cash, creditor_seat, rent)
+
+        # Zahlungsunfähigkeit: verkaufen, sonst ausscheiden
+        broke = np.flatnonzero(cash < 0)
+        if len(broke):
+            shortfall = self._liquidate(state, games[broke], player[broke])
+            owes_rent = np.isin(broke, pays_rent)
+            uncovered = np.minimum(shortfall[owes_rent], rent[np.isin(pays_rent, broke)])
+            np.add.at(state.cash, creditor_seat[np.isin(pays_rent, broke)], -uncovered)
+
+        # Neuer Spielerzustand
+        alive = state.alive[seat]
+        state.position[seat] = field
+        state.in_jail[seat] = (stays | to_jail) & alive
+        state.jail_round[seat] = np.where(stays, rounds_in_jail + 1, 0)
+        # Pasch: weiterwürfeln, aus dem Gefängnis nur nach Bezahlen oder in der letzten Runde
+        again = landed & is_double & (~jailed | pays | last_round) & alive
+        state.doubles[seat] = np.where(again, state.doubles[seat] + 1, 0)
+
+        if self.trade_premium is not None:
+            # Handel vor dem Bauen: fehlendes Gruppenfeld einem Mitspieler abkaufen
+            traders = np.flatnonzero(alive & (state.trade_groups[seat] != 0))
+            if len(traders):
+                self._trade(state, strategies, seat_strategy, strategy[traders], games[traders],
+                            player[traders], round_[traders])
+
+        builders = np.flatnonzero(alive & (state.monopolies[seat] != 0))
+        if len(builders):
+            self._build(state, strategies, strategy[builders], games[builders], player[builders], round_[builders])
+
+        # Nächster lebender Spieler, sofern kein Pasch
+        next_player = player.copy()
+        searching = ~again
+        for offset in range(1, n_players):
+            candidate = (player + offset) % n_players
+            found = searching & state.alive[games * n_players + candidate]
+            next_player[found] = candidate[found]
+            searching &= ~found
+        state.current[games] = next_player
+        state.turns[games] += ~again
+        return (state.n_alive[games] <= 1) | (state.turns[games] >= max_turns)
+
+    def _update_monopolies(self, state, games: np.ndarray) -> None:
+        """
+            Berechnet nach einem Besitzwechsel für alle Spieler der Partien die Bitmasken
+            der vollständigen Farbgruppen und der Gruppen, denen genau ein Feld fehlt, das
+            einem Mitspieler gehört (Handelskandidaten).
+            """
+        if not len(games):
+            return
+        n_players, n_groups = state.n_players, len(self.group_sizes)
+        owner = state.owner.reshape(state.n_games, self.n_fields)[games][:, self.group_fields]
+        row, column = np.nonzero(owner != BANK)
+        # Besitzzählung je (Partie, Spieler, Gruppe)
+        index = (row * n_players + owner[row, column]) * n_groups + self.group[self.group_fields[column]]
+        mine = np.bincount(index, minlength=len(games) * n_players * n_groups).reshape(-1, n_players, n_groups)
+        tradeable = (mine == self.group_sizes - 1) & (mine.sum(axis=1, keepdims=True) == self.group_sizes)
+        seats = (games[:, None] * n_players + np.arange(n_players)[None, :]).ravel()
+        state.monopolies[seats] = ((mine == self.group_sizes) @ self.group_bits).ravel()
+        state.trade_groups[seats] = (tradeable @ self.group_bits).ravel()
+
+    def _rent(self, state, games, field, field_owner, dice_sum) -> np.ndarray:
+        kind = self.kind[field]
+        level = state.houses[games * self.n_fields + field]
+        rent = self.rent_table[field, level]
+
+        # Unbebaute Straße einer vollständigen Farbgruppe: doppelte Miete
+        owner_seat = games * state.n_players + field_owner
+        full_group = (state.monopolies[owner_seat] & self.group_bits[np.maximum(self.group[field], 0)]) != 0
+        rent = np.where((kind == STREET) & (level == 0) & full_group, 2 * rent, rent)
+
+        special = np.flatnonzero(kind >= RAILROAD)
+        if len(special):
+            owners = field_owner[special, None]
+            rows = games[special, None] * self.n_fields
+            railroads = (state.owner[rows + self.railroads] == owners).sum(axis=1)
+            utilities = (state.owner[rows + self.utilities] == owners).sum(axis=1)
+            rent[special] = np.where(kind[special] == RAILROAD, self.railroad_rents[railroads],
+                                     self.utility_multipliers[utilities] * dice_sum[special])
+        return rent
+
+    def _liquidate(self, state, games, players) -> np.ndarray:
+        """
+            Verkauft Häuser, dann Grundstücke zum halben Preis, bis das Bargeld wieder ≥ 0 ist.
+
+            Returns:
+                np.ndarray: Nicht gedeckter Betrag je Spieler (0, wenn der Verkauf reicht);
+                ungedeckte Spieler scheiden aus
+            """
+        cells = games[:, None] * self.n_fields + np.arange(self.n_fields)[None, :]
+        seats = games * state.n_players + players
+        owned = state.owner[cells] == players[:, None]
+        house_value = state.houses[cells] * self.house_cost // 2 * owned
+        property_value = self.price // 2 * owned
+        # Erst alle Häuser, dann Grundstücke, jeweils die kleinsten Posten zuerst
+        values = np.concatenate((house_value, property_value), axis=1)
+        priority = np.concatenate((house_value, property_value + values.max() + 1), axis=1)
+        priority = np.where(values > 0, priority, np.iinfo(np.int64).max)
+        order = priority.argsort(axis=1)
+        raised = np.take_along_axis(values, order, axis=1).cumsum(axis=1)
+        deficit = -state.cash[seats]
+        # Anzahl verkaufter Posten: bis einschließlich des ersten, der den Fehlbetrag deckt
+        n_sold = (raised < deficit[:, None]).sum(axis=1) + 1
+        sold = np.zeros(values.shape, dtype=bool)
+        np.put_along_axis(sold, order, np.arange(values.shape[1])[None, :] < n_sold[:, None], axis=1)
+        sold &= values > 0
+
+        state.cash[seats] += (values * sold).sum(axis=1)
+        state.houses[cells[sold[:, :self.n_fields]]] = 0
+        state.owner[cells[sold[:, self.n_fields:]]] = BANK
+        self._update_monopolies(state, games)
+
+        shortfall = np.maximum(0, -state.cash[seats])
+        bankrupt = shortfall > 0
+        state.alive[seats[bankrupt]] = False
+        state.cash[seats[bankrupt]] = 0
+        np.subtract.at(state.n_alive, games[bankrupt], 1)
+        return shortfall
+
+    def _build(self, state, strategies, strategy, games, players, round_) -> None:
+        """
+            Baut je vollständiger Farbgruppe höchstens ein Haus, gleichmäßig auf das
+            niedrigste Feld der Gruppe.
+            """
+        seats = games * state.n_players + players
+        monopolies = state.monopolies[seats]
+        max_level = np.array([getattr(candidate, "max_level", 5) for candidate in strategies])
+        for group, house_cost in enumerate(self.group_house_cost):
+            selected = np.flatnonzero(monopolies & self.group_bits[group])
+            if not len(selected):
+                continue
+            members = self.group_members[group, :self.group_sizes[group]]
+            cells = games[selected, None] * self.n_fields + members[None, :]
+            level = state.houses[cells]
+            lowest = level.argmin(axis=1)
+            cash = state.cash[seats[selected]]
+            wants = np.zeros(len(selected), dtype=bool)
+            for index, candidate in enumerate(strategies):
+                mask = strategy[selected] == index
+                if mask.any():
+                    wants[mask] = candidate.wants_to_build(group, house_cost, cash[mask], round_[selected][mask])
+            wants &= (cash >= house_cost) & (level[np.arange(len(selected)), lowest] < max_level[strategy[selected]])
+            state.houses[cells[wants, lowest[wants]]] += 1
+            state.cash[seats[selected][wants]] -= house_cost
+
+    def _trade(self, state, strategies, seat_strategy, strategy, games, players, round_) -> None:
+        """
+            Fehlt dem Spieler genau ein Feld einer Farbgruppe und gehört es einem Mitspieler,
+            bietet er trade_premium × Kaufpreis dafür (höchstens ein Handel je Zug).
+            """
+        buyer_seat = games * state.n_players + players
+        group = ((state.trade_groups[buyer_seat, None] & self.group_bits[None, :]) != 0).argmax(axis=1)
+        members = self.group_members[group]
+        owners = state.owner[games[:, None] * self.n_fields + members]
+        field = members[np.arange(len(games)), (owners != players[:, None]).argmax(axis=1)]
+        cell = games * self.n_fields + field
+        seller_seat = games * state.n_players + state.owner[cell]
+        offer = (self.price[field] * self.trade_premium).astype(np.int64)
+        cash = state.cash[buyer_seat]
+
+        everyone = np.ones(len(games), dtype=bool)
+        agreed = self._decide(strategies, strategy, everyone, "wants_to_trade", field, offer, cash, round_)
+        agreed &= self._decide(strategies, seat_strategy[seller_seat], everyone, "accepts_trade",
+                               field, offer, state.cash[seller_seat], round_)
+        agreed &= cash >= offer
+
+        state.owner[cell[agreed]] = players[agreed]
+        state.cash[buyer_seat[agreed]] -= offer[agreed]
+        state.cash[seller_seat[agreed]] += offer[agreed]
+        self._update_monopolies(state, games[agreed])
+
+    def _property_values(self, state) -> np.ndarray:
+        owner = state.owner.reshape(state.n_games, self.n_fields)
+        houses = state.houses.reshape(state.n_games, self.n_fields)
+        worth = self.price[None, :] + houses * self.house_cost[None, :]
+        return np.stack([(worth * (owner == player)).sum(axis=1) for player in range(state.n_players)], axis=1)
+
+    def matchups(self,
+                 strategies: tuple[Strategy, ...] = STRATEGIES,
+                 n_games: int = 1000,
+                 n_players: int = 4,
+                 max_rounds: int = 300,
+                 seed: int | None = None) -> MatchupTable:
+        """
+            Siegquote jeder Strategie gegen jede andere bei abwechselnder Sitzordnung (A, B, A, B, ...).
+
+            Returns:
+                MatchupTable: win_rates[a, b] = Anteil der Partien, die a gegen b gewinnt,
+                finished_win_rates[a, b] dasselbe nur über zu Ende gespielte Partien
+            """
+        table = np.full((len(strategies), len(strategies)), np.nan)
+        finished_table = table.copy()
+        capped_share = table.copy()
+        pairs = list(combinations(range(len(strategies)), 2))
+        for (first, second), pair_seed in zip(pairs, np.random.SeedSequence(seed).spawn(len(pairs))):
+            lineup = [strategies[(first, second)[seat % 2]] for seat in range(n_players)]
+            result = self.run(lineup, n_games, max_rounds, pair_seed)
+            share = result.win_rates()[strategies[first].name]
+            table[first, second], table[second, first] = share, 1 - share
+            share = result.win_rates("finished")[strategies[first].name]
+            finished_table[first, second], finished_table[second, first] = share, 1 - share
+            capped_share[first, second] = capped_share[second, first] = result.n_capped / n_games
+        return MatchupTable([strategy.name for strategy in strategies], table, finished_table, capped_share, n_games)
+
+
+@dataclass
+class GameState:
+    """
+        Struct-of-Arrays aller Partien. Spielerfelder sind flach nach Sitz indiziert
+        (Partie · n_players + Spieler), Felddaten nach Zelle (Partie · n_fields + Feld).
+        """
+    n_games: int
+    n_players: int
+    position: np.ndarray
+    doubles: np.ndarray
+    in_jail: np.ndarray
+    jail_round: np.ndarray
+    cash: np.ndarray
+    alive: np.ndarray
+    monopolies: np.ndarray  # Bitmaske der vollständigen Farbgruppen je Sitz
+    trade_groups: np.ndarray  # Bitmaske der Gruppen, denen genau ein Feld eines Mitspielers fehlt
+    owner: np.ndarray  # Sitz-interner Spielerindex oder BANK
+    houses: np.ndarray  # 0-4 Häuser, 5 = Hotel
+    current: np.ndarray  # Spieler am Zug je Partie
+    turns: np.ndarray  # Abgeschlossene Züge je Partie
+    n_alive: np.ndarray  # Verbleibende Spieler je Partie
+
+    @classmethod
+    def start(cls, n_games: int, n_players: int, n_fields: int, starting_cash: int) -> "GameState":
+        n_seats = n_games * n_players
+        return cls(n_games=n_games,
+                   n_players=n_players,
+                   position=np.zeros(n_seats, dtype=np.int64),
+                   doubles=np.zeros(n_seats, dtype=np.int64),
+                   in_jail=np.zeros(n_seats, dtype=bool),
+                   jail_round=np.zeros(n_seats, dtype=np.int64),
+                   cash=np.full(n_seats, starting_cash, dtype=np.int64),
+                   alive=np.ones(n_seats, dtype=bool),
+                   monopolies=np.zeros(n_seats, dtype=np.int64),
+                   trade_groups=np.zeros(n_seats, dtype=np.int64),
+                   owner=np.full(n_games * n_fields, BANK, dtype=np.int64),
+                   houses=np.zeros(n_games * n_fields, dtype=np.int64),
+                   current=np.zeros(n_games, dtype=np.int64),
+                   turns=np.zeros(n_games, dtype=np.int64),
+                   n_alive=np.full(n_games, n_players, dtype=np.int64))
@@ -1,27 +1,141 @@
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+
+
+@dataclass(frozen=True)
+class Street:
+    name: str
+    color_group: str
+    price: int
+    house_cost: int  # Preis je Haus; Hotel = 5. Ausbaustufe
+    rents: tuple[int, int, int, int, int, int]  # Miete mit 0-4 Häusern bzw. Hotel
+
+
+@dataclass(frozen=True)
+class RuleConfig:
+    """
+        Deklarative, hashbare Regelvariante für die Bewegungs-Kette.
+
+        Standardwerte entsprechen dem deutschen Originalspiel. Reine Geldregeln
+        (z.B. Frei Parken) ändern die Übergangsmatrix nicht und sind hier nicht enthalten.
+        """
+    jail_field: int = 10
+    go_in_jail_field: int = 30
+    chance_fields: tuple[int, ...] = (7, 22, 36)
+    community_fields: tuple[int, ...] = (2, 17, 33)
+    railroads: tuple[int, ...] = (5, 15, 25, 35)
+    chance_card_fixed_targets: tuple[int, ...] = (
+        0,  # Los
+        1,  # Badstraße
+        5,  # Südbahnhof
+        11,  # Seestraße
+        24,  # Opernplatz
+        39,  # Schlossallee
+        10  # Gefängnis
+    )
+    community_chest_fixed_targets: tuple[int, ...] = (
+        0,  # Los
+        10  # Gefängnis
+    )
+    total_cards: int = 16
+    chance_next_railroad: bool = True  # Karte "Rücke vor bis zum nächsten Bahnhof"
+    chance_three_back: bool = True  # Karte "Gehe 3 Felder zurück"
+    jail_rounds: int = 3  # Runde, in der man spätestens freikommt (1 = sofort bezahlen)
+
+    def __post_init__(self):
+        for name in ("chance_fields", "community_fields", "railroads",
+                     "chance_card_fixed_targets", "community_chest_fixed_targets"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+        if not 1 <= self.jail_rounds <= 3:
+            raise ValueError(f"jail_rounds muss zwischen 1 und 3 liegen, nicht {self.jail_rounds}")
+        for name in ("jail_field", "go_in_jail_field", "chance_fields", "community_fields", "railroads",
+                     "chance_card_fixed_targets", "community_chest_fixed_targets"):
+            value = getattr(self, name)
+            invalid = [field for field in (value if isinstance(value, tuple) else (value,))
+                       if not 0 <= field < 40]
+            if invalid:
+                raise ValueError(f"{name} enthält Felder außerhalb des Bretts (0-39): {invalid}")
+        if self.jail_field == self.go_in_jail_field:
+            raise ValueError(f"jail_field und go_in_jail_field dürfen nicht gleich sein ({self.jail_field})")
+        if not self.railroads:
+            raise ValueError("railroads darf nicht leer sein")
+        if self.total_cards <= 0:
+            raise ValueError(f"total_cards muss positiv sein, nicht {self.total_cards}")
+        n_chance = len(self.chance_card_fixed_targets) + self.chance_next_railroad + self.chance_three_back
+        if max(n_chance, len(self.community_chest_fixed_targets)) > self.total_cards:
+            raise ValueError(f"Mehr positionsändernde Karten als total_cards={self.total_cards}")
+
+    def config_hash(self) -> str:
+        """
+            Prozessübergreifend stabiler Inhalts-Hash (für Caches auf der Festplatte).
+            """
+        return hashlib.sha1(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()
+
+
 class GermanMonopoly:
-    def __init__(self):
+    def __init__(self, rules: RuleConfig | None = None):
+        self.rules = rules if rules is not None else RuleConfig()
         self.board_fields = range(40)
-        self.jail_field = 10
-        self.go_in_jail_field = 30
-        self.chance_fields = [7, 22, 36]
-        self.community_fields = [2, 17, 33]
-        self.railroads = [5, 15, 25, 35]
-        self.chance_card_fixed_targets = [
-            0,  # Los
-            1,  # Badstraße
-            5,  # Südbahnhof
-            11,  # Seestraße
-            24,  # Opernplatz
-            39,  # Schlossallee
-            10  # Gefängnis
-        ]
-        self.community_chest_fixed_targets = [
-            0,  # Los
-            10  # Gefängnis
-        ]
-        self.total_cards = 16
-        self.position_changing_chance_cards = 9
-        self.position_changing_community_cards = 2
+        self.jail_field = self.rules.jail_field
+        self.go_in_jail_field = self.rules.go_in_jail_field
+        self.chance_fields = list(self.rules.chance_fields)
+        self.community_fields = list(self.rules.community_fields)
+        self.railroads = list(self.rules.railroads)
+        self.chance_card_fixed_targets = list(self.rules.chance_card_fixed_targets)
+        self.community_chest_fixed_targets = list(self.rules.community_chest_fixed_targets)
+        self.total_cards = self.rules.total_cards
+        self.chance_next_railroad = self.rules.chance_next_railroad
+        self.chance_three_back = self.rules.chance_three_back
+        self.jail_rounds = self.rules.jail_rounds
+        self.position_changing_chance_cards = (len(self.chance_card_fixed_targets)
+                                               + self.chance_next_railroad + self.chance_three_back)
+        self.position_changing_community_cards = len(self.community_chest_fixed_targets)
+
+        self.streets = {
+            1: Street("Badstraße", "lila", 60, 50, (2, 10, 30, 90, 160, 250)),
+            3: Street("Turmstraße", "lila", 60, 50, (4, 20, 60, 180, 320, 450)),
+            6: Street("Chausseestraße", "hellblau", 100, 50, (6, 30, 90, 270, 400, 550)),
+            8: Street("Elisenstraße", "hellblau", 100, 50, (6, 30, 90, 270, 400, 550)),
+            9: Street("Poststraße", "hellblau", 120, 50, (8, 40, 100, 300, 450, 600)),
+            11: Street("Seestraße", "pink", 140, 100, (10, 50, 150, 450, 625, 750)),
+            13: Street("Hafenstraße", "pink", 140, 100, (10, 50, 150, 450, 625, 750)),
+            14: Street("Neue Straße", "pink", 160, 100, (12, 60, 180, 500, 700, 900)),
+            16: Street("Münchner Straße", "orange", 180, 100, (14, 70, 200, 550, 750, 950)),
+            18: Street("Wiener Straße", "orange", 180, 100, (14, 70, 200, 550, 750, 950)),
+            19: Street("Berliner Straße", "orange", 200, 100, (16, 80, 220, 600, 800, 1000)),
+            21: Street("Theaterstraße", "rot", 220, 150, (18, 90, 250, 700, 875, 1050)),
+            23: Street("Museumstraße", "rot", 220, 150, (18, 90, 250, 700, 875, 1050)),
+            24: Street("Opernplatz", "rot", 240, 150, (20, 100, 300, 750, 925, 1100)),
+            26: Street("Lessingstraße", "gelb", 260, 150, (22, 110, 330, 800, 975, 1150)),
+            27: Street("Schillerstraße", "gelb", 260, 150, (22, 110, 330, 800, 975, 1150)),
+            29: Street("Goethestraße", "gelb", 280, 150, (24, 120, 360, 850, 1025, 1200)),
+            31: Street("Rathausplatz", "grün", 300, 200, (26, 130, 390, 900, 1100, 1275)),
+            32: Street("Hauptstraße", "grün", 300, 200, (26, 130, 390, 900, 1100, 1275)),
+            34: Street("Bahnhofstraße", "grün", 320, 200, (28, 150, 450, 1000, 1200, 1400)),
+            37: Street("Parkstraße", "dunkelblau", 350, 200, (35, 175, 500, 1100, 1300, 1500)),
+            39: Street("Schlossallee", "dunkelblau", 400, 200, (50, 200, 600, 1400, 1700, 2000)),
+        }
+        self.railroad_names = {
+            5: "Südbahnhof",
+            15: "Westbahnhof",
+            25: "Nordbahnhof",
+            35: "Hauptbahnhof"
+        }
+        self.railroad_price = 200
+        self.railroad_rents = (25, 50, 100, 200)  # nach Anzahl eigener Bahnhöfe
+        self.utilities = {
+            12: "Elektrizitätswerk",
+            28: "Wasserwerk"
+        }
+        self.utility_price = 150
+        self.utility_multipliers = (4, 10)  # × Augensumme, nach Anzahl eigener Werke
+        self.tax_fields = {
+            4: 200,  # Einkommensteuer
+            38: 100  # Zusatzsteuer
+        }
+        self.salary = 200  # über Los
+        self.jail_fine = 50
 
     def get_next_railroad(self, current_field: int) -> int:
         for railroad in self.railroads:
@@ -33,3 +147,12 @@ class GermanMonopoly:
     def get_three_back(current_field: int) -> int:
         return (current_field - 3) % 40
 
+    def get_chance_card_targets(self, current_field: int) -> list[int]:
+        # Ziele aller positionsändernden Ereigniskarten in Stapelreihenfolge
+        targets = list(self.chance_card_fixed_targets)
+        if self.chance_next_railroad:
+            targets.append(self.get_next_railroad(current_field))
+        if self.chance_three_back:
+            targets.append(self.get_three_back(current_field))
+        return targets
+
@@ -0,0 +1,154 @@
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from monopoly_analysis.solvers import LRUCache, matrix_hash, normalize_rows
+from monopoly_analysis.state_codec import StateCodec
+
+# Hitting-Time-Tabellen je (Matrix-Hash, Zustandskodierung, Einheit)
+_cache = LRUCache(max_entries=32)
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
+class HittingTimes:
+    """
+        Erwartete Trefferzeiten und Trefferwahrscheinlichkeiten aus einer einzigen LU-Zerlegung.
+
+        Für eine Zielmenge T lautet das absorbierende System (I - P·D_T)·h = b, wobei D_T die
+        Spalten von T ausblendet. Mit der festen, regulären Basis M = I - P + 1·uᵀ gilt
+        I - P·D_T = M + U·Vᵀ mit U = [-1, P[:, T]] und V = [u, E_T], also ein Rang-(|T|+1)-Update.
+        M wird einmal zerlegt; jede Zielmenge kostet dann nur ein kleines (|T|+1)²-System
+        (Woodbury), für alle 40 Felder gemeinsam als ein Batch.
+        """
+
+    def __init__(self, transition_matrix: np.ndarray, codec: StateCodec | None = None):
+        self.codec = codec if codec is not None else StateCodec()
+        self.transition_matrix = normalize_rows(np.asarray(transition_matrix, dtype=float))
+        n_states = self.transition_matrix.shape[0]
+        self.n_states = n_states
+        self.uniform = np.full(n_states, 1 / n_states)
+
+        base = np.eye(n_states) - self.transition_matrix + np.outer(np.ones(n_states), self.uniform)
+        self._lu = lu_factor(base)
+        self._base_inv_p = lu_solve(self._lu, self.transition_matrix)  # M⁻¹·P
+        self._base_inv_ones = lu_solve(self._lu, np.ones(n_states))  # M⁻¹·1
+
+        # Kosten je Schritt: 1 Wurf bzw. 1 neuer Zug (nur wenn der Zustand einen Zug beendet hat)
+        continues = ~self.codec.in_jail & (self.codec.counters > 0)
+        self.step_costs = {"rolls": np.ones(n_states), "turns": (~continues).astype(float)}
+
+    def _field_states(self, fields) -> np.ndarray:
+        return np.flatnonzero(np.isin(self.codec.positions, fields))
+
+    def _solve_batch(self, target_sets: list[np.ndarray], rhs: np.ndarray) -> np.ndarray:
+        """
+            Löst (I - P·D_T)·x = b für mehrere Zielmengen T über Woodbury.
+
+            Args:
+                target_sets: Zustandsindizes je Zielmenge (nicht leer)
+                rhs: n_states × len(target_sets) rechte Seiten
+
+            Returns:
+                np.ndarray: n_states × len(target_sets)
+            """
+        n_sets = len(target_sets)
+        width = max(len(targets) for targets in target_sets) + 1
+        # Mit Nullspalten aufgefüllte Rang-Updates: Z = M⁻¹·U (Batch × n × width)
+        update = np.zeros((n_sets, self.n_states, width))
+        selector = np.zeros((n_sets, self.n_states, width))
+        update[:, :, 0] = -self._base_inv_ones
+        selector[:, :, 0] = self.uniform
+        for index, targets in enumerate(target_sets):
+            columns = np.arange(1, len(targets) + 1)
+            update[index][:, columns] = self._base_inv_p[:, targets]
+            selector[index][targets, columns] = 1.0
+
+        solution = lu_solve(self._lu, rhs)  # y = M⁻¹·b
+        capacitance = np.eye(width) + np.einsum("knw,knv->kwv", selector, update)
+        projected = np.einsum("knw,nk->kw", selector, solution)
+        correction = np.linalg.solve(capacitance, projected[:, :, None])[:, :, 0]
+        return solution - np.einsum("knw,kw->nk", update, correction)
+
+    def expected_hitting_times(self, unit: str = "turns") -> np.ndarray:
+        """
+            Erwartete Anzahl Züge (bzw. Würfe) bis zur ersten Landung auf jedem Feld.
+
+            Args:
+                unit: "turns" (Züge, Pasch-Würfe zählen zum selben Zug) oder "rolls"
+
+            Returns:
+                np.ndarray: n_states × 40 Tabelle; Zeile = Startzustand, Spalte = Zielfeld.
+                Landet der Startzustand bereits auf dem Feld, zählt erst die nächste Landung.
+                Nie erreichbare Felder (30) sind np.inf.
+            """
+        if unit not in self.step_costs:
+            raise ValueError(f"Unbekannte Einheit '{unit}', erlaubt: {sorted(self.step_costs)}")
+        n_fields = self.codec.n_fields
+        table = np.full((self.n_states, n_fields), np.inf)
+        target_sets = {field: self._field_states([field]) for field in range(n_fields)}
+        reachable = [field for field, targets in target_sets.items() if len(targets)]
+
+        rhs = np.repeat(self.step_costs[unit][:, None], len(reachable), axis=1)
+        table[:, reachable] = self._solve_batch([target_sets[field] for field in reachable], rhs)
+        return table
+
+    def hit_probability(self, target_fields: list[int], avoid_fields: list[int]) -> np.ndarray:
+        """
+            Wahrscheinlichkeit, target_fields zu erreichen, bevor avoid_fields erreicht wird.
+
+            Args:
+                target_fields: Zielfelder (z.B. [39] für Schlossallee)
+                avoid_fields: Konkurrierende Felder (z.B. [0] für Los)
+
+            Returns:
+                np.ndarray: Wahrscheinlichkeit je Startzustand
+            """
+        return self.hit_probability_table(avoid_fields, [target_fields])[:, 0]
+
+    def hit_probability_table(self, avoid_fields: list[int], targets: list[list[int]] | None = None) -> np.ndarray:
+        """
+            Batch-Variante von hit_probability für viele Zielmengen gegen dieselbe Vermeidungsmenge.
+
+            Args:
+                avoid_fields: Konkurrierende Felder
+                targets: Liste von Zielfeld-Listen (Standard: jedes Feld einzeln)
+
+            Returns:
+                np.ndarray: n_states × len(targets); nie erreichbare Ziele ergeben 0
+            """
+        if targets is None:
+            targets = [[field] for field in range(self.codec.n_fields)]
+        avoid_states = self._field_states(avoid_fields)
+        result = np.zeros((self.n_states, len(targets)))
+
+        target_states = [self._field_states(fields) for fields in targets]
+        solvable = [index for index, states in enumerate(target_states) if len(states)]
+        if not solvable:
+            return result
+        absorbing = [np.union1d(target_states[index], avoid_states) for index in solvable]
+        # Rechte Seite: direkter Sprung ins Ziel, b = P·1_A
+        rhs = np.stack([self.transition_matrix[:, target_states[index]].sum(axis=1) for index in solvable], axis=1)
+        result[:, solvable] = self._solve_batch(absorbing, rhs)
+        return result
+
+
+def hitting_time_table(transition_matrix: np.ndarray,
+                       codec: StateCodec | None = None,
+                       unit: str = "turns") -> np.ndarray:
+    """
+        Zwischengespeicherte n_states × 40 Hitting-Time-Tabelle je Regelkonfiguration.
+
+        Note:
+            Der Cache-Schlüssel ist der Inhalts-Hash der Matrix zusammen mit Kodierung und
+            Einheit, d.h. jede Regelvariante (andere Matrix) erhält ihren eigenen Eintrag.
+            Der Cache ist ein LRU mit höchstens _cache.max_entries Tabellen.
+        """
+    codec = codec if codec is not None else StateCodec()
+    key = (matrix_hash(transition_matrix), codec, unit)
+    table = _cache.get(key)
+    if table is None:
+        table = HittingTimes(transition_matrix, codec).expected_hitting_times(unit)
+        table.setflags(write=False)
+        _cache.put(key, table)
+    return table
@@ -0,0 +1,217 @@
+from dataclasses import replace
+from functools import reduce
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.solvers import normalize_rows
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+class IncrementalModel:
+    """
+        Was-wäre-wenn-Analyse: Eine Regeländerung schreibt nur die betroffenen Matrixzeilen
+        neu und aktualisiert die stationäre Verteilung, statt alles neu aufzubauen.
+
+        Die stationäre Verteilung ist π = uᵀ·M⁻¹ mit M = I - P + 1·uᵀ. M⁻¹ wird einmal gebildet
+        und festgehalten. Unterscheiden sich inzwischen die Zeilen R um D (k × n) von dieser
+        Basis, ist M' = M - E_R·D ein Rang-k-Update, und nach Woodbury gilt
+            π' = π + π[R]·(I - D·M⁻¹[:, R])⁻¹·D·M⁻¹,
+        also nur ein k × k-System statt einer neuen Zerlegung. Wird k größer als max_rank oder
+        wächst das Residuum, wird neu zerlegt; alternativ löst method="power" mit der
+        bisherigen Verteilung als Startwert.
+        """
+
+    def __init__(self,
+                 config: RuleConfig | None = None,
+                 max_rank: int | None = None,
+                 tol: float = 1e-10):
+        """
+            Args:
+                config: Ausgangsregeln (Standard: RuleConfig())
+                max_rank: Höchstens so viele geänderte Zeilen per Woodbury, sonst neu
+                    invertieren (Standard: alle Zeilen)
+                tol: Zulässiges Residuum ||πP - π||₁ nach einem Update
+            """
+        self.max_rank = max_rank
+        self.tol = tol
+        self.rank_updates = 0
+        self.refactorizations = 0
+        self._reset(config if config is not None else RuleConfig())
+
+    def _reset(self, config: RuleConfig) -> None:
+        self.config = config
+        self.probabilities = Probabilities(config)
+        self.codec = self.probabilities.codec
+        self.transition_matrix = TransitionMatrixBuilder(self.probabilities).build()
+        self._normalized = normalize_rows(self.transition_matrix)
+        self._index_key = None
+        self._index = {}
+        self._factorize()
+
+    def _factorize(self) -> None:
+        n_states = self.codec.n_states
+        uniform = np.full(n_states, 1 / n_states)
+        base = np.eye(n_states) - self._normalized + np.outer(np.ones(n_states), uniform)
+        self._base_inverse = lu_solve(lu_factor(base), np.eye(n_states))
+        self._base_matrix = self._normalized.copy()
+        self._base_distribution = uniform @ self._base_inverse
+        self.distribution = self._base_distribution
+        self.refactorizations += 1
+
+    @property
+    def field_probabilities(self) -> np.ndarray:
+        return np.bincount(self.codec.positions, weights=self.distribution, minlength=self.codec.n_fields)
+
+    def residual(self) -> float:
+        return float(np.abs(self.distribution @ self._normalized - self.distribution).sum())
+
+    def _landing_reach(self) -> np.ndarray:
+        """
+            n_states × n_fields: Kann ein Wurf aus dem Zustand auf dem Feld landen (vor Karten)?
+
+            Note:
+                Obermenge: Gefängniszustände zählen alle Augensummen, auch wenn ohne Pasch
+                niemand das Gefängnis verlässt. Zusätzliche Zeilen werden nur unverändert neu
+                berechnet.
+            """
+        dice_sums = [dice_sum for dice_sum, prob in (*self.probabilities.non_doubles_probabilities.items(),
+                                                     *self.probabilities.doubles_probabilities.items()) if prob > 0]
+        landing = (self.codec.positions[:, None] + np.array(dice_sums)[None, :]) % self.codec.n_fields
+        reach = np.zeros((self.codec.n_states, self.codec.n_fields), dtype=bool)
+        reach[np.arange(self.codec.n_states)[:, None], landing] = True
+        return reach
+
+    def dependency_index(self) -> dict[str, np.ndarray]:
+        """
+            Ordnet jedem RuleConfig-Feld die Matrixzeilen zu, die es verändern kann.
+
+            Returns:
+                {Feldname: sortierte Zustandsindizes}
+            """
+        # Der Index hängt von der Lage der Karten- und Gefängnisfelder und den Kartenzielen ab
+        config = self.config
+        index_key = (config.chance_fields, config.community_fields, config.chance_card_fixed_targets,
+                     config.chance_next_railroad, config.chance_three_back, config.railroads,
+                     config.jail_field, config.go_in_jail_field)
+        if self._index_key == index_key:
+            return self._index
+
+        game_version = self.probabilities.game_version
+        reach = self._landing_reach()
+        all_rows = np.arange(self.codec.n_states)
+
+        def reaching(fields: list[int]) -> np.ndarray:
+            return np.flatnonzero(reach[:, fields].any(axis=1))
+
+        # Gemeinschaftskarten wirken auch über Ereigniskarten, die auf ein Gemeinschaftsfeld führen
+        # ("3 Felder zurück" 36 → 33, aber auch feste Ziele oder der nächste Bahnhof)
+        community_fields = set(game_version.community_fields)
+        via_chance = [field for field in game_version.chance_fields
+                      if community_fields & set(game_version.get_chance_card_targets(field))]
+        chance_rows = reaching(game_version.chance_fields)
+        community_rows = reaching(game_version.community_fields + via_chance)
+
+        self._index = {
+            "chance_card_fixed_targets": chance_rows,
+            "chance_next_railroad": chance_rows,
+            "chance_three_back": chance_rows,
+            "railroads": chance_rows,
+            "community_chest_fixed_targets": community_rows,
+            "total_cards": np.union1d(chance_rows, community_rows),
+            "jail_rounds": np.flatnonzero(self.codec.in_jail),
+            # Strukturelle Änderungen betreffen alle Zeilen
+            "chance_fields": all_rows,
+            "community_fields": all_rows,
+            "jail_field": all_rows,
+            "go_in_jail_field": all_rows,
+        }
+        self._index_key = index_key
+        return self._index
+
+    def update(self, config_delta: dict | None = None, method: str = "woodbury", **changes) -> np.ndarray:
+        """
+            Übernimmt eine Regeländerung und aktualisiert Matrix und stationäre Verteilung.
+
+            Args:
+                config_delta: RuleConfig-Feld → neuer Wert
+                method: "woodbury" (Rang-k-Update von M⁻¹) oder "power" (Potenzmethode,
+                    warm gestartet mit der bisherigen Verteilung)
+                **changes: Alternativ als Schlüsselwortargumente
+
+            Returns:
+                np.ndarray: Indizes der tatsächlich geänderten Zeilen
+            """
+        changes = {**(config_delta or {}), **changes}
+        index = self.dependency_index()
+        unknown = set(changes) - set(index)
+        if unknown:
+            raise ValueError(f"Unbekannte Regelfelder: {sorted(unknown)}")
+        if method not in ("woodbury", "power"):
+            raise ValueError(f"Unbekanntes Verfahren '{method}', erlaubt: ['power', 'woodbury']")
+
+        new_config = replace(self.config, **changes)
+        changed_fields = [name for name in changes if getattr(new_config, name) != getattr(self.config, name)]
+        if not changed_fields:
+            return np.array([], dtype=int)
+
+        probabilities = Probabilities(new_config)
+        if probabilities.codec != self.codec:
+            # Anderer Zustandsraum (Gefängnisfelder verschoben): vollständig neu
+            self._reset(new_config)
+            return np.arange(self.codec.n_states)
+
+        rows = reduce(np.union1d, [index[name] for name in changed_fields])
+        new_rows = TransitionMatrixBuilder(probabilities).build_rows(rows)
+        previous = (self.config, self.probabilities, self.transition_matrix[rows], self._normalized[rows])
+        self.config = new_config
+        self.probabilities = probabilities
+        try:
+            return self._apply_rows(rows, new_rows, method)
+        except RuntimeError:
+            # Ohne konvergierte Verteilung bleibt das Modell vollständig beim alten Stand
+            self.config, self.probabilities = previous[:2]
+            self.transition_matrix[rows] = previous[2]
+            self._normalized[rows] = previous[3]
+            raise
+
+    def _apply_rows(self, rows: np.ndarray, new_rows: np.ndarray, method: str) -> np.ndarray:
+        normalized_rows = normalize_rows(new_rows)
+        changed = np.flatnonzero((normalized_rows != self._normalized[rows]).any(axis=1))
+        rows = rows[changed]
+        self.transition_matrix[rows] = new_rows[changed]
+        self._normalized[rows] = normalized_rows[changed]
+        if not len(rows):
+            return rows
+
+        if method == "power":
+            self._solve_power()
+            return rows
+
+        # Alle seit der letzten Zerlegung geänderten Zeilen bilden das Rang-k-Update
+        updated = np.flatnonzero((self._normalized != self._base_matrix).any(axis=1))
+        if self.max_rank is not None and len(updated) > self.max_rank:
+            self._factorize()
+            return rows
+
+        delta = self._normalized[updated] - self._base_matrix[updated]  # D
+        columns = self._base_inverse[:, updated]  # M⁻¹·E_R
+        capacitance = np.eye(len(updated)) - delta @ columns
+        weights = np.linalg.solve(capacitance.T, self._base_distribution[updated])  # π[R]·(I - D·M⁻¹·E_R)⁻¹
+        self.distribution = self._base_distribution + (weights @ delta) @ self._base_inverse
+        self.rank_updates += 1
+        if self.residual() > self.tol:
+            self._factorize()
+        return rows
+
+    def _solve_power(self, max_iter: int = 10_000) -> None:
+        # Wie solvers._solve_power: ohne Konvergenz Fehler statt eines unfertigen Iterats
+        distribution = self.distribution
+        for _ in range(max_iter):
+            next_distribution = distribution @ self._normalized
+            next_distribution /= next_distribution.sum()
+            if np.abs(next_distribution - distribution).sum() < self.tol:
+                self.distribution = next_distribution
+                return
+            distribution = next_distribution
+        raise RuntimeError(f"Potenzmethode nach {max_iter} Iterationen nicht konvergiert")
@@ -0,0 +1,178 @@
+import functools
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+from monopoly_analysis import solvers
+from monopoly_analysis.probabilities import MonopolyState, Probabilities
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+# Gemessene Methoden von Probabilities (Zeiten jeweils inklusive Unteraufrufe)
+PROBABILITY_HOOKS = (
+    "create_transition_matrix",
+    "_get_transitions_from_normal_state",
+    "_get_transitions_from_jail_state",
+    "_add_transition",
+    "_add_chance_card_transitions",
+    "_add_community_transitions",
+    "_create_target_state",
+)
+SOURCE_HOOKS = ("_get_transitions_from_normal_state", "_get_transitions_from_jail_state")
+# Vektorisierter Aufbau (Sweeps), nur bei target=None gemessen
+BUILDER_HOOKS = ("__init__", "_create_landing_kernel", "_assemble", "build")
+# Stufen von solvers.solve_stationary; die Verfahren aus SOLVERS kommen als "solve.<Name>" hinzu
+SOLVER_STAGES = ("matrix_hash", "normalize_rows", "field_marginals")
+
+_MISSING = object()
+
+
+@dataclass
+class CallStats:
+    count: int = 0
+    total_seconds: float = 0.0
+
+
+class Recorder:
+    """
+        Sammelt Aufrufzähler, kumulierte Zeiten, Übergänge je Ausgangszustand und
+        fehlende Zielzustände während eines instrument()-Blocks.
+        """
+
+    def __init__(self, callback: Callable[[str, float], None] | None = None):
+        """
+            Args:
+                callback: Wird nach jedem gemessenen Aufruf mit (Name, Sekunden) aufgerufen,
+                    für fehlende Zielzustände mit ("missing_target", 0.0)
+            """
+        self.callback = callback
+        self.calls: dict[str, CallStats] = defaultdict(CallStats)
+        self.transitions_per_source: dict[MonopolyState, int] = {}
+        self.missing_targets: list[tuple[MonopolyState, MonopolyState]] = []
+
+    def _record(self, name: str, elapsed: float) -> None:
+        stats = self.calls[name]
+        stats.count += 1
+        stats.total_seconds += elapsed
+        if self.callback is not None:
+            self.callback(name, elapsed)
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._record(name, time.perf_counter() - start)
+        return wrapper
+
+    def counting_sources(self, function: Callable) -> Callable:
+        # Zählt die Zielzustände je Ausgangszustand (letztes Positionsargument oder state=)
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            transitions = function(*args, **kwargs)
+            self.transitions_per_source[kwargs.get("state", args[-1] if args else None)] = len(transitions)
+            return transitions
+        return wrapper
+
+    def counting_misses(self, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.missing_targets.append(tuple(args[-2:]))
+            if self.callback is not None:
+                self.callback("missing_target", 0.0)
+            return function(*args, **kwargs)
+        return wrapper
+
+    def report(self) -> dict:
+        """
+            Maschinenlesbarer Bericht (nur JSON-Typen).
+
+            Returns:
+                {"calls": {Name: {"count", "total_seconds", "mean_seconds"}},
+                 "transitions_per_source": [{"position", "counter", "in_jail", "transitions"}],
+                 "missing_targets": {"count", "examples"}}
+            """
+        def state_dict(state: MonopolyState) -> dict:
+            return {"position": state.position, "counter": state.counter, "in_jail": state.in_jail}
+
+        return {
+            "calls": {name: {"count": stats.count,
+                             "total_seconds": stats.total_seconds,
+                             "mean_seconds": stats.total_seconds / stats.count}
+                      for name, stats in sorted(self.calls.items(), key=lambda item: -item[1].total_seconds)},
+            "transitions_per_source": [{**state_dict(state), "transitions": count}
+                                       for state, count in self.transitions_per_source.items()],
+            "missing_targets": {"count": len(self.missing_targets),
+                                "examples": [{"source": state_dict(source), "target": state_dict(target)}
+                                             for source, target in self.missing_targets[:20]]},
+        }
+
+    def to_json(self, path: str | Path | None = None) -> str:
+        text = json.dumps(self.report(), indent=2)
+        if path is not None:
+            Path(path).write_text(text)
+        return text
+
+
+def _patch(owner, name: str, replacement, patches: list) -> None:
+    patches.append((owner, name, vars(owner).get(name, _MISSING)))
+    setattr(owner, name, replacement)
+
+
+@contextmanager
+def instrument(target: Probabilities | None = None,
+               callback: Callable[[str, float], None] | None = None,
+               solver_stages: bool = True) -> Iterator[Recorder]:
+    """
+        Misst die Hot Paths von Probabilities und solve_stationary innerhalb des with-Blocks.
+
+        Args:
+            target: Nur diese Instanz messen; None = alle Instanzen (auch in Sweeps erzeugte)
+                und zusätzlich die Stufen von TransitionMatrixBuilder
+            callback: Optionaler Rückruf je Messung, siehe Recorder
+            solver_stages: Auch die Stufen von solvers.solve_stationary messen
+
+        Returns:
+            Recorder: Ergebnisse, z.B. recorder.report() oder recorder.to_json("profil.json")
+
+        Note:
+            Die Messung ersetzt die Methoden nur für die Dauer des Blocks durch Wrapper und
+            stellt danach die Originale wieder her. Ohne instrument() läuft also unveränderter
+            Code ohne jeden Zusatzaufwand. Nicht thread-sicher, wenn parallel andere Threads
+            dieselben Klassen benutzen.
+        """
+    recorder = Recorder(callback)
+    owner = target if target is not None else Probabilities
+    patches = []
+    solver_functions = None
+    try:
+        for name in PROBABILITY_HOOKS:
+            wrapped = recorder.timed(name, getattr(owner, name))
+            if name in SOURCE_HOOKS:
+                wrapped = recorder.counting_sources(wrapped)
+            _patch(owner, name, wrapped, patches)
+        _patch(owner, "_missing_target", recorder.counting_misses(getattr(owner, "_missing_target")), patches)
+        if target is None:
+            for name in BUILDER_HOOKS:
+                _patch(TransitionMatrixBuilder, name,
+                       recorder.timed(f"TransitionMatrixBuilder.{name}", getattr(TransitionMatrixBuilder, name)), patches)
+
+        if solver_stages:
+            for name in SOLVER_STAGES:
+                _patch(solvers, name, recorder.timed(name, getattr(solvers, name)), patches)
+            solver_functions = dict(solvers.SOLVERS)
+            solvers.SOLVERS.update({method: recorder.timed(f"solve.{method}", function)
+                                    for method, function in solver_functions.items()})
+        yield recorder
+    finally:
+        if solver_functions is not None:
+            solvers.SOLVERS.update(solver_functions)
+        for owner, name, original in reversed(patches):
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
@@ -0,0 +1,286 @@
+from typing import Iterator
+import numpy as np
+from scipy.sparse.linalg import LinearOperator
+from monopoly_analysis.solvers import normalize_rows, solve_stationary
+from monopoly_analysis.state_codec import StateCodec
+
+
+class JointChain:
+    """
+        Gemeinsame Markov-Kette von k Spielfiguren, ohne die n^k × n^k-Matrix aufzubauen.
+
+        Die Spieler ziehen abwechselnd. Ein Zug von Spieler i wirkt nur auf Achse i des
+        Zustandstensors (Form n × ... × n), d.h. als I ⊗ ... ⊗ T ⊗ ... ⊗ I; eine volle
+        Runde ist das Kronecker-Produkt T ⊗ ... ⊗ T. T ist die Zugmatrix (alle Würfe
+        bis kein Pasch mehr fällt, siehe turn_matrix) oder mit per_turn=False die
+        Wurfmatrix P. Beides wird implizit über
+        gestapelte Matrixprodukte angewendet, der Speicherbedarf ist O(n^k) für zwei
+        Zustandstensoren (3 Spieler: ~14 MB, 4 Spieler: ~1,7 GB je Tensor in float64).
+        """
+
+    def __init__(self,
+                 transition_matrix: np.ndarray,
+                 n_players: int,
+                 dtype: type = np.float64,
+                 codec: StateCodec | None = None,
+                 per_turn: bool = True):
+        """
+            Args:
+                transition_matrix: Einzelspieler-Matrix aus create_transition_matrix
+                n_players: Anzahl der Spieler (2-6)
+                dtype: np.float64 oder np.float32 (halbiert den Speicher)
+                codec: Zustandskodierung der Einzelspieler-Matrix
+                per_turn: True = ein Zug umfasst alle Pasch-Würfe eines Spielers,
+                    False = Spieler wechseln nach jedem einzelnen Wurf
+            """
+        transition_matrix = np.asarray(transition_matrix, dtype=float)
+        # Zeilensummen der Rohmatrix (≈1.0003 wegen gerundeter Würfelwahrscheinlichkeiten)
+        self.row_sums = transition_matrix.sum(axis=1)
+        self.transition_matrix = normalize_rows(transition_matrix)
+        self.n_players = n_players
+        self.n_single = self.transition_matrix.shape[0]
+        self.dtype = dtype
+        self.codec = codec if codec is not None else StateCodec()
+        self.per_turn = per_turn
+        move_matrix = turn_matrix(self.transition_matrix, self.codec) if per_turn else self.transition_matrix
+        self.move_matrix = move_matrix.astype(dtype)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (self.n_single,) * self.n_players
+
+    @property
+    def n_states(self) -> int:
+        return self.n_single ** self.n_players
+
+    def _apply(self, tensor: np.ndarray, matrix: np.ndarray, player: int, out: np.ndarray | None) -> np.ndarray:
+        # Achse "player" mit matrix multiplizieren: (a, n, b) → (a, n, b)
+        before = self.n_single ** player
+        after = self.n_single ** (self.n_players - player - 1)
+        if out is None:
+            out = np.empty(self.shape, dtype=self.dtype)
+        if after == 1:
+            np.matmul(tensor.reshape(before, self.n_single), matrix,
+                      out=out.reshape(before, self.n_single))
+        else:
+            np.matmul(matrix.T, tensor.reshape(before, self.n_single, after),
+                      out=out.reshape(before, self.n_single, after))
+        return out
+
+    def apply_move(self, tensor: np.ndarray, player: int, out: np.ndarray | None = None) -> np.ndarray:
+        """
+            Verteilung nach einem Zug von Spieler player (vec · (I ⊗ .. ⊗ T ⊗ .. ⊗ I)).
+
+            Args:
+                tensor: Gemeinsame Verteilung der Form shape
+                player: Ziehender Spieler (Achse)
+                out: Optionaler Ausgabepuffer (darf nicht tensor sein)
+
+            Returns:
+                np.ndarray: Neue Verteilung der Form shape
+            """
+        return self._apply(tensor, self.move_matrix, player, out)
+
+    def apply_round(self, tensor: np.ndarray, first_player: int = 0) -> np.ndarray:
+        """
+            Verteilung nach einer vollen Runde (alle Spieler ziehen einmal, reihum).
+            """
+        current = tensor
+        spare = None
+        for offset in range(self.n_players):
+            player = (first_player + offset) % self.n_players
+            out = spare if spare is not None else np.empty(self.shape, dtype=self.dtype)
+            self.apply_move(current, player, out=out)
+            # Eingabetensor des Aufrufers nie überschreiben
+            spare = current if current is not tensor else None
+            current = out
+        return current
+
+    def matvec(self, vector: np.ndarray) -> np.ndarray:
+        """
+            Flacher Zeilenvektor × (T ⊗ ... ⊗ T), Länge n^k.
+            """
+        return self.apply_round(np.asarray(vector, dtype=self.dtype).reshape(self.shape)).reshape(-1)
+
+    def as_linear_operator(self) -> LinearOperator:
+        """
+            Rundenoperator als scipy LinearOperator (für Krylov-Verfahren).
+
+            Note:
+                matvec berechnet (T ⊗ ... ⊗ T)ᵀ x, also die Fortschreibung einer Verteilung.
+            """
+        return LinearOperator((self.n_states, self.n_states), matvec=self.matvec, dtype=self.dtype)
+
+    def product_distribution(self, marginals: list[np.ndarray]) -> np.ndarray:
+        """
+            Gemeinsame Verteilung unabhängiger Spieler aus ihren Einzelverteilungen.
+            """
+        tensor = np.asarray(marginals[0], dtype=self.dtype)
+        for marginal in marginals[1:]:
+            tensor = np.multiply.outer(tensor, np.asarray(marginal, dtype=self.dtype))
+        return tensor
+
+    def start_distribution(self) -> np.ndarray:
+        """
+            Alle Spieler auf Los, Zähler 0, frei.
+            """
+        start = np.zeros(self.n_single)
+        start[self.codec.encode(0, 0, False)] = 1.0
+        return self.product_distribution([start] * self.n_players)
+
+    def stationary(self, method: str = "product", tol: float = 1e-10, max_iter: int = 10_000) -> np.ndarray:
+        """
+            Stationäre Verteilung des Rundenoperators.
+
+            Args:
+                method: "product" (exakt: Figuren bewegen sich unabhängig, also Produkt der
+                    Einzelverteilungen) oder "power" (Potenzmethode über matvec)
+                tol: Konvergenztoleranz (L1) für "power"
+                max_iter: Maximale Runden für "power"
+
+            Returns:
+                np.ndarray: Tensor der Form shape
+            """
+        if method == "product":
+            single = solve_stationary(self.move_matrix.astype(float), self.codec).distribution
+            return self.product_distribution([single] * self.n_players)
+        if method != "power":
+            raise ValueError(f"Unbekanntes Verfahren '{method}', erlaubt: ['power', 'product']")
+
+        tensor = np.full(self.shape, 1 / self.n_states, dtype=self.dtype)
+        for _ in range(max_iter):
+            next_tensor = self.apply_round(tensor)
+            if np.abs(next_tensor - tensor).sum() < tol:
+                return next_tensor
+            tensor = next_tensor
+        raise RuntimeError(f"Potenzmethode nach {max_iter} Runden nicht konvergiert")
+
+    def transient(self, initial: np.ndarray | None = None, n_rounds: int = 1) -> Iterator[np.ndarray]:
+        """
+            Liefert die gemeinsame Verteilung nach jeder Runde 1..n_rounds.
+            """
+        tensor = self.start_distribution() if initial is None else initial
+        for _ in range(n_rounds):
+            tensor = self.apply_round(tensor)
+            yield tensor
+
+    def marginal(self, tensor: np.ndarray, player: int) -> np.ndarray:
+        """
+            Verteilung eines einzelnen Spielers (Summe über alle anderen Achsen).
+            """
+        other_axes = tuple(axis for axis in range(self.n_players) if axis != player)
+        return tensor.sum(axis=other_axes)
+
+    def field_marginal(self, tensor: np.ndarray, player: int, n_fields: int = 40) -> np.ndarray:
+        return np.bincount(self.codec.positions, weights=self.marginal(tensor, player), minlength=n_fields)
+
+    def first_event_probabilities(self,
+                                  events: dict[int, np.ndarray],
+                                  initial: np.ndarray | None = None,
+                                  max_rounds: int = 1_000,
+                                  tol: float = 1e-10,
+                                  first_player: int = 0) -> dict[int, float]:
+        """
+            Wahrscheinlichkeit, welches Ereignis zuerst eintritt.
+
+            Args:
+                events: {Spieler: Ereignis-Teilmatrix}. Die Teilmatrix enthält den Anteil
+                    der Einzelwurf-Übergänge, die das Ereignis auslösen (elementweise ≤ P),
+                    z.B. landing_event(...) oder TransitionMatrixBuilder.build_passing_go().
+                    Bei per_turn wird sie mit turn_event auf ganze Züge hochgerechnet.
+                initial: Gemeinsame Startverteilung (Standard: alle auf Los)
+                max_rounds: Abbruch nach so vielen Runden
+                tol: Abbruch, sobald die Restmasse darunter liegt
+                first_player: Wer in jeder Runde zuerst zieht
+
+            Returns:
+                {Spieler: Wahrscheinlichkeit, dass sein Ereignis zuerst eintritt}, zusätzlich
+                Schlüssel -1 für die Restmasse ohne Ereignis
+
+            Example:
+                "Landet Gegner B (Spieler 1) auf meinen Straßen, bevor ich (Spieler 0)
+                wieder über Los komme?" → events={1: landing_event(P, codec, fields),
+                0: builder.build_passing_go()}
+            """
+        event_masses = {}
+        remaining_matrices = {}
+        for player, event in events.items():
+            # Ereignismatrix wie die Übergangsmatrix zeilennormieren
+            event = np.asarray(event, dtype=float) / self.row_sums[:, None]
+            if self.per_turn:
+                event = turn_event(self.transition_matrix, event, self.codec)
+            event_masses[player] = event.sum(axis=1).astype(self.dtype)
+            remaining_matrices[player] = (self.move_matrix - event).astype(self.dtype)
+
+        probabilities = {player: 0.0 for player in events}
+        tensor = (self.start_distribution() if initial is None else initial).astype(self.dtype)
+        buffer = np.empty(self.shape, dtype=self.dtype)
+
+        for _ in range(max_rounds):
+            for offset in range(self.n_players):
+                player = (first_player + offset) % self.n_players
+                if player in events:
+                    hit = np.tensordot(tensor, event_masses[player], axes=([player], [0]))
+                    probabilities[player] += float(hit.sum())
+                    self._apply(tensor, remaining_matrices[player], player, out=buffer)
+                else:
+                    self.apply_move(tensor, player, out=buffer)
+                tensor, buffer = buffer, tensor
+            if float(tensor.sum()) < tol:
+                break
+
+        probabilities[-1] = float(tensor.sum())
+        return probabilities
+
+
+def turn_matrix(transition_matrix: np.ndarray, codec: StateCodec) -> np.ndarray:
+    """
+        Zugmatrix: Würfe wiederholen, solange der Spieler nach einem Pasch weiterwürfelt.
+
+        Args:
+            transition_matrix: Zeilennormierte Wurfmatrix P
+            codec: Zustandskodierung
+
+        Returns:
+            np.ndarray: T = (I - P·C)⁻¹ · P · E mit C = Diagonale der freien Zustände mit
+            Zähler > 0 (Spieler würfelt weiter) und E = I - C
+        """
+    continues = (~codec.in_jail & (codec.counters > 0)).astype(float)
+    identity = np.eye(len(continues))
+    return np.linalg.solve(identity - transition_matrix * continues[None, :],
+                           transition_matrix * (1.0 - continues)[None, :])
+
+
+def turn_event(transition_matrix: np.ndarray, event: np.ndarray, codec: StateCodec) -> np.ndarray:
+    """
+        Rechnet eine Ereignis-Teilmatrix von einzelnen Würfen auf ganze Züge hoch.
+
+        Args:
+            transition_matrix: Zeilennormierte Wurfmatrix P
+            event: Ereignis-Teilmatrix G ≤ P (gleich normiert)
+            codec: Zustandskodierung
+
+        Returns:
+            np.ndarray: Anteil der Zugmatrix, bei dem das Ereignis in mindestens einem Wurf
+            des Zuges eintritt: (I - (P - G)·C)⁻¹ · G · (E + C·T)
+        """
+    continues = (~codec.in_jail & (codec.counters > 0)).astype(float)
+    identity = np.eye(len(continues))
+    after_event = np.diag(1.0 - continues) + continues[:, None] * turn_matrix(transition_matrix, codec)
+    return np.linalg.solve(identity - (transition_matrix - event) * continues[None, :], event @ after_event)
+
+
+def landing_event(transition_matrix: np.ndarray, codec: StateCodec, fields: list[int]) -> np.ndarray:
+    """
+        Ereignis-Teilmatrix "Zug endet auf einem der Felder".
+
+        Args:
+            transition_matrix: Einzelspieler-Matrix
+            codec: Zustandskodierung
+            fields: Zielfelder (z.B. eine Farbgruppe)
+
+        Returns:
+            np.ndarray: Kopie der Matrix, in der nur Spalten mit Position in fields erhalten bleiben
+        """
+    mask = np.isin(codec.positions, fields)
+    return np.where(mask[None, :], transition_matrix, 0.0)
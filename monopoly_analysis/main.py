@@ -1,7 +1,5 @@
-import probabilities
+import sys
+from monopoly_analysis.cli import main
 
 if __name__ == "__main__":
-    ini = probabilities.Probabilities()
-    states = ini.create_state_space()
-    matrix = ini.create_transition_matrix(states)
-    print(len(matrix))
+    sys.exit(main())
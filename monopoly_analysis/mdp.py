@@ -0,0 +1,207 @@
+from dataclasses import dataclass, replace
+import numpy as np
+from monopoly_analysis import roi
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import MonopolyState, Probabilities
+from monopoly_analysis.solvers import LRUCache, normalize_rows, solve_stationary
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+ACTIONS = ("roll", "pay", "card")  # Würfeln (auf Pasch hoffen), Strafe zahlen, Freikarte
+
+# Aktionsmatrizen je Regelvariante: (Übergänge, Los-Überquerungen) je Aktion, begrenzt (LRU)
+_cache = LRUCache(max_entries=16)
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
+@dataclass(frozen=True)
+class GamePhase:
+    name: str
+    owned_fraction: float  # Anteil der Straßen im Besitz von Gegnern
+    rent_level: int  # Ausbaustufe der gegnerischen Straßen (0-5)
+    acquisition_level: int  # Erwartete spätere Ausbaustufe eigener Käufe (Bewertung)
+    remaining_rounds: float  # Erwartete Restdauer des Spiels in Runden
+    opponents: int = 3
+
+
+GAME_PHASES = (
+    GamePhase("früh", owned_fraction=0.2, rent_level=0, acquisition_level=3, remaining_rounds=80),
+    GamePhase("mitte", owned_fraction=0.7, rent_level=2, acquisition_level=3, remaining_rounds=40),
+    GamePhase("spät", owned_fraction=1.0, rent_level=4, acquisition_level=4, remaining_rounds=15),
+)
+
+
+@dataclass(frozen=True)
+class MDPResult:
+    phase: GamePhase
+    policy: np.ndarray  # Aktionsindex (ACTIONS) je Zustand
+    values: np.ndarray  # Wert je Zustand (diskontierter Geldfluss)
+    q_values: np.ndarray  # Aktionen × Zustände, unzulässige Aktionen = -inf
+    method: str
+    iterations: int
+
+
+def action_matrices(config: RuleConfig | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+        Zwischengespeicherte Übergangs- und Los-Matrizen je Aktion.
+
+        Returns:
+            (transitions, passing_go): je len(ACTIONS) × n_states × n_states, zeilennormiert.
+            "pay" und "card" verlassen das Gefängnis sofort und würfeln normal
+            (Zeilen aus jail_rounds=1), in allen anderen Zuständen gleichen sie "roll".
+        """
+    config = config if config is not None else RuleConfig()
+    key = config.config_hash()
+    matrices = _cache.get(key)
+    if matrices is None:
+        builder = TransitionMatrixBuilder(Probabilities(config))
+        released = TransitionMatrixBuilder(Probabilities(replace(config, jail_rounds=1)))
+        codec = builder.probabilities.codec
+        jail_states = np.flatnonzero(codec.in_jail)
+
+        roll = builder.build()
+        roll_passing = builder.build_passing_go()
+        leave, leave_passing = roll.copy(), roll_passing.copy()
+        leave[jail_states] = released.build_rows(jail_states)
+        leave_passing[jail_states] = released.build_passing_go()[jail_states]
+
+        row_sums = {"roll": roll.sum(axis=1), "leave": leave.sum(axis=1)}
+        transitions = np.stack([normalize_rows(roll), normalize_rows(leave), normalize_rows(leave)])
+        passing_go = np.stack([roll_passing / row_sums["roll"][:, None],
+                               leave_passing / row_sums["leave"][:, None],
+                               leave_passing / row_sums["leave"][:, None]])
+        for array in (transitions, passing_go):
+            array.setflags(write=False)
+        matrices = (transitions, passing_go)
+        _cache.put(key, matrices)
+    return matrices
+
+
+class JailMDP:
+    """
+        Markov-Entscheidungsprozess über dem bestehenden Zustandsraum (ein Schritt = ein Wurf).
+
+        In Gefängniszuständen wählt der Spieler zwischen Würfeln, Bezahlen und (falls
+        vorhanden) der Freikarte; sonst gibt es nur "roll". Die Belohnung eines Wurfs ist der
+        erwartete Geldfluss auf dem Zielfeld: Miete an Gegner, Steuern, Gehalt über Los und
+        der Wert einer Kaufgelegenheit (Kauf nur, wenn er sich laut ROI-Modell bis Spielende
+        lohnt). Das Optimum hängt daher von der Spielphase ab.
+        """
+
+    def __init__(self,
+                 config: RuleConfig | None = None,
+                 discount: float = 0.98,
+                 card_value: float | None = None):
+        """
+            Args:
+                config: Regelvariante
+                discount: Diskontfaktor je Wurf
+                card_value: Wert einer Freikarte (Verkaufswert); None = keine Karte vorhanden
+            """
+        self.config = config if config is not None else RuleConfig()
+        self.discount = discount
+        self.probabilities = Probabilities(self.config)
+        self.game_version = self.probabilities.game_version
+        self.codec = self.probabilities.codec
+        self.transitions, self.passing_go = action_matrices(self.config)
+
+        self.allowed = np.ones((len(ACTIONS), self.codec.n_states), dtype=bool)
+        self.allowed[1:] = self.codec.in_jail
+        if card_value is None:
+            self.allowed[ACTIONS.index("card")] = False
+
+        jail_fine = self.game_version.jail_fine
+        self.action_costs = np.zeros((len(ACTIONS), self.codec.n_states))
+        self.action_costs[ACTIONS.index("pay")] = jail_fine
+        self.action_costs[ACTIONS.index("card")] = card_value if card_value is not None else 0.0
+        # Letzte Runde: ohne Pasch muss man die Strafe zahlen
+        last_round = self.codec.in_jail & (self.codec.counters >= self.game_version.jail_rounds - 1)
+        self.action_costs[ACTIONS.index("roll"), last_round] = jail_fine * sum(
+            self.probabilities.non_doubles_probabilities.values())
+
+        stationary = solve_stationary(self.transitions[0], self.codec)
+        self.landing_rates = roi.landings_per_turn(stationary.distribution, self.codec)
+
+    def field_rewards(self, phase: GamePhase) -> np.ndarray:
+        """
+            Erwarteter Geldfluss beim Landen auf jedem Feld (Länge n_fields).
+            """
+        table = roi.property_table(self.game_version)
+        investments = roi.evaluate_investments(self.landing_rates, self.game_version, opponents=(phase.opponents,))
+        level = investments[investments["level"] == phase.acquisition_level]
+        acquisition = np.maximum(0.0, level["income_per_round"] * phase.remaining_rounds - level["investment"])
+
+        rewards = np.zeros(self.codec.n_fields)
+        rewards[table["field"]] = (-phase.owned_fraction * table["rents"][:, phase.rent_level]
+                                   + (1 - phase.owned_fraction) * acquisition)
+        for field, tax in self.game_version.tax_fields.items():
+            rewards[field] -= tax
+        return rewards
+
+    def rewards(self, phase: GamePhase) -> np.ndarray:
+        """
+            Erwartete Sofortbelohnung je Aktion und Zustand (Aktionen × Zustände).
+            """
+        state_rewards = np.where(self.codec.in_jail, 0.0, self.field_rewards(phase)[self.codec.positions])
+        salary = self.game_version.salary * self.passing_go.sum(axis=2)
+        return self.transitions @ state_rewards + salary - self.action_costs
+
+    def _q_values(self, rewards: np.ndarray, values: np.ndarray) -> np.ndarray:
+        q_values = rewards + self.discount * (self.transitions @ values)
+        return np.where(self.allowed, q_values, -np.inf)
+
+    def value_iteration(self, phase: GamePhase, tol: float = 1e-8, max_iter: int = 100_000) -> MDPResult:
+        rewards = self.rewards(phase)
+        values = np.zeros(self.codec.n_states)
+        for iteration in range(1, max_iter + 1):
+            q_values = self._q_values(rewards, values)
+            next_values = q_values.max(axis=0)
+            # Abbruch mit Fehlerschranke ||V - V*|| ≤ γ/(1-γ)·||ΔV||
+            done = np.abs(next_values - values).max() * self.discount / (1 - self.discount) < tol
+            values = next_values
+            if done:
+                break
+        q_values = self._q_values(rewards, values)
+        return MDPResult(phase, q_values.argmax(axis=0), values, q_values, "value", iteration)
+
+    def policy_iteration(self, phase: GamePhase, max_iter: int = 100) -> MDPResult:
+        rewards = self.rewards(phase)
+        states = np.arange(self.codec.n_states)
+        policy = np.zeros(self.codec.n_states, dtype=int)  # Start: immer würfeln
+        identity = np.eye(self.codec.n_states)
+        for iteration in range(1, max_iter + 1):
+            # Bewertung: (I - γ·P_π)·V = R_π
+            values = np.linalg.solve(identity - self.discount * self.transitions[policy, states],
+                                     rewards[policy, states])
+            q_values = self._q_values(rewards, values)
+            # Verbesserung nur bei echtem Vorteil, sonst kreist die Iteration bei Gleichstand
+            improved = q_values.max(axis=0) > q_values[policy, states] + 1e-9 * np.abs(values).max()
+            if not improved.any():
+                break
+            policy = np.where(improved, q_values.argmax(axis=0), policy)
+        return MDPResult(phase, policy, values, q_values, "policy", iteration)
+
+    def solve(self, phases: tuple[GamePhase, ...] = GAME_PHASES, method: str = "policy") -> dict[str, MDPResult]:
+        """
+            Optimale Strategie für jede Spielphase.
+
+            Args:
+                phases: Spielphasen (Standard: GAME_PHASES)
+                method: "policy" (Politik-Iteration) oder "value" (Wert-Iteration)
+
+            Returns:
+                {Phasenname: MDPResult}
+            """
+        solvers = {"policy": self.policy_iteration, "value": self.value_iteration}
+        if method not in solvers:
+            raise ValueError(f"Unbekanntes Verfahren '{method}', erlaubt: {sorted(solvers)}")
+        return {phase.name: solvers[method](phase) for phase in phases}
+
+    def policy_table(self, result: MDPResult) -> dict[MonopolyState, str]:
+        """
+            Gewählte Aktion je Gefängniszustand, z.B. {MonopolyState(10, 0, True): "pay", ...}.
+            """
+        return {self.codec.to_state(index): ACTIONS[result.policy[index]]
+                for index in np.flatnonzero(self.codec.in_jail)}
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from collections import Counter, defaultdict
 import numpy as np
 from monopoly_analysis import game_board
+from monopoly_analysis.state_codec import StateCodec
 
 
 @dataclass(frozen=True)
@@ -15,13 +16,15 @@ class MonopolyState:
 
 
 class Probabilities:
-    def __init__(self):
-        self.game_version = game_board.GermanMonopoly()
+    def __init__(self, rules: game_board.RuleConfig | None = None):
+        self.game_version = game_board.GermanMonopoly(rules)
+        self.rules = self.game_version.rules
         self.doubles_probabilities = self.get_doubles_probabilities()
         self.non_doubles_probabilities = self.get_dice_probabilities(True)
         self.board_fields = self.game_version.board_fields
         self.jail_field = self.game_version.jail_field  # 10 (int)
         self.go_in_jail_field = self.game_version.go_in_jail_field  # 30 (int)
+        self.codec = StateCodec.from_board(self.game_version)
 
     @staticmethod
     def get_dice_probabilities(exclude_doubles: bool = False) -> dict[int, float]:
@@ -110,19 +113,11 @@ class Probabilities:
         prob_per_card = 1 / total_cards
         prob_no_change = (total_cards - pos_changing) / total_cards
 
-        # Feste Ziele (unabhängig vom Quellfeld)
+        # Feste Ziele, danach feldabhängige (nächster Bahnhof, 3 Felder zurück)
         targets = {}
-        for field in self.game_version.chance_card_fixed_targets:
+        for field in self.game_version.get_chance_card_targets(current_pos):
             targets[field] = targets.get(field, 0) + prob_per_card
 
-        # Feldabhängiges Ziel: Nächster Bahnhof
-        next_railroad = self.game_version.get_next_railroad(current_pos)
-        targets[next_railroad] = targets.get(next_railroad, 0) + prob_per_card
-
-        # Feldabhängiges Ziel: 3 Felder zurück
-        three_back = self.game_version.get_three_back(current_pos)
-        targets[three_back] = targets.get(three_back, 0) + prob_per_card
-
         # Keine Positionsänderung (bleibt auf dem Ereignisfeld)
         targets[current_pos] = targets.get(current_pos, 0) + prob_no_change
 
@@ -388,9 +383,10 @@ class Probabilities:
             """
         transitions = {}
         jail_round = state.counter  # 0 = Runde 1, 1 = Runde 2, 2 = Runde 3
+        last_round = self.game_version.jail_rounds - 1
 
-        # Runde 1 oder 2: Nur Pasch befreit
-        if jail_round < 2:
+        # Vor der letzten Runde: Nur Pasch befreit
+        if jail_round < last_round:
             # Kein Pasch → Bleibt im Gefängnis, nächste Runde
             prob_no_double = sum(self.non_doubles_probabilities.values())
             next_jail_state = MonopolyState(self.jail_field, jail_round + 1, True)
@@ -407,7 +403,7 @@ class Probabilities:
                         is_double=False  # Zug endet, kein Weiterwürfeln
                     )
 
-        # Runde 3: Kommt auf jeden Fall raus
+        # Letzte Runde (Standard: Runde 3): Kommt auf jeden Fall raus
         else:
             # Kein Pasch → Frei, zieht Würfelsumme, Zug endet (counter = 0)
             for dice_sum, prob in self.non_doubles_probabilities.items():
@@ -482,7 +478,8 @@ class Probabilities:
             Erstellt die vollständige Übergangsmatrix.
 
             Args:
-                state_space: Liste aller MonopolyState-Objekte (120 Zustände)
+                state_space: Liste aller MonopolyState-Objekte (120 Zustände) in der
+                    Reihenfolge von create_state_space
 
             Returns:
                 np.ndarray: 120×120 Übergangsmatrix
@@ -495,9 +492,6 @@ class Probabilities:
         n_states = len(state_space)
         transition_matrix = np.zeros((n_states, n_states))
 
-        # Index-Lookup für schnellen Zugriff: MonopolyState → Index
-        state_to_index = {state: idx for idx, state in enumerate(state_space)}
-
         # Für jeden Ausgangszustand
         for i, state in enumerate(state_space):
 
@@ -509,13 +503,16 @@ class Probabilities:
 
             # Übergänge in Matrix eintragen
             for target_state, probability in transitions.items():
-                if target_state in state_to_index:
-                    j = state_to_index[target_state]
+                j = self.codec.index_of(target_state.position, target_state.counter, target_state.in_jail)
+                if j >= 0:
                     transition_matrix[i, j] += probability
                 else:
-                    # Sollte nicht passieren - Debugging-Hinweis
-                    print(f"Warnung: Zielzustand {target_state} nicht im state_space!")
+                    self._missing_target(state, target_state)
 
         return transition_matrix
 
+    def _missing_target(self, source_state: MonopolyState, target_state: MonopolyState) -> None:
+        # Sollte nicht passieren - Debugging-Hinweis (zählbar über instrumentation.instrument)
+        print(f"Warnung: Zielzustand {target_state} nicht im state_space!")
+
 
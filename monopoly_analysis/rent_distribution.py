@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+import numpy as np
+from scipy import fft
+from monopoly_analysis import roi
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.solvers import normalize_rows
+from monopoly_analysis.sweep import solve_config
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+@dataclass(frozen=True)
+class RentDistribution:
+    name: str
+    n_turns: int  # Züge je Gegner
+    opponents: int
+    resolution: float  # Breite einer Geld-Zelle
+    offset: int  # Index der ersten Zelle in pmf
+    pmf: np.ndarray  # Wahrscheinlichkeit je Zelle ab offset
+    truncated_mass: float  # Abgeschnittene Randmasse (nicht in pmf enthalten)
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return (self.offset + np.arange(len(self.pmf))) * self.resolution
+
+    def mean(self) -> float:
+        return float(self.amounts @ self.pmf / self.pmf.sum())
+
+    def std(self) -> float:
+        deviation = self.amounts - self.mean()
+        return float(np.sqrt(deviation ** 2 @ self.pmf / self.pmf.sum()))
+
+    def percentile(self, q: float | tuple[float, ...]) -> np.ndarray:
+        """
+            Kleinster Betrag, dessen Verteilungsfunktion mindestens q/100 erreicht.
+            """
+        cdf = np.cumsum(self.pmf) / self.pmf.sum()
+        index = np.searchsorted(cdf, np.asarray(q, dtype=float) / 100 - 1e-12)
+        return self.amounts[np.minimum(index, len(cdf) - 1)]
+
+
+def group_property_sets(game_version=None, level: int = 0) -> dict[str, dict[int, int]]:
+    """
+        Eine vollständige Farbgruppe je Besitz-Set, alle Straßen auf Ausbaustufe level.
+
+        Returns:
+            {Gruppenname: {Feld: Ausbaustufe}}
+        """
+    table = roi.property_table(game_version)
+    return {name: {int(field): level for field in table["field"][table["group"] == group]}
+            for group, name in enumerate(table["group_names"])}
+
+
+class RentDistributionEngine:
+    """
+        Verteilung der kumulierten Mieteinnahmen über die nächsten N Gegnerzüge ohne Monte Carlo.
+
+        Propagiert die gemeinsame Verteilung (Zustand, bisherige Einnahmen) durch die Wurf-Kette
+        aus TransitionMatrixBuilder. Einnahmen liegen auf einem Gitter mit Zellbreite
+        resolution; da die Miete nur vom Zielzustand abhängt, ist ein Wurf ein Matrixprodukt
+        gefolgt von einer Verschiebung jeder Zustandszeile um ihre Miete. Ein Zug endet in
+        einem Zustand ohne Weiterwürfeln (frei mit Zähler 0 oder eingesperrt).
+
+        Mehrere Gegner ziehen unabhängig: Die Summe ist die k-fache Faltung der Einzelverteilung,
+        berechnet als k-te Potenz der erzeugenden Funktion an den Einheitswurzeln (FFT).
+
+        Note:
+            Randzellen mit zusammen weniger als truncation Masse werden nach jedem Zug
+            abgeschnitten, der Speicher wächst daher nur mit der tatsächlichen Streuung.
+            Werke sind nicht unterstützt, ihre Miete hängt von der Augenzahl ab.
+        """
+
+    def __init__(self,
+                 config: RuleConfig | None = None,
+                 resolution: float | None = None,
+                 truncation: float = 1e-12):
+        """
+            Args:
+                config: Regelvariante
+                resolution: Zellbreite des Geld-Gitters; Mieten werden darauf gerundet
+                    (bei 10 etwa die Grundmieten 2 und 4 der Badstraße/Turmstraße auf 0).
+                    None = größter gemeinsamer Teiler der Mieten je Besitz-Set, exakt
+                truncation: Höchstens abgeschnittene Randmasse je Zug
+            """
+        self.config = config if config is not None else RuleConfig()
+        self.resolution = resolution
+        self.truncation = truncation
+        point = solve_config(self.config)
+        self.transition_matrix = normalize_rows(point.transition_matrix)
+        probabilities = Probabilities(self.config)
+        self.game_version = probabilities.game_version
+        self.codec = probabilities.codec
+        self.turn_end = self.codec.in_jail | (self.codec.counters == 0)
+
+        # Zugbeginn: stationäre Verteilung auf den Zug-Endzuständen
+        start = np.where(self.turn_end, point.distribution, 0.0)
+        self.start = start / start.sum()
+
+    def rent_vector(self, holdings: dict[int, int]) -> np.ndarray:
+        """
+            Miete je Feld für einen Besitz {Feld: Ausbaustufe}.
+
+            Note:
+                Unbebaute Straßen einer vollständigen Farbgruppe kosten die doppelte Grundmiete,
+                Bahnhöfe richten sich nach der Anzahl im Besitz (Ausbaustufe wird ignoriert).
+            """
+        table = roi.property_table(self.game_version)
+        row_of = {int(field): row for row, field in enumerate(table["field"])}
+        railroads = [field for field in holdings if field in self.game_version.railroad_names]
+        rents = np.zeros(self.codec.n_fields)
+        for field, level in holdings.items():
+            if field in row_of:
+                row = row_of[field]
+                group_fields = table["field"][table["group"] == table["group"][row]]
+                full_set = all(int(member) in holdings for member in group_fields)
+                rents[field] = table["rents"][row, level] * (2 if full_set and level == 0 else 1)
+            elif field in railroads:
+                rents[field] = self.game_version.railroad_rents[len(railroads) - 1]
+            else:
+                raise ValueError(f"Feld {field} ist keine Straße und kein Bahnhof")
+        return rents
+
+    def grid_resolution(self, rents: np.ndarray) -> float:
+        """
+            Zellbreite für einen Mietvektor: resolution, sonst der ggT aller Mieten.
+            """
+        if self.resolution is not None:
+            return self.resolution
+        amounts = np.rint(rents[rents > 0]).astype(np.int64)
+        return float(np.gcd.reduce(amounts)) if len(amounts) else 1.0
+
+    def _trim(self, joint: np.ndarray, offset: int) -> tuple[np.ndarray, int, float]:
+        # Schneidet Randzellen mit zusammen < truncation Masse ab (je Hälfte unten und oben)
+        mass = joint.sum(axis=0) if joint.ndim == 2 else joint
+        lower = np.cumsum(mass)
+        upper = np.cumsum(mass[::-1])
+        start = int(np.searchsorted(lower, self.truncation / 2, side="right"))
+        stop = len(mass) - int(np.searchsorted(upper, self.truncation / 2, side="right"))
+        if start >= stop:
+            return joint, offset, 0.0
+        dropped = float(mass[:start].sum() + mass[stop:].sum())
+        return joint[..., start:stop], offset + start, dropped
+
+    def _single_opponent(self,
+                         rents: np.ndarray,
+                         n_turns: int,
+                         resolution: float) -> tuple[np.ndarray, int, float]:
+        state_shift = np.where(self.codec.in_jail, 0, np.rint(rents[self.codec.positions] / resolution))
+        state_shift = state_shift.astype(np.int64)
+        shifts = [(shift, np.flatnonzero(state_shift == shift)) for shift in np.unique(state_shift)]
+        max_shift = int(state_shift.max())
+        matrix_t = self.transition_matrix.T
+
+        joint = self.start[:, None]  # Zustände × Geld-Zellen ab offset
+        offset, truncated = 0, 0.0
+        for _ in range(n_turns):
+            pending = joint
+            done = np.zeros((self.codec.n_states, joint.shape[1]))
+            while pending.any():
+                moved = matrix_t @ pending
+                width = moved.shape[1]
+                shifted = np.zeros((self.codec.n_states, width + max_shift))
+                for shift, states in shifts:
+                    shifted[states, shift:shift + width] = moved[states]
+                done = np.pad(done, ((0, 0), (0, max_shift)))
+                done[self.turn_end] += shifted[self.turn_end]
+                shifted[self.turn_end] = 0.0
+                pending = shifted
+            joint, offset, dropped = self._trim(done, offset)
+            truncated += dropped
+        return joint.sum(axis=0), offset, truncated
+
+    def distribution(self,
+                     holdings: dict[int, int],
+                     n_turns: int,
+                     opponents: int = 1,
+                     name: str = "") -> RentDistribution:
+        """
+            Verteilung der Mieteinnahmen aus holdings über n_turns Züge jedes Gegners.
+
+            Args:
+                holdings: Besitz {Feld: Ausbaustufe}
+                n_turns: Züge je Gegner
+                opponents: Anzahl unabhängiger Gegner
+                name: Bezeichnung des Besitz-Sets
+
+            Returns:
+                RentDistribution
+            """
+        if n_turns < 0 or opponents < 1:
+            raise ValueError(f"Ungültige Anzahl Züge ({n_turns}) oder Gegner ({opponents})")
+        rents = self.rent_vector(holdings)
+        resolution = self.grid_resolution(rents)
+        pmf, offset, truncated = self._single_opponent(rents, n_turns, resolution)
+        if opponents > 1:
+            size = opponents * (len(pmf) - 1) + 1
+            n_fft = fft.next_fast_len(size, real=True)
+            pmf = fft.irfft(fft.rfft(pmf, n_fft) ** opponents, n_fft)[:size]
+            # Rundungsrauschen der FFT liegt bei ~1e-17 und kann negativ sein
+            pmf = np.maximum(pmf, 0.0)
+            offset *= opponents
+            truncated = 1 - (1 - truncated) ** opponents
+            pmf, offset, dropped = self._trim(pmf, offset)
+            truncated += dropped
+        return RentDistribution(name, n_turns, opponents, resolution, offset, pmf, truncated)
+
+    def percentile_table(self,
+                         property_sets: dict[str, dict[int, int]] | None = None,
+                         n_turns: int = 20,
+                         opponents: int = 1,
+                         percentiles: tuple[float, ...] = PERCENTILES) -> np.ndarray:
+        """
+            Mittelwert, Streuung und Perzentile der Einnahmen für jedes Besitz-Set.
+
+            Args:
+                property_sets: {Name: {Feld: Ausbaustufe}}; Standard: jede Farbgruppe unbebaut
+                n_turns: Züge je Gegner
+                opponents: Anzahl Gegner
+                percentiles: Perzentile in Prozent
+
+            Returns:
+                np.ndarray: Strukturiertes Array mit property_set, mean, std, truncated_mass und
+                percentiles (ein Wert je angefragtem Perzentil)
+            """
+        property_sets = property_sets if property_sets is not None else group_property_sets(self.game_version)
+        dtype = np.dtype([("property_set", "U40"), ("mean", np.float64), ("std", np.float64),
+                          ("truncated_mass", np.float64), ("percentiles", np.float64, (len(percentiles),))])
+        table = np.empty(len(property_sets), dtype=dtype)
+        for row, (name, holdings) in enumerate(property_sets.items()):
+            result = self.distribution(holdings, n_turns, opponents, name)
+            table[row] = (name, result.mean(), result.std(), result.truncated_mass, result.percentile(percentiles))
+        return table
@@ -0,0 +1,121 @@
+import numpy as np
+from monopoly_analysis import game_board
+from monopoly_analysis.state_codec import StateCodec
+
+ROI_DTYPE = np.dtype([
+    ("scenario", np.int32),
+    ("field", np.int16),
+    ("level", np.int8),  # 0-4 Häuser, 5 = Hotel
+    ("opponents", np.int8),
+    ("investment", np.float64),  # Kaufpreis + Häuser
+    ("rent", np.float64),  # Miete je Landung
+    ("expected_rent", np.float64),  # Erwartete Miete je Gegnerzug
+    ("income_per_round", np.float64),  # Summe über alle Gegner
+    ("roi", np.float64),  # income_per_round / investment
+    ("break_even_rounds", np.float64),  # investment / income_per_round
+])
+
+
+def property_table(game_version=None) -> dict[str, np.ndarray]:
+    """
+        Straßendaten des Spielbretts als Spalten-Arrays.
+
+        Returns:
+            {"field", "price", "house_cost", "rents" (n × 6), "group" (Gruppenindex),
+             "names", "group_names"}
+        """
+    game_version = game_version if game_version is not None else game_board.GermanMonopoly()
+    fields = sorted(game_version.streets)
+    streets = [game_version.streets[field] for field in fields]
+    group_names = list(dict.fromkeys(street.color_group for street in streets))
+    return {
+        "field": np.array(fields),
+        "price": np.array([street.price for street in streets], dtype=float),
+        "house_cost": np.array([street.house_cost for street in streets], dtype=float),
+        "rents": np.array([street.rents for street in streets], dtype=float),
+        "group": np.array([group_names.index(street.color_group) for street in streets]),
+        "names": [street.name for street in streets],
+        "group_names": group_names,
+    }
+
+
+def landings_per_turn(distribution: np.ndarray, codec: StateCodec | None = None) -> np.ndarray:
+    """
+        Erwartete Landungen je Feld pro Zug aus einer stationären Wurf-Verteilung.
+
+        Args:
+            distribution: Stationäre Verteilung je Zustand (Wurf-Kette, z.B. solve_stationary)
+            codec: Zustandskodierung
+
+        Returns:
+            np.ndarray: Landungen je Feld und Zug (Länge 40)
+
+        Note:
+            Ein Zug besteht aus 1-3 Würfen. Der Anteil der Würfe, die einen Zug beenden, ist
+            die Masse der Zustände ohne Weiterwürfeln (frei mit Zähler 0 oder eingesperrt).
+            Eingesperrt zu sein ist keine Landung auf Feld 10.
+        """
+    codec = codec if codec is not None else StateCodec()
+    distribution = np.asarray(distribution)
+    turn_ends = codec.in_jail | (codec.counters == 0)
+    landed = np.where(codec.in_jail, 0.0, distribution)
+    return np.bincount(codec.positions, weights=landed, minlength=codec.n_fields) / distribution[turn_ends].sum()
+
+
+def evaluate_investments(landing_rates: np.ndarray,
+                         game_version=None,
+                         opponents: tuple[int, ...] = (1, 2, 3, 4, 5),
+                         full_set: bool = False) -> np.ndarray:
+    """
+        Erwartete Miete, ROI und Break-Even für alle Straßen × Ausbaustufen × Gegnerzahlen.
+
+        Args:
+            landing_rates: Landungen je Feld und Gegnerzug, Form (40,) oder (Szenarien, 40),
+                z.B. landings_per_turn(...) für mehrere Regelvarianten oder Spielphasen
+            game_version: Spielbrett mit Straßendaten
+            opponents: Anzahl der Gegner, die reihum ziehen
+            full_set: True = Stufe 0 mit vollständiger Farbgruppe (doppelte Grundmiete)
+
+        Returns:
+            np.ndarray: Strukturiertes Array (ROI_DTYPE), eine Zeile je
+            Szenario × Straße × Stufe × Gegnerzahl, ohne Python-Schleife über Straßen berechnet
+        """
+    table = property_table(game_version)
+    landing_rates = np.atleast_2d(np.asarray(landing_rates, dtype=float))
+    n_scenarios = landing_rates.shape[0]
+    n_levels = table["rents"].shape[1]
+    opponent_counts = np.asarray(opponents, dtype=float)
+
+    rents = table["rents"].copy()
+    if full_set:
+        rents[:, 0] *= 2
+    investment = table["price"][:, None] + np.arange(n_levels)[None, :] * table["house_cost"][:, None]
+
+    # Achsen: Szenario × Straße × Stufe × Gegner
+    expected_rent = landing_rates[:, table["field"], None] * rents[None, :, :]
+    income = expected_rent[..., None] * opponent_counts[None, None, None, :]
+    shape = income.shape
+
+    result = np.empty(income.size, dtype=ROI_DTYPE)
+    grids = np.meshgrid(np.arange(n_scenarios), table["field"], np.arange(n_levels), opponent_counts, indexing="ij")
+    for name, grid in zip(("scenario", "field", "level", "opponents"), grids):
+        result[name] = grid.ravel()
+    result["investment"] = np.broadcast_to(investment[None, :, :, None], shape).ravel()
+    result["rent"] = np.broadcast_to(rents[None, :, :, None], shape).ravel()
+    result["expected_rent"] = np.broadcast_to(expected_rent[..., None], shape).ravel()
+    result["income_per_round"] = income.ravel()
+    result["roi"] = result["income_per_round"] / result["investment"]
+    with np.errstate(divide="ignore"):
+        result["break_even_rounds"] = np.where(result["income_per_round"] > 0,
+                                               result["investment"] / result["income_per_round"], np.inf)
+    return result
+
+
+def rank_investments(results: np.ndarray, key: str = "roi", top: int | None = None) -> np.ndarray:
+    """
+        Sortiert die Zeilen aus evaluate_investments absteigend nach key (Break-Even aufsteigend).
+        """
+    order = np.argsort(results[key], kind="stable")
+    if key != "break_even_rounds":
+        order = order[::-1]
+    return results[order[:top]]
@@ -0,0 +1,148 @@
+from dataclasses import dataclass, replace
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.solvers import solve_stationary
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+@dataclass(frozen=True)
+class SensitivityResult:
+    parameters: list[str]
+    jacobian: np.ndarray  # Parameter × Felder: ∂π_Feld / ∂θ
+    state_jacobian: np.ndarray  # Parameter × Zustände: ∂π_Zustand / ∂θ
+    field_probabilities: np.ndarray  # Stationäre Verteilung je Feld am Arbeitspunkt
+
+    def __getitem__(self, parameter: str) -> np.ndarray:
+        return self.jacobian[self.parameters.index(parameter)]
+
+
+class StationarySensitivity:
+    """
+        Ableitungen der stationären Verteilung nach Regelparametern ohne erneutes Lösen.
+
+        Für eine stochastische Matrix P mit stationärem π und eine Störung ∂P mit
+        Zeilensummen 0 gilt ∂π = π·∂P·Z mit der Fundamentalmatrix Z = (I - P + 1·π)⁻¹.
+        Z wird einmal LU-zerlegt; alle Parameter werden dann in einem Batch gelöst.
+
+        Kartenparameter gehen linear in den Landekern ein, ∂P entsteht daher exakt über
+        denselben Scatter-Plan wie die Matrix selbst (TransitionMatrixBuilder._assemble).
+        """
+
+    def __init__(self, probabilities: Probabilities | None = None):
+        self.probabilities = probabilities if probabilities is not None else Probabilities()
+        self.game_version = self.probabilities.game_version
+        self.codec = self.probabilities.codec
+        self.builder = TransitionMatrixBuilder(self.probabilities)
+
+        matrix = self.builder.build()
+        # Rundung der Würfelwahrscheinlichkeiten: Zeilensummen ≠ 1, Störungen erhalten sie
+        self.row_sums = matrix.sum(axis=1)
+        self.transition_matrix = matrix / self.row_sums[:, None]
+        self.distribution = np.array(solve_stationary(self.transition_matrix, self.codec).distribution)
+
+        n_states = self.codec.n_states
+        fundamental = np.eye(n_states) - self.transition_matrix + np.outer(np.ones(n_states), self.distribution)
+        self._lu = lu_factor(fundamental)
+
+    def _card_row(self, target_field: int, kernel: np.ndarray) -> np.ndarray:
+        # Kernzeile einer Karte mit Ziel target_field (Gemeinschaftsfeld → dortige Karten)
+        if target_field in self.game_version.community_fields:
+            return kernel[target_field]
+        row = np.zeros(self.builder.n_fields + 1)
+        row[self.builder._resolve_column(target_field, from_card=True)] = 1.0
+        return row
+
+    def kernel_derivatives(self) -> dict[str, np.ndarray]:
+        """
+            Ableitung des Landekerns nach der Wahrscheinlichkeit jeder positionsändernden Karte.
+
+            Returns:
+                {Parametername: 40×41}; die Karte "keine Positionsänderung" gleicht aus,
+                sodass Kernzeilen weiterhin Summe 1 haben
+            """
+        game_version = self.game_version
+        kernel = self.builder.landing_kernel
+        prob_per_card = 1 / game_version.total_cards
+        derivatives = {}
+
+        for index, target_field in enumerate(game_version.community_chest_fixed_targets):
+            derivative = np.zeros_like(kernel)
+            for field in game_version.community_fields:
+                derivative[field] = self._card_row(target_field, kernel)
+                derivative[field, field] -= 1.0
+            derivatives[f"community_chest_fixed_targets[{index}]"] = derivative
+
+        # Ereigniskarten, die auf ein Gemeinschaftsfeld führen, erben dessen Ableitung
+        for name, derivative in derivatives.items():
+            for field in game_version.chance_fields:
+                for target_field in game_version.get_chance_card_targets(field):
+                    if target_field in game_version.community_fields:
+                        derivative[field] += prob_per_card * derivative[target_field]
+
+        chance_names = [f"chance_card_fixed_targets[{index}]"
+                        for index in range(len(game_version.chance_card_fixed_targets))]
+        if game_version.chance_next_railroad:
+            chance_names.append("chance_next_railroad")
+        if game_version.chance_three_back:
+            chance_names.append("chance_three_back")
+        for index, name in enumerate(chance_names):
+            derivative = np.zeros_like(kernel)
+            for field in game_version.chance_fields:
+                target_field = game_version.get_chance_card_targets(field)[index]
+                derivative[field] = self._card_row(target_field, kernel)
+                derivative[field, field] -= 1.0
+            derivatives[name] = derivative
+
+        # total_cards: alle Karten gleichzeitig, ∂(1/N)/∂N = -1/N²
+        derivatives["total_cards"] = -prob_per_card ** 2 * sum(derivatives.values())
+        return derivatives
+
+    def matrix_derivatives(self) -> tuple[list[str], np.ndarray]:
+        """
+            ∂P/∂θ für alle Parameter (bezogen auf die zeilennormierte Matrix).
+
+            Returns:
+                (parameters, derivatives): derivatives hat die Form Parameter × n_states × n_states
+
+            Note:
+                Gefängnisregeln werden stetig gemacht: jail_release_round[r] ist die
+                Wahrscheinlichkeit, in Runde r+1 (vor der letzten) sofort freizukommen
+                (bezahlen und normal würfeln) statt auf einen Pasch zu hoffen.
+            """
+        parameters = []
+        derivatives = []
+        for name, kernel_derivative in self.kernel_derivatives().items():
+            parameters.append(name)
+            derivatives.append(self.builder._assemble(self.builder.non_doubles_shift @ kernel_derivative,
+                                                      self.builder.doubles_shift @ kernel_derivative,
+                                                      0.0, 0.0))
+
+        jail_states = self.codec.index_table[self.probabilities.jail_field, :, 1]
+        released = TransitionMatrixBuilder(Probabilities(replace(self.game_version.rules, jail_rounds=1)))
+        released_rows = released.build_rows(jail_states)
+        current_rows = self.builder.build_rows(jail_states)
+        for jail_round in range(self.game_version.jail_rounds - 1):
+            derivative = np.zeros((self.codec.n_states, self.codec.n_states))
+            derivative[jail_states[jail_round]] = released_rows[jail_round] - current_rows[jail_round]
+            parameters.append(f"jail_release_round[{jail_round}]")
+            derivatives.append(derivative)
+
+        return parameters, np.stack(derivatives) / self.row_sums[None, :, None]
+
+    def jacobian(self) -> SensitivityResult:
+        """
+            Jacobi-Matrix der stationären Verteilung nach allen Parametern in einem Aufruf.
+
+            Returns:
+                SensitivityResult: jacobian[p, f] = ∂π_f/∂θ_p. Für eine Änderung Δθ gilt in
+                erster Ordnung Δπ ≈ Δθ·jacobian[p], z.B. Karte "3 Felder zurück" entfernen:
+                Δθ = -1/total_cards
+            """
+        parameters, derivatives = self.matrix_derivatives()
+        rhs = np.einsum("s,kst->kt", self.distribution, derivatives)  # π·∂P je Parameter
+        state_jacobian = lu_solve(self._lu, rhs.T, trans=1).T  # (π·∂P)·Z
+        field_matrix = np.zeros((self.codec.n_states, self.codec.n_fields))
+        field_matrix[np.arange(self.codec.n_states), self.codec.positions] = 1.0
+        field_probabilities = self.distribution @ field_matrix
+        return SensitivityResult(parameters, state_jacobian @ field_matrix, state_jacobian, field_probabilities)
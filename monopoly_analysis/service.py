@@ -0,0 +1,278 @@
+"""
+    Lokaler HTTP/JSON-Dienst für Dashboards (nur Standardbibliothek + asyncio).
+
+    Endpunkte:
+        GET  /health
+        GET  /metrics                 Latenzen, Durchsatz, Cache-Zähler
+        POST /landing   {"config": {...}}
+        POST /roi       {"config": {...}, "fields": [39], "levels": [3], "opponents": [3], "full_set": false}
+
+    Aufruf:
+        python -m monopoly_analysis.service --port 8765 --workers 4
+    """
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+import numpy as np
+from monopoly_analysis import roi
+from monopoly_analysis.game_board import GermanMonopoly, RuleConfig
+from monopoly_analysis.state_codec import StateCodec
+from monopoly_analysis.sweep import MatrixCache, SweepPoint, solve_config
+
+MAX_BODY_BYTES = 1 << 20
+
+
+class ServiceMetrics:
+    """
+        Zähler und Latenzen je Endpunkt (Latenzen der letzten window Anfragen).
+        """
+
+    def __init__(self, window: int = 10_000):
+        self.started = time.perf_counter()
+        self.window = window
+        self.requests: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.latencies: dict[str, deque] = {}
+        self.builds = 0
+        self.coalesced = 0
+
+    def record(self, route: str, seconds: float, failed: bool) -> None:
+        self.requests[route] = self.requests.get(route, 0) + 1
+        if failed:
+            self.errors[route] = self.errors.get(route, 0) + 1
+        self.latencies.setdefault(route, deque(maxlen=self.window)).append(seconds)
+
+    def report(self, cache: MatrixCache) -> dict:
+        uptime = time.perf_counter() - self.started
+        routes = {}
+        for route, latencies in self.latencies.items():
+            milliseconds = np.array(latencies) * 1e3
+            routes[route] = {
+                "requests": self.requests[route],
+                "errors": self.errors.get(route, 0),
+                "throughput_per_s": self.requests[route] / uptime,
+                "latency_ms": {"mean": float(milliseconds.mean()),
+                               **{f"p{q}": float(np.percentile(milliseconds, q)) for q in (50, 95, 99)}},
+            }
+        return {
+            "uptime_s": uptime,
+            "requests": sum(self.requests.values()),
+            "throughput_per_s": sum(self.requests.values()) / uptime,
+            "routes": routes,
+            "solver": {"builds": self.builds, "coalesced": self.coalesced, "cache_hits": cache.hits,
+                       "cache_misses": cache.misses, "cached_configs": len(cache),
+                       "max_cached_configs": cache.max_entries},
+        }
+
+
+class RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class QueryService:
+    """
+        Beantwortet Abfragen zu Regelvarianten; gelöste Varianten liegen in einem begrenzten LRU.
+
+        Gleichzeitige Anfragen für dieselbe, noch nicht gelöste Variante teilen sich einen
+        einzigen Aufbau (gemeinsames Future). Aufbau und Lösung laufen in einem Prozesspool,
+        die Event-Loop bleibt frei; ROI-Auswertungen sind klein und laufen direkt.
+        """
+
+    def __init__(self, n_workers: int | None = None, max_entries: int = 128, executor: Executor | None = None):
+        """
+            Args:
+                n_workers: Prozesse für den Aufbau (Standard: os.cpu_count())
+                max_entries: Höchstzahl gelöster Regelvarianten im Speicher
+                executor: Eigener Executor statt des Prozesspools (z.B. für Tests)
+            """
+        self.executor = executor if executor is not None else ProcessPoolExecutor(n_workers or os.cpu_count())
+        self.cache = MatrixCache(max_entries)
+        self.metrics = ServiceMetrics()
+        self._pending: dict[str, asyncio.Future] = {}
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/metrics"): self.metrics_report,
+            ("POST", "/landing"): self.landing,
+            ("POST", "/roi"): self.roi,
+        }
+
+    async def solved(self, config: RuleConfig) -> SweepPoint:
+        point = self.cache.get(config)
+        if point is not None:
+            return point
+        key = config.config_hash()
+        if key in self._pending:
+            self.metrics.coalesced += 1
+            return await asyncio.shield(self._pending[key])
+
+        future = asyncio.get_running_loop().run_in_executor(self.executor, solve_config, config)
+        self._pending[key] = future
+        self.metrics.builds += 1
+        try:
+            point = await asyncio.shield(future)
+        finally:
+            del self._pending[key]
+        self.cache.put(point)
+        return point
+
+    @staticmethod
+    def _config(payload: dict) -> RuleConfig:
+        try:
+            return RuleConfig(**payload.get("config", {}))
+        except (TypeError, ValueError) as error:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Ungültige Regelvariante: {error}") from error
+
+    async def health(self, payload: dict) -> dict:
+        return {"status": "ok"}
+
+    async def metrics_report(self, payload: dict) -> dict:
+        return self.metrics.report(self.cache)
+
+    async def landing(self, payload: dict) -> dict:
+        config = self._config(payload)
+        point = await self.solved(config)
+        codec = StateCodec.from_board(GermanMonopoly(config))
+        return {"config_hash": config.config_hash(),
+                "field_probabilities": point.field_probabilities.tolist(),
+                "landings_per_turn": roi.landings_per_turn(point.distribution, codec).tolist()}
+
+    async def roi(self, payload: dict) -> dict:
+        config = self._config(payload)
+        point = await self.solved(config)
+        game_version = GermanMonopoly(config)
+        landing_rates = roi.landings_per_turn(point.distribution, StateCodec.from_board(game_version))
+        results = roi.evaluate_investments(landing_rates, game_version, opponents=tuple(payload.get("opponents", (3,))),
+                                           full_set=bool(payload.get("full_set", False)))
+        selected = np.ones(len(results), dtype=bool)
+        if "fields" in payload:
+            selected &= np.isin(results["field"], payload["fields"])
+        if "levels" in payload:
+            selected &= np.isin(results["level"], payload["levels"])
+        rows = results[selected]
+        return {"config_hash": config.config_hash(),
+                "rows": [dict(zip(rows.dtype.names, row.tolist())) for row in rows]}
+
+    async def handle(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, dict]:
+        path = path.split("?", 1)[0]
+        route = self.routes.get((method, path))
+        start = time.perf_counter()
+        status = HTTPStatus.OK
+        try:
+            if route is None:
+                raise RequestError(HTTPStatus.NOT_FOUND, f"Unbekannter Endpunkt {method} {path}")
+            try:
+                payload = json.loads(body) if body else {}
+            except json.JSONDecodeError as error:
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"Ungültiges JSON: {error}") from error
+            if not isinstance(payload, dict):
+                raise RequestError(HTTPStatus.BAD_REQUEST, "JSON-Objekt erwartet")
+            response = await route(payload)
+        except RequestError as error:
+            status, response = error.status, {"error": str(error)}
+        except Exception as error:  # Fehler im Aufbau: Dienst läuft weiter
+            status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"}
+        # Nur bekannte Routen als Schlüssel, sonst wachsen die Metriken mit beliebigen Pfaden
+        self.metrics.record(path if route is not None else "unbekannt", time.perf_counter() - start,
+                            status != HTTPStatus.OK)
+        return status, response
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # HTTP/1.1 mit Keep-Alive; ein Request nach dem anderen je Verbindung
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin1").split()
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    status, response = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Anfrage zu groß"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self.handle(method, path, body)
+                    keep_alive = (headers.get("connection", "").lower() != "close"
+                                  and version.upper() == "HTTP/1.1")
+                data = json.dumps(response).encode()
+                writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Herunterfahren mit offener Keep-Alive-Verbindung: regulär beenden
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.Server:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+
+
+async def request(reader: asyncio.StreamReader,
+                  writer: asyncio.StreamWriter,
+                  method: str,
+                  path: str,
+                  payload: dict | None = None) -> tuple[int, dict]:
+    """
+        Minimaler Client: eine Anfrage über eine bestehende Keep-Alive-Verbindung.
+
+        Returns:
+            (HTTP-Status, JSON-Antwort)
+        """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _run(host: str, port: int, n_workers: int | None, max_entries: int) -> None:
+    service = QueryService(n_workers, max_entries)
+    server = await service.serve(host, port)
+    print(f"Lausche auf http://{host}:{server.sockets[0].getsockname()[1]}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="Prozesse für den Aufbau (Standard: alle Kerne)")
+    parser.add_argument("--max-configs", type=int, default=128, help="Größe des LRU gelöster Regelvarianten")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_run(args.host, args.port, args.workers, args.max_configs))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
+from monopoly_analysis import game_board
+from monopoly_analysis.cards import build_card_tables
+from monopoly_analysis.probabilities import MonopolyState
+from monopoly_analysis.state_codec import StateCodec, state_positions
+
+
+@dataclass
+class SimulationResult:
+    counts: np.ndarray  # Besuche je Zustand (Reihenfolge wie create_state_space)
+    n_turns: int  # Anzahl gezählter Spieler-Züge
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        return self.counts / self.n_turns
+
+    def field_frequencies(self, state_space: list[MonopolyState] | StateCodec, n_fields: int = 40) -> np.ndarray:
+        return np.bincount(state_positions(state_space), weights=self.frequencies, minlength=n_fields)
+
+    def as_state_dict(self, state_space: list[MonopolyState]) -> dict[MonopolyState, float]:
+        return dict(zip(state_space, self.frequencies.tolist()))
+
+
+class MonteCarloSimulator:
+    """
+        Vektorisierte Monte-Carlo-Simulation unabhängiger Spielfiguren.
+
+        Alle N Spieler werden pro NumPy-Schritt um einen Zug (= einen Übergang der
+        Markov-Kette, also einen Wurf) weiterbewegt. Der Zustand liegt als
+        Struct-of-Arrays vor: position, counter, in_jail.
+        """
+
+    def __init__(self, game_version: game_board.GermanMonopoly | None = None):
+        self.game_version = game_version if game_version is not None else game_board.GermanMonopoly()
+        self.n_fields = len(self.game_version.board_fields)
+        self.jail_field = self.game_version.jail_field
+        self.jail_code = self.n_fields
+        self.chance_table, self.community_table = build_card_tables(self.game_version)
+
+        # Ein Zufallswert je Spieler und Wurf kodiert beide Würfel und beide Karten:
+        # draw = Würfelpaar * n_card_pairs + Ereigniskarte * total_cards + Gemeinschaftskarte
+        total_cards = self.game_version.total_cards
+        self.n_card_pairs = total_cards * total_cards
+        self.n_draws = 36 * self.n_card_pairs
+        self.draw_dtype = np.uint16 if self.n_draws <= np.iinfo(np.uint16).max + 1 else np.uint32
+        dice_pairs = np.array([(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)])
+        draws = np.arange(self.n_draws)
+        dice = dice_pairs[draws // self.n_card_pairs]
+        self.double_table = dice[:, 0] == dice[:, 1]
+        # Offset in resolve_table relativ zu position * n_card_pairs
+        self.offset_table = (dice.sum(axis=1) * self.n_card_pairs + draws % self.n_card_pairs).astype(np.int32)
+
+        # resolve_table[(position + Augensumme) * n_card_pairs + Kartenpaar] → Endfeld bzw. jail_code
+        raw_landing = np.arange(self.n_fields + 12) % self.n_fields
+        chance_cards, community_cards = np.divmod(np.arange(self.n_card_pairs), total_cards)
+        self.resolve_table = self.community_table[
+            self.chance_table[raw_landing[:, None], chance_cards[None, :]], community_cards[None, :]
+        ].ravel()
+
+        self.codec = StateCodec.from_board(self.game_version)
+        self.max_counter = self.codec.n_counters - 1
+        self.last_jail_round = self.game_version.jail_rounds - 1
+        # Flacher Index: (position * n_counters + counter) * 2 + in_jail
+        self.flat_index = self.codec.index_table.reshape(-1)
+
+    def step(self,
+             position: np.ndarray,
+             counter: np.ndarray,
+             in_jail: np.ndarray,
+             rng: np.random.Generator) -> None:
+        """
+            Bewegt alle Spieler um einen Wurf weiter (arbeitet in-place).
+
+            Args:
+                position: Feld je Spieler (int16)
+                counter: Pasch-Zähler bzw. Gefängnisrunde je Spieler (int8)
+                in_jail: Eingesperrt je Spieler (bool)
+                rng: Zufallsgenerator
+            """
+        draws = rng.integers(0, self.n_draws, size=position.shape[0], dtype=self.draw_dtype)
+        is_double = self.double_table[draws]
+        released = counter >= self.last_jail_round
+
+        # Dritter Pasch, bzw. Gefängnis: ohne Pasch vor der letzten Runde bleibt man drin
+        third_double = ~in_jail & is_double & (counter == self.max_counter)
+        stays_in_jail = in_jail & ~is_double & ~released
+        moves = ~(third_double | stays_in_jail)
+
+        # Zielfeld, Ereignis- und Gemeinschaftskarte in einem Tabellenzugriff
+        resolved = self.resolve_table[position * np.int32(self.n_card_pairs) + self.offset_table[draws]]
+        jailed = third_double | (moves & (resolved == self.jail_code))
+
+        # Neuer Zähler: frei → Pasch zählt weiter, aus dem Gefängnis nur in der letzten Runde
+        new_counter = np.where(in_jail, is_double & released, np.where(is_double, counter + 1, 0))
+        new_counter = np.where(stays_in_jail, counter + 1, new_counter)
+
+        np.copyto(position, resolved, where=moves)
+        np.copyto(position, self.jail_field, where=jailed)
+        counter[:] = np.where(jailed, 0, new_counter)
+        np.logical_or(jailed, stays_in_jail, out=in_jail)
+
+    def run(self,
+            n_players: int,
+            n_steps: int,
+            burn_in: int = 100,
+            seed: int | np.random.SeedSequence | None = None) -> SimulationResult:
+        """
+            Simuliert n_players unabhängige Spieler über n_steps Würfe.
+
+            Args:
+                n_players: Anzahl paralleler Spieler (Batchgröße)
+                n_steps: Anzahl gezählter Würfe je Spieler
+                burn_in: Würfe vor Beginn der Zählung (Einschwingen ab Los)
+                seed: Startwert für np.random.default_rng
+
+            Returns:
+                SimulationResult: Besuchszähler je MonopolyState
+            """
+        rng = np.random.default_rng(seed)
+        return SimulationResult(counts=self._count_visits(n_players, n_steps, burn_in, rng),
+                                n_turns=n_players * n_steps)
+
+    def _count_visits(self,
+                      n_players: int,
+                      n_steps: int,
+                      burn_in: int,
+                      rng: np.random.Generator) -> np.ndarray:
+        position = np.zeros(n_players, dtype=np.int16)  # alle starten auf Los
+        counter = np.zeros(n_players, dtype=np.int8)
+        in_jail = np.zeros(n_players, dtype=bool)
+        counts = np.zeros(self.codec.n_states, dtype=np.int64)
+        n_counters = self.max_counter + 1
+
+        for _ in range(burn_in):
+            self.step(position, counter, in_jail, rng)
+
+        for _ in range(n_steps):
+            self.step(position, counter, in_jail, rng)
+            flat = (position * n_counters + counter) * 2 + in_jail
+            counts += np.bincount(self.flat_index[flat], minlength=len(counts))
+
+        return counts
+
+    def run_parallel(self,
+                     n_players: int,
+                     n_steps: int,
+                     n_workers: int,
+                     burn_in: int = 100,
+                     seed: int | None = None,
+                     max_batch: int = 1_000_000) -> SimulationResult:
+        """
+            Verteilt eine Simulation auf einen ProcessPoolExecutor.
+
+            Args:
+                n_players: Gesamtzahl Spieler, gleichmäßig auf die Worker verteilt
+                n_steps: Anzahl gezählter Würfe je Spieler
+                n_workers: Anzahl Prozesse
+                burn_in: Würfe vor Beginn der Zählung
+                seed: Startwert der SeedSequence
+                max_batch: Maximale Spieler je NumPy-Batch (begrenzt den Speicher je Worker)
+
+            Returns:
+                SimulationResult: Summe der Besuchszähler aller Worker
+
+            Note:
+                Jeder Worker erhält einen eigenen SeedSequence-Kindstrom und jeder Batch
+                wiederum ein Kind davon. Bei gleichem seed und gleicher Worker-Anzahl ist
+                das Ergebnis bitgenau reproduzierbar. Worker liefern nur ihr Zähler-Array
+                zurück, es gibt keine Kommunikation pro Zug.
+            """
+        worker_seeds = np.random.SeedSequence(seed).spawn(n_workers)
+        worker_players = _split_evenly(n_players, n_workers)
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(_run_worker, self.game_version, players, n_steps, burn_in, worker_seed, max_batch)
+                for players, worker_seed in zip(worker_players, worker_seeds)
+            ]
+            counts = sum(future.result() for future in futures)
+
+        return SimulationResult(counts=counts, n_turns=n_players * n_steps)
+
+
+def _run_worker(game_version,
+                n_players: int,
+                n_steps: int,
+                burn_in: int,
+                seed_sequence: np.random.SeedSequence,
+                max_batch: int) -> np.ndarray:
+    simulator = MonteCarloSimulator(game_version)
+    counts = np.zeros(simulator.codec.n_states, dtype=np.int64)
+    n_batches = max(1, -(-n_players // max_batch))
+    batch_seeds = seed_sequence.spawn(n_batches)
+    for batch_players, batch_seed in zip(_split_evenly(n_players, n_batches), batch_seeds):
+        if batch_players:
+            counts += simulator._count_visits(batch_players, n_steps, burn_in, np.random.default_rng(batch_seed))
+    return counts
+
+
+def _split_evenly(total: int, parts: int) -> list[int]:
+    return [total // parts + (part < total % parts) for part in range(parts)]
@@ -0,0 +1,208 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+from monopoly_analysis.probabilities import MonopolyState
+from monopoly_analysis.state_codec import StateCodec, state_positions
+
+
+@dataclass(frozen=True)
+class StationaryResult:
+    distribution: np.ndarray  # Wahrscheinlichkeit je Zustand (Reihenfolge wie state_space)
+    field_probabilities: np.ndarray  # Summe über Zähler/Gefängnis je Feld (0-39)
+    method: str
+    iterations: int
+    residual: float  # ||πP - π||₁
+
+
+class LRUCache:
+    """
+        Begrenzter Prozess-Cache: Bei mehr als max_entries Einträgen fällt der am längsten
+        nicht benutzte heraus. Module-Caches dürfen in langlebigen Sweep- und Dienst-Prozessen
+        nicht unbegrenzt wachsen.
+        """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def get(self, key, default=None):
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Ergebnisse je (Matrix-Hash, Zustandsraum-Hash, Verfahren, Toleranz, Iterationsgrenze)
+_cache = LRUCache(max_entries=64)
+
+
+def matrix_hash(matrix: np.ndarray | sparse.sparray) -> str:
+    """
+        Inhaltsbasierter Hash einer Übergangsmatrix (Form, Datentyp und Werte).
+        Dünnbesetzte Matrizen werden über ihre CSR-Komponenten gehasht.
+        """
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix)
+        matrix.sum_duplicates()
+        digest = hashlib.sha1(str(("csr", matrix.shape, matrix.dtype.str)).encode())
+        for component in (matrix.indptr, matrix.indices, matrix.data):
+            digest.update(np.ascontiguousarray(component).data)
+        return digest.hexdigest()
+
+    matrix = np.ascontiguousarray(matrix)
+    digest = hashlib.sha1(str((matrix.shape, matrix.dtype.str)).encode())
+    digest.update(matrix.data)
+    return digest.hexdigest()
+
+
+def clear_cache() -> None:
+    _cache.clear()
+
+
+def normalize_rows(matrix: np.ndarray | sparse.sparray) -> np.ndarray | sparse.csr_matrix:
+    """
+        Skaliert jede Zeile auf Summe 1 (dicht oder dünnbesetzt).
+
+        Note:
+            Die Würfelwahrscheinlichkeiten sind auf 4 Stellen gerundet, daher summieren
+            sich die Zeilen von create_transition_matrix nur auf ≈1.0003.
+        """
+    if sparse.issparse(matrix):
+        row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+        return sparse.csr_matrix(sparse.diags(1 / row_sums) @ matrix)
+    return matrix / matrix.sum(axis=1, keepdims=True)
+
+
+def field_marginals(distribution: np.ndarray,
+                    state_space: list[MonopolyState] | StateCodec | np.ndarray,
+                    n_fields: int = 40) -> np.ndarray:
+    """
+        Summiert eine Zustandsverteilung auf die Spielfelder.
+
+        Args:
+            distribution: Wahrscheinlichkeit je Zustand
+            state_space: StateCodec, Liste aller MonopolyState-Objekte oder Feld je Zustand
+            n_fields: Anzahl der Spielfelder
+
+        Returns:
+            np.ndarray: Wahrscheinlichkeit je Feld (Länge n_fields)
+        """
+    return np.bincount(state_positions(state_space), weights=distribution, minlength=n_fields)
+
+
+def _solve_direct(transition_matrix: np.ndarray, tol: float, max_iter: int) -> tuple[np.ndarray, int]:
+    # π(P - I) = 0 mit Normierung Σπ = 1 statt der letzten (redundanten) Gleichung
+    n_states = transition_matrix.shape[0]
+    rhs = np.zeros(n_states)
+    rhs[-1] = 1.0
+    if sparse.issparse(transition_matrix):
+        system = sparse.vstack([(transition_matrix.T - sparse.eye(n_states)).tocsr()[:-1],
+                                np.ones((1, n_states))], format="csc")
+        return sparse_linalg.spsolve(system, rhs), 1
+
+    system = transition_matrix.T - np.eye(n_states)
+    system[-1, :] = 1.0
+    return np.linalg.solve(system, rhs), 1
+
+
+def _solve_power(transition_matrix: np.ndarray, tol: float, max_iter: int) -> tuple[np.ndarray, int]:
+    n_states = transition_matrix.shape[0]
+    distribution = np.full(n_states, 1 / n_states)
+    for iteration in range(1, max_iter + 1):
+        next_distribution = distribution @ transition_matrix
+        if np.abs(next_distribution - distribution).sum() < tol:
+            return next_distribution, iteration
+        distribution = next_distribution
+    raise RuntimeError(f"Potenzmethode nach {max_iter} Iterationen nicht konvergiert")
+
+
+def _solve_krylov(transition_matrix: np.ndarray, tol: float, max_iter: int) -> tuple[np.ndarray, int]:
+    # Linker Eigenvektor zum Eigenwert 1 über Arnoldi (ARPACK) auf der dünnbesetzten Matrix
+    n_states = transition_matrix.shape[0]
+    transposed = sparse.csr_matrix(transition_matrix.T)  # auch für bereits dünnbesetzte Matrizen
+    _, vectors = sparse_linalg.eigs(transposed, k=1, which="LM",
+                                    v0=np.full(n_states, 1 / n_states), tol=tol, maxiter=max_iter)
+    return np.real(vectors[:, 0]), 1
+
+
+SOLVERS: dict[str, Callable[[np.ndarray, float, int], tuple[np.ndarray, int]]] = {
+    "direct": _solve_direct,
+    "power": _solve_power,
+    "krylov": _solve_krylov,
+}
+
+
+def solve_stationary(transition_matrix: np.ndarray | sparse.sparray,
+                     state_space: list[MonopolyState] | StateCodec | np.ndarray,
+                     method: str = "direct",
+                     tol: float = 1e-12,
+                     max_iter: int = 10_000) -> StationaryResult:
+    """
+        Berechnet die stationäre Verteilung (Langzeit-Aufenthaltswahrscheinlichkeiten).
+
+        Args:
+            transition_matrix: Übergangsmatrix aus create_transition_matrix, dicht oder
+                dünnbesetzt (z.B. DeckAwareModel.build)
+            state_space: StateCodec, Liste aller MonopolyState-Objekte oder Array mit dem
+                Feld je Zustand (gleiche Reihenfolge)
+            method: "direct" (LGS), "power" (Potenzmethode) oder "krylov" (Arnoldi)
+            tol: Konvergenztoleranz für "power" und "krylov"
+            max_iter: Maximale Iterationen für "power" und "krylov"
+
+        Returns:
+            StationaryResult: Zustandsverteilung und Feld-Marginale
+
+        Note:
+            Ergebnisse werden über einen Hash der Matrix zwischengespeichert (LRU, höchstens
+            _cache.max_entries Einträge); wiederholte Anfragen mit derselben Matrix und denselben
+            Parametern lösen nicht erneut.
+        """
+    if method not in SOLVERS:
+        raise ValueError(f"Unbekanntes Verfahren '{method}', erlaubt: {sorted(SOLVERS)}")
+
+    positions = state_positions(state_space)
+    key = (matrix_hash(transition_matrix), hashlib.sha1(positions.tobytes()).hexdigest(), method, tol, max_iter)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    if not sparse.issparse(transition_matrix):
+        transition_matrix = np.asarray(transition_matrix, dtype=float)
+    normalized = normalize_rows(transition_matrix)
+    distribution, iterations = SOLVERS[method](normalized, tol, max_iter)
+
+    # Vorzeichen/Skalierung vereinheitlichen, numerisches Rauschen < 0 abschneiden
+    distribution = np.clip(distribution / distribution.sum(), 0.0, None)
+    distribution /= distribution.sum()
+    distribution.setflags(write=False)
+    fields = field_marginals(distribution, state_space)
+    fields.setflags(write=False)
+
+    result = StationaryResult(
+        distribution=distribution,
+        field_probabilities=fields,
+        method=method,
+        iterations=iterations,
+        residual=float(np.abs(distribution @ normalized - distribution).sum()),
+    )
+    _cache.put(key, result)
+    return result
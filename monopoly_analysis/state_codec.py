@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+import numpy as np
+
+
+_instances: dict[tuple, "StateCodec"] = {}
+
+
+@dataclass(frozen=True)
+class StateCodec:
+    """
+        Kompakte Ganzzahl-Kodierung der Zustände (Feld, Zähler, eingesperrt).
+
+        Die Indizes entsprechen exakt der Reihenfolge von Probabilities.create_state_space:
+        pro Feld n_counters freie Zustände, auf dem Gefängnisfeld abwechselnd frei/eingesperrt,
+        das Feld "Gehe ins Gefängnis" wird übersprungen.
+        """
+    n_fields: int = 40
+    jail_field: int = 10
+    go_in_jail_field: int = 30
+    n_counters: int = 3
+
+    positions: np.ndarray = field(init=False, repr=False, compare=False)
+    counters: np.ndarray = field(init=False, repr=False, compare=False)
+    in_jail: np.ndarray = field(init=False, repr=False, compare=False)
+    index_table: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        grid_positions, grid_counters, grid_jail = np.meshgrid(
+            np.arange(self.n_fields), np.arange(self.n_counters), [False, True], indexing="ij")
+        valid = (grid_positions != self.go_in_jail_field) & (~grid_jail | (grid_positions == self.jail_field))
+
+        index_table = np.full(valid.shape, -1, dtype=np.intp)
+        index_table[valid] = self.encode(grid_positions[valid], grid_counters[valid], grid_jail[valid])
+
+        order = index_table[valid].argsort()
+        for name, values in (("positions", grid_positions), ("counters", grid_counters), ("in_jail", grid_jail)):
+            values = values[valid][order]
+            values.setflags(write=False)
+            object.__setattr__(self, name, values)
+        index_table.setflags(write=False)
+        object.__setattr__(self, "index_table", index_table)
+
+    @classmethod
+    def from_board(cls, game_version) -> "StateCodec":
+        # Gleiche Bretter teilen sich eine Instanz (Arrays sind schreibgeschützt)
+        key = (cls, len(game_version.board_fields), game_version.jail_field, game_version.go_in_jail_field)
+        if key not in _instances:
+            _instances[key] = cls(n_fields=key[1], jail_field=key[2], go_in_jail_field=key[3])
+        return _instances[key]
+
+    @property
+    def n_states(self) -> int:
+        # Feld 30 entfällt, das Gefängnisfeld hat doppelt so viele Zustände
+        return self.n_fields * self.n_counters
+
+    def encode(self, position, counter, in_jail):
+        """
+            Geschlossene Formel (Feld, Zähler, eingesperrt) → Index, skalar oder vektorisiert.
+
+            Args:
+                position: Feld (0-39), int oder Array
+                counter: Pasch-Zähler bzw. Gefängnisrunde, int oder Array
+                in_jail: eingesperrt, bool oder Array
+
+            Returns:
+                Index in create_state_space() (int bzw. Array)
+
+            Note:
+                Es wird nicht geprüft, ob der Zustand existiert (z.B. Feld 30);
+                dafür contains() bzw. index_table verwenden.
+            """
+        position = np.asarray(position)
+        counter = np.asarray(counter)
+        in_jail = np.asarray(in_jail)
+        index = (self.n_counters * position + counter
+                 + self.n_counters * (position > self.jail_field)
+                 + (position == self.jail_field) * (counter + in_jail)
+                 - self.n_counters * (position > self.go_in_jail_field))
+        return int(index) if index.ndim == 0 else index
+
+    def decode(self, index) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+            Vektorisierte Umkehrung von encode.
+
+            Returns:
+                (positions, counters, in_jail) als Arrays
+            """
+        index = np.asarray(index)
+        return self.positions[index], self.counters[index], self.in_jail[index]
+
+    def index_of(self, position: int, counter: int, in_jail: bool) -> int:
+        """
+            Skalare Variante von encode mit Gültigkeitsprüfung (ohne NumPy-Overhead).
+
+            Returns:
+                Index in create_state_space() oder -1, falls der Zustand nicht existiert
+            """
+        if not (0 <= position < self.n_fields and 0 <= counter < self.n_counters):
+            return -1
+        if position == self.go_in_jail_field or (in_jail and position != self.jail_field):
+            return -1
+        index = self.n_counters * position + counter
+        if position > self.jail_field:
+            index += self.n_counters
+        elif position == self.jail_field:
+            index += counter + in_jail
+        if position > self.go_in_jail_field:
+            index -= self.n_counters
+        return index
+
+    def contains(self, position: int, counter: int, in_jail: bool) -> bool:
+        return self.index_of(position, counter, in_jail) >= 0
+
+    def to_state(self, index: int):
+        from monopoly_analysis.probabilities import MonopolyState
+        return MonopolyState(int(self.positions[index]), int(self.counters[index]), bool(self.in_jail[index]))
+
+    def states(self) -> list:
+        """
+            MonopolyState-Ansicht aller Indizes (gleich create_state_space()).
+            """
+        from monopoly_analysis.probabilities import MonopolyState
+        return [MonopolyState(position, counter, in_jail) for position, counter, in_jail
+                in zip(self.positions.tolist(), self.counters.tolist(), self.in_jail.tolist())]
+
+
+def state_positions(state_space) -> np.ndarray:
+    """
+        Feld je Zustand, für eine StateCodec-Instanz, eine Liste von MonopolyState oder
+        ein bereits vorhandenes Positions-Array.
+        """
+    if isinstance(state_space, StateCodec):
+        return state_space.positions
+    if isinstance(state_space, np.ndarray):
+        return state_space
+    return np.fromiter((state.position for state in state_space), dtype=np.intp, count=len(state_space))
@@ -0,0 +1,189 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import product
+from pathlib import Path
+import tempfile
+from typing import Iterable, Iterator
+import numpy as np
+from monopoly_analysis import __version__
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.solvers import LRUCache, solve_stationary
+from monopoly_analysis.transition_builder import BUILDER_VERSION, TransitionMatrixBuilder
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    config: RuleConfig
+    transition_matrix: np.ndarray  # n_states × n_states, schreibgeschützt
+    distribution: np.ndarray  # Stationäre Verteilung je Zustand
+    field_probabilities: np.ndarray  # Stationäre Verteilung je Feld (0-39)
+
+
+class MatrixCache:
+    """
+        Zweistufiger Cache für Sweep-Ergebnisse, Schlüssel ist RuleConfig.config_hash().
+
+        Stufe 1 ist ein LRU im Speicher mit höchstens max_entries Einträgen, Stufe 2 (optional)
+        ein Verzeichnis mit einer .npz-Datei je Regelvariante. Treffer auf der Festplatte
+        werden in den LRU übernommen. Die Dateinamen enthalten Paket- und Builder-Version,
+        damit nach einer Änderung am Aufbau keine veralteten Matrizen gelesen werden.
+        """
+
+    def __init__(self, max_entries: int = 256, directory: str | Path | None = None):
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries = LRUCache(max_entries)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._entries.max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}-{__version__}-{BUILDER_VERSION}.npz"
+
+    def get(self, config: RuleConfig) -> SweepPoint | None:
+        key = config.config_hash()
+        point = self._entries.get(key)
+        if point is not None:
+            self.hits += 1
+            return point
+        if self.directory is not None and self._path(key).exists():
+            with np.load(self._path(key)) as stored:
+                point = _freeze(SweepPoint(config, stored["transition_matrix"], stored["distribution"],
+                                           stored["field_probabilities"]))
+            self.disk_hits += 1
+            self._entries.put(key, point)
+            return point
+        self.misses += 1
+        return None
+
+    def put(self, point: SweepPoint) -> None:
+        key = point.config.config_hash()
+        if self.directory is not None and not self._path(key).exists():
+            # Erst in eine eigene temporäre Datei schreiben, damit parallele Läufe keine halben
+            # Dateien lesen oder veröffentlichen
+            with tempfile.NamedTemporaryFile(dir=self.directory, prefix=f".{key}.", suffix=".npz",
+                                             delete=False) as file:
+                np.savez(file, transition_matrix=point.transition_matrix, distribution=point.distribution,
+                         field_probabilities=point.field_probabilities)
+            Path(file.name).replace(self._path(key))
+        self._entries.put(key, point)
+
+    def clear(self) -> None:
+        # Leert nur den Speicher-LRU, die Dateien bleiben erhalten
+        self._entries.clear()
+
+
+def _freeze(point: SweepPoint) -> SweepPoint:
+    for array in (point.transition_matrix, point.distribution, point.field_probabilities):
+        array.setflags(write=False)
+    return point
+
+
+def config_grid(base: RuleConfig | None = None, **axes) -> list[RuleConfig]:
+    """
+        Kartesisches Produkt von Regelvarianten.
+
+        Args:
+            base: Ausgangskonfiguration (Standard: RuleConfig())
+            **axes: Feldname → Liste von Werten, z.B. jail_rounds=[1, 2, 3]
+
+        Returns:
+            list[RuleConfig]: Eine Konfiguration je Kombination, letzte Achse läuft am schnellsten
+        """
+    base = base if base is not None else RuleConfig()
+    names = list(axes)
+    return [replace(base, **dict(zip(names, values))) for values in product(*axes.values())]
+
+
+def solve_config(config: RuleConfig, method: str = "direct") -> SweepPoint:
+    """
+        Baut Matrix und stationäre Verteilung für eine Regelvariante (ohne Cache).
+        """
+    probabilities = Probabilities(config)
+    matrix = TransitionMatrixBuilder(probabilities).build()
+    stationary = solve_stationary(matrix, probabilities.codec, method=method)
+    return _freeze(SweepPoint(config, matrix, np.array(stationary.distribution),
+                              np.array(stationary.field_probabilities)))
+
+
+def iter_sweep(configs: Iterable[RuleConfig],
+               n_workers: int = 1,
+               method: str = "direct",
+               window: int = 64) -> Iterator[SweepPoint]:
+    """
+        Wie run_sweep, liefert die Ergebnisse aber der Reihe nach als Generator.
+
+        Args:
+            configs: Regelvarianten, auch als (unendlicher) Generator
+            n_workers: Anzahl Prozesse; 1 = im aktuellen Prozess
+            method: Verfahren für solve_stationary
+            window: Höchstzahl gleichzeitig offener Aufträge, begrenzt den Speicher
+                unabhängig von der Sweep-Größe
+
+        Yields:
+            SweepPoint: In der Reihenfolge von configs
+        """
+    if n_workers <= 1:
+        for config in configs:
+            yield solve_config(config, method)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for config in configs:
+            pending.append(executor.submit(solve_config, config, method))
+            if len(pending) >= window:
+                yield _freeze(pending.popleft().result())
+        while pending:
+            yield _freeze(pending.popleft().result())
+
+
+def run_sweep(configs: list[RuleConfig],
+              n_workers: int = 1,
+              cache: MatrixCache | None = None,
+              method: str = "direct",
+              chunk_size: int = 16) -> list[SweepPoint]:
+    """
+        Wertet eine Liste von Regelvarianten aus; nur nicht zwischengespeicherte werden berechnet.
+
+        Args:
+            configs: Regelvarianten (z.B. aus config_grid)
+            n_workers: Anzahl Prozesse; 1 = im aktuellen Prozess
+            cache: MatrixCache für Wiederholungsläufe (Standard: keiner)
+            method: Verfahren für solve_stationary
+            chunk_size: Konfigurationen je Prozess-Auftrag
+
+        Returns:
+            list[SweepPoint]: In der Reihenfolge von configs
+        """
+    results: dict[RuleConfig, SweepPoint] = {}
+    missing = []
+    for config in dict.fromkeys(configs):
+        point = cache.get(config) if cache is not None else None
+        if point is None:
+            missing.append(config)
+        else:
+            results[config] = point
+
+    if n_workers > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            computed = list(executor.map(solve_config, missing, [method] * len(missing), chunksize=chunk_size))
+        computed = [_freeze(point) for point in computed]
+    else:
+        computed = [solve_config(config, method) for config in missing]
+
+    for point in computed:
+        results[point.config] = point
+        if cache is not None:
+            cache.put(point)
+    return [results[config] for config in configs]
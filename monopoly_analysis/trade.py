@@ -0,0 +1,279 @@
+from dataclasses import dataclass
+import numpy as np
+from monopoly_analysis import roi
+from monopoly_analysis.game_board import GermanMonopoly, RuleConfig
+from monopoly_analysis.solvers import LRUCache
+from monopoly_analysis.state_codec import StateCodec
+
+BANK = -1  # wie game.BANK
+NO_FIELD = -1  # "requested" bei reinen Verkäufen gegen Geld
+EXPECTED_DICE_SUM = 7
+
+TRADE_DTYPE = np.dtype([
+    ("proposer", np.int8),  # Spieler, der anbietet
+    ("partner", np.int8),
+    ("offered", np.int16),  # Feld, das proposer abgibt
+    ("requested", np.int16),  # Feld, das proposer erhält (NO_FIELD = nur Geld)
+    ("cash", np.float64),  # Zahlung proposer → partner (negativ = proposer erhält Geld)
+    ("income_delta", np.float64),  # Änderung der Mieteinnahmen von proposer je Runde
+    ("net_delta", np.float64),  # Einnahmen minus Mehrzahlungen an Mitspieler je Runde
+    ("partner_net_delta", np.float64),
+    ("build_cost", np.float64),  # Ausbau einer von proposer vervollständigten Gruppe
+    ("break_even_rounds", np.float64),  # (cash + build_cost) / net_delta
+    ("partner_break_even_rounds", np.float64),
+    ("completes_set", np.bool_),  # proposer vervollständigt eine Gruppe
+    ("partner_completes_set", np.bool_),
+])
+
+# Modelle je (Config-Hash, Ausbaustufe)
+_models = LRUCache(max_entries=32)
+
+
+@dataclass(frozen=True)
+class TradeModel:
+    """
+        Gruppen-Aggregate einer Regelvariante für die Bewertung von Tauschgeschäften.
+
+        Die Mieteinnahme eines Spielers aus einer Gruppe hängt nur von der Summe der
+        Grundmieten-Erwartungen seiner Felder und der Anzahl eigener Felder ab:
+
+            Einnahme = full_income[g]                      bei vollständiger Gruppe
+                       base_sum × multipliers[g, Anzahl]   sonst
+
+        Bei Straßen ist der Multiplikator 1 und full_income die Miete der Ausbaustufe level
+        (Stufe 0: doppelte Grundmiete), bei Bahnhöfen und Werken ergibt er sich aus der
+        Mietstaffel nach Anzahl. Alle Werte sind erwartete Miete je Gegnerzug.
+        """
+    level: int
+    field: np.ndarray  # Käufliche Felder (Straßen, Bahnhöfe, Werke)
+    group: np.ndarray  # Gruppenindex je käuflichem Feld
+    group_names: list[str]
+    base_rent: np.ndarray  # Landungen je Zug × Grundmiete, je käuflichem Feld
+    group_sizes: np.ndarray
+    multipliers: np.ndarray  # Gruppen × (max. Gruppengröße + 1), Index = Anzahl eigener Felder
+    full_income: np.ndarray  # Erwartete Miete je Gegnerzug bei vollständiger Gruppe
+    build_cost: np.ndarray  # Kosten für den Ausbau auf level, je Gruppe
+
+    @classmethod
+    def from_landing_rates(cls,
+                           landing_rates: np.ndarray,
+                           game_version: GermanMonopoly | None = None,
+                           level: int = 3) -> "TradeModel":
+        """
+            Args:
+                landing_rates: Landungen je Feld und Gegnerzug (roi.landings_per_turn)
+                game_version: Spielbrett mit Straßen, Bahnhöfen und Werken
+                level: Angenommene Ausbaustufe vollständiger Farbgruppen (0-5, 5 = Hotel)
+            """
+        game_version = game_version if game_version is not None else GermanMonopoly()
+        landing_rates = np.asarray(landing_rates, dtype=float)
+        table = roi.property_table(game_version)
+        railroads = np.array(sorted(game_version.railroad_names))
+        utilities = np.array(sorted(game_version.utilities))
+        street_groups = len(table["group_names"])
+
+        field = np.concatenate([table["field"], railroads, utilities])
+        group = np.concatenate([table["group"], np.full(len(railroads), street_groups),
+                                np.full(len(utilities), street_groups + 1)])
+        base_price = np.concatenate([table["rents"][:, 0],
+                                     np.full(len(railroads), game_version.railroad_rents[0]),
+                                     np.full(len(utilities), game_version.utility_multipliers[0] * EXPECTED_DICE_SUM)])
+        base_rent = landing_rates[field] * base_price
+        group_sizes = np.bincount(group)
+        base_total = np.bincount(group, weights=base_rent)
+
+        multipliers = np.ones((len(group_sizes), group_sizes.max() + 1))
+        multipliers[:, 0] = 0.0
+        for index, scale in ((street_groups, game_version.railroad_rents),
+                             (street_groups + 1, game_version.utility_multipliers)):
+            multipliers[index, 1:len(scale) + 1] = np.asarray(scale, dtype=float) / scale[0]
+
+        full_income = base_total * multipliers[np.arange(len(group_sizes)), group_sizes]
+        developed = table["rents"][:, level] * (2 if level == 0 else 1)
+        full_income[:street_groups] = np.bincount(table["group"], weights=landing_rates[table["field"]] * developed)
+        build_cost = np.zeros(len(group_sizes))
+        build_cost[:street_groups] = np.bincount(table["group"], weights=level * table["house_cost"])
+        return cls(level, field, group, [*table["group_names"], "Bahnhöfe", "Werke"], base_rent, group_sizes,
+                   multipliers, full_income, build_cost)
+
+    @classmethod
+    def from_config(cls, config: RuleConfig | None = None, level: int = 3) -> "TradeModel":
+        """
+            Modell aus der stationären Verteilung der Regelvariante, einmal je (Variante, level)
+            berechnet und danach aus dem Modul-Cache (LRU) geliefert.
+            """
+        from monopoly_analysis.sweep import solve_config
+        config = config if config is not None else RuleConfig()
+        key = (config.config_hash(), level)
+        model = _models.get(key)
+        if model is None:
+            game_version = GermanMonopoly(config)
+            point = solve_config(config)
+            landing_rates = roi.landings_per_turn(point.distribution, StateCodec.from_board(game_version))
+            model = cls.from_landing_rates(landing_rates, game_version, level)
+            _models.put(key, model)
+        return model
+
+    def income(self, group: np.ndarray, base_sum: np.ndarray, count: np.ndarray) -> np.ndarray:
+        """
+            Erwartete Miete je Gegnerzug aus einer Gruppe (vektorisiert über alle Argumente).
+            """
+        return np.where(count == self.group_sizes[group], self.full_income[group],
+                        base_sum * self.multipliers[group, count])
+
+    def holdings(self, owner: np.ndarray, n_players: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+            Summe der Grundmieten-Erwartungen und Anzahl Felder je Spieler × Gruppe.
+
+            Args:
+                owner: Besitzer je Feld (Länge 40, BANK = -1)
+            """
+        owners = np.asarray(owner)[self.field]
+        owned = owners != BANK
+        cells = owners[owned] * len(self.group_sizes) + self.group[owned]
+        size = n_players * len(self.group_sizes)
+        base_sum = np.bincount(cells, weights=self.base_rent[owned], minlength=size)
+        count = np.bincount(cells, minlength=size)
+        return base_sum.reshape(n_players, -1), count.reshape(n_players, -1)
+
+    def _change(self, base_sum, count, player, lost, gained) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Einnahmeänderung je Kandidat, wenn player das Feld lost abgibt und gained erhält
+        # (Indizes in self.field, -1 = keins). Betroffen sind höchstens zwei Gruppen.
+        has_lost, has_gained = lost >= 0, gained >= 0
+        lost, gained = np.maximum(lost, 0), np.maximum(gained, 0)
+        lost_group, gained_group = self.group[lost], self.group[gained]
+        same = has_lost & has_gained & (lost_group == gained_group)
+
+        sum_before, count_before = base_sum[player, lost_group], count[player, lost_group]
+        sum_after = sum_before - self.base_rent[lost] + same * self.base_rent[gained]
+        count_after = count_before - 1 + same
+        change = np.where(has_lost, self.income(lost_group, sum_after, np.maximum(count_after, 0))
+                          - self.income(lost_group, sum_before, count_before), 0.0)
+
+        other = has_gained & ~same
+        sum_before, count_before = base_sum[player, gained_group], count[player, gained_group]
+        count_after = np.minimum(count_before + 1, self.group_sizes[gained_group])
+        change += np.where(other, self.income(gained_group, sum_before + self.base_rent[gained], count_after)
+                           - self.income(gained_group, sum_before, count_before), 0.0)
+        completes = other & (count_before + 1 == self.group_sizes[gained_group])
+        return change, completes, gained_group
+
+
+def _break_even(cost: np.ndarray, gain: np.ndarray) -> np.ndarray:
+    # Runden, bis der Mehrertrag die Kosten deckt; 0 = sofort im Plus, inf = nie
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rounds = np.where(gain > 0, cost / gain, np.inf)
+    return np.where((cost <= 0) & (gain >= 0), 0.0, np.maximum(rounds, 0.0))
+
+
+def candidate_trades(owner: np.ndarray,
+                     model: TradeModel,
+                     n_players: int,
+                     cash_offers: tuple[float, ...] = (0,),
+                     include_sales: bool = True) -> tuple[np.ndarray, ...]:
+    """
+        Alle Tauschkandidaten: jedes Feld gegen jedes Feld eines anderen Spielers, optional
+        jedes Feld gegen Geld an jeden Mitspieler, jeweils kombiniert mit jeder Zahlung.
+
+        Returns:
+            (proposer, partner, offered, requested, cash), requested und offered als Index in
+            model.field, requested = -1 bei reinen Verkäufen
+        """
+    owners = np.asarray(owner)[model.field]
+    owned = np.flatnonzero(owners != BANK)
+    offered, requested = np.meshgrid(owned, owned, indexing="ij")
+    swap = owners[offered] != owners[requested]
+    offered, requested = offered[swap], requested[swap]
+    partner = owners[requested]
+    if include_sales:
+        sold, buyer = np.meshgrid(owned, np.arange(n_players), indexing="ij")
+        sale = owners[sold] != buyer
+        offered = np.concatenate([offered, sold[sale]])
+        requested = np.concatenate([requested, np.full(sale.sum(), -1)])
+        partner = np.concatenate([partner, buyer[sale]])
+
+    cash = np.asarray(cash_offers, dtype=float)
+    repeat = len(cash)
+    return (np.repeat(owners[offered], repeat), np.repeat(partner, repeat), np.repeat(offered, repeat),
+            np.repeat(requested, repeat), np.tile(cash, len(offered)))
+
+
+def evaluate_trades(owner: np.ndarray,
+                    model: TradeModel | None = None,
+                    n_players: int | None = None,
+                    cash_offers: tuple[float, ...] = (0,),
+                    include_sales: bool = True) -> np.ndarray:
+    """
+        Bewertet alle Tauschkandidaten einer Spielsituation in einem vektorisierten Durchlauf.
+
+        Args:
+            owner: Besitzer je Feld (Länge 40, BANK = -1), z.B. eine Partie aus game.GameState
+            model: TradeModel (Standard: TradeModel.from_config())
+            n_players: Anzahl Spieler (Standard: höchster Besitzer + 1)
+            cash_offers: Zahlungen proposer → partner, mit jedem Tausch kombiniert
+            include_sales: Auch Felder gegen reines Geld anbieten
+
+        Returns:
+            np.ndarray: Strukturiertes Array (TRADE_DTYPE), eine Zeile je Kandidat
+
+        Note:
+            Je Runde zieht jeder Mitspieler einmal: Die Einnahmen eines Spielers sind
+            (n_players - 1) × Miete je Gegnerzug, seine Zahlungen die Summe der Mieten der
+            anderen. Beim Tausch ändern sich nur die Mieten von proposer und partner, daher
+
+                net_delta = (n_players - 1) × Δproposer - Δpartner
+
+            Vervollständigt proposer eine Farbgruppe, geht der Ausbau auf model.level in den
+            Break-Even ein. Häuser auf getauschten Straßen und Hypotheken bleiben unberücksichtigt.
+        """
+    model = model if model is not None else TradeModel.from_config()
+    owner = np.asarray(owner)
+    n_players = n_players if n_players is not None else int(owner.max()) + 1
+    if n_players < 2 or not (owner[model.field] != BANK).any():
+        # Niemand besitzt etwas (oder kein Mitspieler): keine Kandidaten
+        return np.empty(0, dtype=TRADE_DTYPE)
+    base_sum, count = model.holdings(owner, n_players)
+    proposer, partner, offered, requested, cash = candidate_trades(owner, model, n_players, cash_offers, include_sales)
+
+    proposer_change, completes, proposer_group = model._change(base_sum, count, proposer, offered, requested)
+    partner_change, partner_completes, partner_group = model._change(base_sum, count, partner, requested, offered)
+    others = n_players - 1
+    build_cost = np.where(completes, model.build_cost[proposer_group], 0.0)
+    partner_build_cost = np.where(partner_completes, model.build_cost[partner_group], 0.0)
+
+    result = np.empty(len(cash), dtype=TRADE_DTYPE)
+    result["proposer"] = proposer
+    result["partner"] = partner
+    result["offered"] = model.field[offered]
+    result["requested"] = np.where(requested >= 0, model.field[np.maximum(requested, 0)], NO_FIELD)
+    result["cash"] = cash
+    result["income_delta"] = others * proposer_change
+    result["net_delta"] = others * proposer_change - partner_change
+    result["partner_net_delta"] = others * partner_change - proposer_change
+    result["build_cost"] = build_cost
+    result["break_even_rounds"] = _break_even(cash + build_cost, result["net_delta"])
+    result["partner_break_even_rounds"] = _break_even(partner_build_cost - cash, result["partner_net_delta"])
+    result["completes_set"] = completes
+    result["partner_completes_set"] = partner_completes
+    return result
+
+
+def rank_trades(results: np.ndarray,
+                key: str = "net_delta",
+                top: int | None = None,
+                partner_horizon: float | None = None) -> np.ndarray:
+    """
+        Sortiert die Zeilen aus evaluate_trades absteigend nach key (Break-Even aufsteigend),
+        bei Gleichstand nach der jeweils anderen Größe.
+
+        Args:
+            partner_horizon: Nur Angebote, die sich für partner innerhalb so vieler Runden
+                rechnen (Standard: alle)
+        """
+    if partner_horizon is not None:
+        results = results[results["partner_break_even_rounds"] <= partner_horizon]
+    if key == "break_even_rounds":
+        order = np.lexsort((-results["net_delta"], results["break_even_rounds"]))
+    else:
+        order = np.lexsort((results["break_even_rounds"], -results[key]))
+    return results[order[:top]]
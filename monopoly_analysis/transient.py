@@ -0,0 +1,103 @@
+from typing import Iterator
+import numpy as np
+from monopoly_analysis.joint_chain import turn_matrix
+from monopoly_analysis.solvers import normalize_rows
+from monopoly_analysis.state_codec import StateCodec
+
+
+class TransientAnalysis:
+    """
+        Verteilung nach k Zügen ab einem Startzustand (Standard: Los, Zähler 0, frei).
+
+        Zwei Modi:
+            - stream(): Generator, ein Vektor-Matrix-Produkt je Zug, keine Matrixkopien
+            - distribution_at(k): Sprung über zwischengespeicherte Potenzen P^(2^j),
+              O(log k) Vektor-Matrix-Produkte
+        """
+
+    def __init__(self,
+                 transition_matrix: np.ndarray,
+                 codec: StateCodec | None = None,
+                 per_turn: bool = True):
+        """
+            Args:
+                transition_matrix: Übergangsmatrix aus create_transition_matrix
+                codec: Zustandskodierung (Standard: 120 Zustände)
+                per_turn: True = ein Schritt ist ein ganzer Zug inkl. Pasch-Würfen
+                    (siehe joint_chain.turn_matrix), False = ein einzelner Wurf
+            """
+        self.codec = codec if codec is not None else StateCodec()
+        matrix = normalize_rows(np.asarray(transition_matrix, dtype=float))
+        self.step_matrix = turn_matrix(matrix, self.codec) if per_turn else matrix
+        self.per_turn = per_turn
+        self._powers = [self.step_matrix]  # _powers[j] = P^(2^j)
+
+        # Summationsmatrix Zustand → Feld (One-Hot), für by_field
+        self.field_matrix = np.zeros((self.codec.n_states, self.codec.n_fields))
+        self.field_matrix[np.arange(self.codec.n_states), self.codec.positions] = 1.0
+
+    def start_vector(self, position: int = 0, counter: int = 0, in_jail: bool = False) -> np.ndarray:
+        start = np.zeros(self.codec.n_states)
+        start[self.codec.encode(position, counter, in_jail)] = 1.0
+        return start
+
+    def _aggregate(self, distribution: np.ndarray, by_field: bool) -> np.ndarray:
+        return distribution @ self.field_matrix if by_field else distribution
+
+    def stream(self,
+               n_turns: int,
+               start: np.ndarray | None = None,
+               by_field: bool = False) -> Iterator[np.ndarray]:
+        """
+            Liefert die Verteilung nach Zug 1, 2, ..., n_turns.
+
+            Args:
+                n_turns: Anzahl der Züge
+                start: Startverteilung je Zustand (Standard: start_vector())
+                by_field: True = auf die 40 Felder summiert
+
+            Yields:
+                np.ndarray: Verteilung nach dem jeweiligen Zug
+            """
+        distribution = self.start_vector() if start is None else np.asarray(start, dtype=float)
+        for _ in range(n_turns):
+            distribution = distribution @ self.step_matrix
+            yield self._aggregate(distribution, by_field)
+
+    def history(self, n_turns: int, start: np.ndarray | None = None, by_field: bool = True) -> np.ndarray:
+        """
+            Alle Verteilungen aus stream() als Array (n_turns × Felder bzw. Zustände).
+            """
+        width = self.codec.n_fields if by_field else self.codec.n_states
+        result = np.empty((n_turns, width))
+        for turn, distribution in enumerate(self.stream(n_turns, start, by_field)):
+            result[turn] = distribution
+        return result
+
+    def _power(self, exponent_bit: int) -> np.ndarray:
+        while len(self._powers) <= exponent_bit:
+            self._powers.append(self._powers[-1] @ self._powers[-1])
+        return self._powers[exponent_bit]
+
+    def distribution_at(self, k: int, start: np.ndarray | None = None, by_field: bool = False) -> np.ndarray:
+        """
+            Verteilung nach genau k Zügen über binäre Zerlegung von k.
+
+            Args:
+                k: Anzahl der Züge (≥ 0)
+                start: Startverteilung je Zustand (Standard: start_vector())
+                by_field: True = auf die 40 Felder summiert
+
+            Returns:
+                np.ndarray: Verteilung nach k Zügen
+            """
+        if k < 0:
+            raise ValueError(f"k muss ≥ 0 sein, nicht {k}")
+        distribution = self.start_vector() if start is None else np.asarray(start, dtype=float)
+        bit = 0
+        while k:
+            if k & 1:
+                distribution = distribution @ self._power(bit)
+            k >>= 1
+            bit += 1
+        return self._aggregate(distribution, by_field)
@@ -0,0 +1,292 @@
+import numpy as np
+from monopoly_analysis.probabilities import MonopolyState, Probabilities
+from monopoly_analysis.state_codec import StateCodec
+
+# Bei jeder Änderung am Matrixinhalt erhöhen: macht zwischengespeicherte Matrizen ungültig
+BUILDER_VERSION = 1
+# Zuordnungspläne hängen nur vom Zustandsraum und den Gefängnisrunden ab, nicht von den Kartenregeln
+_assembly_plans: dict[tuple[StateCodec, int], tuple[np.ndarray, np.ndarray]] = {}
+# Verschiebungsmatrizen hängen nur von der Würfelverteilung ab
+_shift_matrices: dict[tuple, np.ndarray] = {}
+
+
+class TransitionMatrixBuilder:
+    """
+        Tabellengesteuerter, vektorisierter Aufbau der Übergangsmatrix.
+
+        Statt jeden Ausgangszustand rekursiv über _add_transition aufzulösen, werden
+        einmalig pro Feld "Landung → Kartenumleitung → Endfeld"-Kerne als NumPy-Arrays
+        vorberechnet. Die Matrix entsteht dann per Scatter-Add (np.bincount) aus
+        Würfelverteilung × Kern. Das Ergebnis entspricht
+        Probabilities.create_transition_matrix bis auf Rundungsfehler der Summationsreihenfolge.
+        """
+
+    def __init__(self, probabilities: Probabilities | None = None):
+        self.probabilities = probabilities if probabilities is not None else Probabilities()
+        self.game_version = self.probabilities.game_version
+        self.n_fields = len(self.probabilities.board_fields)
+        self.jail_column = self.n_fields  # Zusatzspalte im Kern: "eingesperrt"
+
+        self.landing_kernel = self._create_landing_kernel()
+        self.non_doubles_shift = self._create_shift_matrix(self.probabilities.non_doubles_probabilities)
+        self.doubles_shift = self._create_shift_matrix(self.probabilities.doubles_probabilities)
+
+        # Würfelverteilung × Kern: Startfeld → Endfeld (inkl. Gefängnis-Spalte)
+        self.non_doubles_fields = self.non_doubles_shift @ self.landing_kernel
+        self.doubles_fields = self.doubles_shift @ self.landing_kernel
+
+    def _resolve_column(self, target_field: int, from_card: bool) -> int:
+        """
+            Kernspalte für ein Zielfeld nach allen Umleitungen.
+
+            Args:
+                target_field: Zielfeld (0-39)
+                from_card: Wurde das Zielfeld durch eine Karte erreicht?
+
+            Returns:
+                Spalte im Kern (0-39) oder jail_column für "eingesperrt"
+            """
+        if target_field == self.probabilities.go_in_jail_field:
+            return self.jail_column
+        if target_field == self.probabilities.jail_field and from_card:
+            return self.jail_column
+        return target_field
+
+    def _create_landing_kernel(self) -> np.ndarray:
+        """
+            Berechnet für jedes Landefeld die Verteilung des Endfelds.
+
+            Returns:
+                np.ndarray: 40×41 Kern, Spalte 40 = "ins Gefängnis"
+
+            Note:
+                Der Kern hängt nicht vom Pasch-Zähler ab: Karten ändern nur das Feld,
+                der neue Zähler ergibt sich allein aus dem Wurf.
+            """
+        jail_field = self.probabilities.jail_field
+        go_in_jail_field = self.probabilities.go_in_jail_field
+        kernel = np.eye(self.n_fields, self.n_fields + 1)
+        kernel[go_in_jail_field, go_in_jail_field] = 0.0
+        kernel[go_in_jail_field, self.jail_column] = 1.0
+        community_fields = self.game_version.community_fields
+
+        # Gemeinschaftsfelder zuerst: Ereigniskarten können auf sie umleiten
+        for field in community_fields:
+            kernel[field, field] = 0.0
+            for target_field, card_prob in self.probabilities._get_community_targets(field).items():
+                kernel[field, self._resolve_column(target_field, target_field == jail_field)] += card_prob
+
+        for field in self.game_version.chance_fields:
+            row = np.zeros(self.n_fields + 1)
+            for target_field, card_prob in self.probabilities._get_chance_targets(field).items():
+                # Sonderfall: Karte führt auf ein Gemeinschaftsfeld (z.B. 36 → 3 zurück → 33)
+                if target_field in community_fields:
+                    row += card_prob * kernel[target_field]
+                else:
+                    row[self._resolve_column(target_field, target_field == jail_field)] += card_prob
+            kernel[field] = row
+
+        return kernel
+
+    def _create_passing_kernel(self) -> np.ndarray:
+        """
+            Anteil des Landekerns, bei dem eine Karte über Los (oder auf Los) vorrückt.
+
+            Returns:
+                np.ndarray: 40×41 Teilkern von landing_kernel
+
+            Note:
+                "Rücke vor"-Karten (feste Ziele, nächster Bahnhof) überqueren Los, wenn das
+                Ziel nicht hinter dem Kartenfeld liegt. "3 Felder zurück" und
+                Gefängnis-Karten überqueren Los nie.
+            """
+        jail_field = self.probabilities.jail_field
+        prob_per_card = 1 / self.game_version.total_cards
+        passing = np.zeros((self.n_fields, self.n_fields + 1))
+
+        for field in self.game_version.community_fields:
+            for target_field in self.game_version.community_chest_fixed_targets:
+                if target_field != jail_field and target_field < field:
+                    passing[field, target_field] += prob_per_card
+
+        for field in self.game_version.chance_fields:
+            advance_targets = list(self.game_version.chance_card_fixed_targets)
+            if self.game_version.chance_next_railroad:
+                advance_targets.append(self.game_version.get_next_railroad(field))
+            for target_field in advance_targets:
+                if target_field != jail_field and target_field < field:
+                    passing[field, self._resolve_column(target_field, from_card=True)] += prob_per_card
+            three_back = self.game_version.get_three_back(field)
+            if self.game_version.chance_three_back and three_back in self.game_version.community_fields:
+                passing[field] += prob_per_card * passing[three_back]
+
+        return passing
+
+    def _create_shift_matrix(self, dice_probabilities: dict[int, float]) -> np.ndarray:
+        """
+            Zirkulante 40×40-Matrix: Startfeld → Landefeld für eine Würfelverteilung.
+            """
+        key = (self.n_fields, tuple(sorted(dice_probabilities.items())))
+        if key not in _shift_matrices:
+            distances = np.zeros(self.n_fields)
+            for dice_sum, prob in dice_probabilities.items():
+                distances[dice_sum % self.n_fields] += prob
+            positions = np.arange(self.n_fields)
+            shift = distances[(positions[None, :] - positions[:, None]) % self.n_fields]
+            shift.setflags(write=False)
+            _shift_matrices[key] = shift
+        return _shift_matrices[key]
+
+    def _create_assembly_plan(self, codec: StateCodec) -> tuple[np.ndarray, np.ndarray]:
+        """
+            Berechnet, welcher Wert aus den Kernen in welche Matrixzelle addiert wird.
+
+            Args:
+                codec: Zustandskodierung (bestimmt Zeilen- und Spaltenindizes)
+
+            Returns:
+                (flat_targets, value_sources): flache Matrixindizes und Indizes in den
+                Wertevektor aus _assembly_values
+            """
+        n_states = codec.n_states
+        index_table = codec.index_table
+        n_counters = codec.n_counters
+        width = self.n_fields + 1
+        doubles_offset = self.n_fields * width
+        doubles_total = 2 * doubles_offset
+        non_doubles_total = doubles_total + 1
+
+        jail_field = self.probabilities.jail_field
+        jail_states = index_table[jail_field, :, 1]
+        jail_target = jail_states[0]  # (10, 0, eingesperrt)
+
+        # Nur Felder mit freien Zuständen (ohne "Gehe ins Gefängnis")
+        fields = np.flatnonzero(index_table[:, 0, 0] >= 0)
+        field_columns = np.append(fields, self.jail_column)
+
+        targets = []
+        sources = []
+
+        def scatter(rows: np.ndarray, counter: int, from_fields: np.ndarray, offset: int) -> None:
+            # Ziel: (Feld, Zähler, frei) bzw. Gefängnis-Spalte
+            columns = np.append(index_table[fields, counter, 0], jail_target)
+            targets.append((rows[:, None] * n_states + columns[None, :]).ravel())
+            sources.append((offset + from_fields[:, None] * width + field_columns[None, :]).ravel())
+
+        # Freie Zustände: Block (Zähler c) → (Zähler 0) bzw. (Zähler c+1)
+        for counter in range(n_counters):
+            rows = index_table[fields, counter, 0]
+            scatter(rows, 0, fields, 0)
+            if counter + 1 < n_counters:
+                scatter(rows, counter + 1, fields, doubles_offset)
+            else:
+                # Dritter Pasch → direkt ins Gefängnis
+                targets.append(rows * n_states + jail_target)
+                sources.append(np.full(len(rows), doubles_total))
+
+        # Gefängnis-Zustände
+        jail_origin = np.array([jail_field])
+        last_jail_round = self.game_version.jail_rounds - 1
+        for jail_round in range(n_counters):
+            row = jail_states[jail_round:jail_round + 1]
+            if jail_round < last_jail_round:
+                # Kein Pasch → bleibt eingesperrt, Pasch → frei, Zug endet
+                targets.append(row * n_states + jail_states[jail_round + 1])
+                sources.append(np.array([non_doubles_total]))
+                scatter(row, 0, jail_origin, doubles_offset)
+            else:
+                # Letzte Runde: kommt auf jeden Fall raus, Pasch darf weiterwürfeln
+                scatter(row, 0, jail_origin, 0)
+                scatter(row, 1, jail_origin, doubles_offset)
+
+        return np.concatenate(targets), np.concatenate(sources)
+
+    def _assemble(self,
+                  non_doubles_fields: np.ndarray,
+                  doubles_fields: np.ndarray,
+                  doubles_total: float,
+                  non_doubles_total: float,
+                  rows: np.ndarray | None = None) -> np.ndarray:
+        codec = self.probabilities.codec
+        n_states = codec.n_states
+        plan_key = (codec, self.game_version.jail_rounds)
+        plan = _assembly_plans.get(plan_key)
+        if plan is None:
+            plan = self._create_assembly_plan(codec)
+            _assembly_plans[plan_key] = plan
+
+        flat_targets, value_sources = plan
+        values = np.concatenate((non_doubles_fields.ravel(), doubles_fields.ravel(),
+                                 [doubles_total, non_doubles_total]))
+        if rows is None:
+            matrix = np.bincount(flat_targets, weights=values[value_sources], minlength=n_states * n_states)
+            return matrix.reshape(n_states, n_states)
+
+        # Nur ausgewählte Zeilen: Plan filtern und auf lokale Zeilennummern umrechnen
+        local_row = np.full(n_states, -1)
+        local_row[rows] = np.arange(len(rows))
+        target_rows, target_columns = np.divmod(flat_targets, n_states)
+        selected = local_row[target_rows] >= 0
+        local_targets = local_row[target_rows[selected]] * n_states + target_columns[selected]
+        matrix = np.bincount(local_targets, weights=values[value_sources[selected]], minlength=len(rows) * n_states)
+        return matrix.reshape(len(rows), n_states)
+
+    def build(self, state_space: list[MonopolyState] | None = None) -> np.ndarray:
+        """
+            Erstellt die vollständige Übergangsmatrix mit Array-Operationen.
+
+            Args:
+                state_space: Optional, nur zur Kontrolle; Zeilen und Spalten folgen immer
+                    der Kodierung von probabilities.codec (= create_state_space())
+
+            Returns:
+                np.ndarray: 120×120 Übergangsmatrix, gleiche Indizierung wie
+                Probabilities.create_transition_matrix
+            """
+        n_states = self.probabilities.codec.n_states
+        if state_space is not None and len(state_space) != n_states:
+            raise ValueError(f"Zustandsraum mit {len(state_space)} statt {n_states} Zuständen")
+
+        return self._assemble(self.non_doubles_fields,
+                              self.doubles_fields,
+                              sum(self.probabilities.doubles_probabilities.values()),
+                              sum(self.probabilities.non_doubles_probabilities.values()))
+
+    def build_rows(self, rows: np.ndarray) -> np.ndarray:
+        """
+            Erstellt nur die angegebenen Zeilen der Übergangsmatrix.
+
+            Args:
+                rows: Zustandsindizes (ohne Duplikate)
+
+            Returns:
+                np.ndarray: len(rows) × n_states, entspricht build()[rows]
+            """
+        return self._assemble(self.non_doubles_fields,
+                              self.doubles_fields,
+                              sum(self.probabilities.doubles_probabilities.values()),
+                              sum(self.probabilities.non_doubles_probabilities.values()),
+                              rows=np.asarray(rows))
+
+    def build_passing_go(self) -> np.ndarray:
+        """
+            Teilmatrix der Übergänge, bei denen der Spieler Los überquert oder betritt.
+
+            Returns:
+                np.ndarray: 120×120, elementweise ≤ build(); Eintrag (i, j) ist die
+                Wahrscheinlichkeit, von i nach j zu ziehen UND dabei über Los zu kommen
+
+            Note:
+                Aus Zustandspaaren allein ist das nicht ableitbar (z.B. 4 → 7 → "Rücke vor
+                bis Südbahnhof" endet auf 5 und überquert Los). Daher wird zwischen
+                Würfelzug über Los (untere Dreiecksmatrix der Verschiebung) und
+                Kartenzug über Los (Teilkern) unterschieden.
+            """
+        passing_kernel = self._create_passing_kernel()
+
+        def passing_fields(shift: np.ndarray) -> np.ndarray:
+            return np.tril(shift, -1) @ self.landing_kernel + np.triu(shift, 1) @ passing_kernel
+
+        return self._assemble(passing_fields(self.non_doubles_shift),
+                              passing_fields(self.doubles_shift),
+                              0.0, 0.0)
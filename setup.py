@@ -4,4 +4,7 @@ setup(
     name="monopoly-analysis",
     version="0.1.0",
     packages=find_packages(),
+    entry_points={
+        "console_scripts": ["monopoly-analysis=monopoly_analysis.cli:main"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,86 @@
+import json
+import numpy as np
+import pytest
+from monopoly_analysis.artifacts import ArtifactStore
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.solvers import solve_stationary
+
+CONFIG = RuleConfig(jail_rounds=2)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path)
+
+
+def test_missing_artifact_raises(store):
+    """Test: Loading an artifact that was never built raises FileNotFoundError."""
+    # ACT / ASSERT
+    assert not store.exists(CONFIG)
+    with pytest.raises(FileNotFoundError):
+        store.load(CONFIG)
+
+
+def test_built_artifact_is_memory_mapped_and_read_only(store):
+    """Test: get_or_build returns memory-mapped, read-only arrays with matching metadata."""
+    # ACT
+    artifact = store.get_or_build(CONFIG)
+
+    # ASSERT
+    assert isinstance(artifact.transition_matrix, np.memmap)
+    assert not artifact.distribution.flags.writeable
+    assert artifact.config == CONFIG
+    assert artifact.meta["config_hash"] == CONFIG.config_hash()
+
+
+def test_artifact_matches_reference_chain(store):
+    """Test: Stored matrix, distribution and states equal the reference computation."""
+    probabilities = Probabilities(CONFIG)
+    reference = probabilities.create_transition_matrix(probabilities.create_state_space())
+
+    # ACT
+    artifact = store.get_or_build(CONFIG)
+
+    # ASSERT
+    np.testing.assert_allclose(artifact.transition_matrix, reference, atol=1e-12)
+    np.testing.assert_allclose(artifact.distribution, solve_stationary(reference, probabilities.codec).distribution)
+    assert list(artifact.states["position"]) == list(probabilities.codec.positions)
+
+
+def test_artifact_contains_hitting_times(store):
+    """Test: Hitting-time tables cover every state and field; field 30 is never reached."""
+    # ACT
+    artifact = store.get_or_build(CONFIG)
+
+    # ASSERT
+    assert artifact.hitting_times_turns.shape == (120, 40)
+    assert np.isinf(artifact.hitting_times_rolls[:, 30]).all()
+
+
+def test_load_by_hash(store):
+    """Test: An artifact can be loaded by its config hash alone."""
+    artifact = store.get_or_build(CONFIG)
+
+    # ACT
+    loaded = store.load(CONFIG.config_hash())
+
+    # ASSERT
+    assert np.array_equal(loaded.field_probabilities, artifact.field_probabilities)
+
+
+def test_other_library_version_is_stale(store):
+    """Test: An artifact from another library version is rejected and rebuilt."""
+    meta_path = store.get_or_build(CONFIG).path / "meta.json"
+    meta = json.loads(meta_path.read_text())
+    meta["library_version"] = "0.0.0"
+    meta_path.write_text(json.dumps(meta))
+
+    # ACT
+    exists = store.exists(CONFIG)
+
+    # ASSERT
+    assert not exists
+    with pytest.raises(ValueError):
+        store.load(CONFIG)
+    assert store.get_or_build(CONFIG).meta["library_version"] != "0.0.0"
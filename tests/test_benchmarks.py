@@ -0,0 +1,82 @@
+from pathlib import Path
+from benchmarks import suite
+from monopoly_analysis import solvers
+
+BASELINE = {"results": {"single/a": {"min": 1.0, "median": 1.0}, "single/b": {"min": 2.0, "median": 2.0},
+                        "deck/c": {"min": 1.0, "median": 1.0}}}
+CURRENT = {"results": {"single/a": {"min": 1.05, "median": 1.05}, "single/b": {"min": 2.5, "median": 2.5},
+                       "joint/d": {"min": 1.0, "median": 1.0}}}
+
+
+def test_compare_flags_regressions():
+    """Test: Only shared benchmarks are compared, and only changes above the threshold are flagged."""
+    # ACT
+    rows = {row["name"]: row for row in suite.compare(BASELINE, CURRENT, threshold=10)}
+
+    # ASSERT
+    assert set(rows) == {"single/a", "single/b"}
+    assert not rows["single/a"]["regression"]
+    assert rows["single/b"]["regression"]
+
+
+def test_history_round_trip(tmp_path):
+    """Test: Appended runs are read back in order, creating missing directories."""
+    history = tmp_path / "neu" / "history.json"
+
+    # ACT
+    suite.append_history(history, BASELINE)
+    suite.append_history(history, CURRENT)
+
+    # ASSERT
+    assert suite.load_history(history) == [BASELINE, CURRENT]
+
+
+def test_compare_command_exit_code(tmp_path):
+    """Test: compare exits with 1 on a regression above the threshold and 0 otherwise."""
+    history = tmp_path / "history.json"
+    suite.append_history(history, BASELINE)
+    suite.append_history(history, CURRENT)
+
+    # ACT
+    strict = suite.main(["compare", "--history", str(history), "--threshold", "10"])
+    lenient = suite.main(["compare", "--history", str(history), "--threshold", "30"])
+
+    # ASSERT
+    assert strict == 1
+    assert lenient == 0
+
+
+def test_row_sums():
+    """Test: All single and joint matrices have row sums within the default tolerance."""
+    # ACT
+    deviations = suite.check_row_sums(("single", "joint"))
+
+    # ASSERT
+    assert max(deviations.values()) < 1e-3
+
+
+def test_default_history_is_outside_source_tree():
+    """Test: The default history file does not live in the benchmarks package."""
+    # ACT
+    path = suite.DEFAULT_HISTORY.resolve()
+
+    # ASSERT
+    assert Path(suite.__file__).resolve().parent not in path.parents
+
+
+def test_solver_benchmarks_start_cold():
+    """Test: Solve and sweep benchmarks clear the result caches before every timed repetition."""
+    cases = {case.name: case for case in suite.benchmarks(("single",))}
+    sweep = cases["run_sweep[12]"]
+    lookups = []
+    timed = suite.Benchmark(sweep.name, sweep.scale, lambda: (),
+                            lambda: lookups.append(len(solvers._cache)), reset=sweep.reset)
+    solvers.solve_stationary(*cases["solve_stationary[direct]"].setup()[:2])
+
+    # ACT
+    suite.measure(timed, repeats=3)
+
+    # ASSERT
+    assert cases["solve_stationary[power]"].reset is suite._clear_caches
+    assert lookups[0] >= 1
+    assert lookups[1:] == [0, 0, 0]
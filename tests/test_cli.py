@@ -0,0 +1,155 @@
+import json
+import subprocess
+import sys
+import numpy as np
+import pytest
+from monopoly_analysis import artifacts, cli, roi
+from monopoly_analysis.game_board import RuleConfig
+
+JAIL_2 = ["--set", "jail_rounds=2"]
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    return tmp_path_factory.mktemp("store")
+
+
+@pytest.fixture(scope="module")
+def artifact(store):
+    cli.load_artifact(store, RuleConfig(jail_rounds=2))
+    return artifacts.ArtifactStore(store).load(RuleConfig(jail_rounds=2))
+
+
+@pytest.mark.parametrize("array", [np.arange(5.0), np.arange(12.0).reshape(3, 4),
+                                   np.array([(10, 2, True)], dtype=artifacts.STATE_DTYPE)])
+def test_read_npy(tmp_path, array):
+    """Test: The numpy-free reader returns the same values as numpy for 1D, 2D and structured arrays."""
+    np.save(tmp_path / "array.npy", array)
+
+    # ACT
+    values = cli.read_npy(tmp_path / "array.npy")
+
+    # ASSERT
+    assert values == array.tolist()
+
+
+def test_format_version_matches_artifacts():
+    """Test: The CLI accepts exactly the artifact format version written by the store."""
+    # ACT
+    version = cli.ARTIFACT_FORMAT_VERSION
+
+    # ASSERT
+    assert version == artifacts.FORMAT_VERSION
+
+
+def test_no_build_without_artifact(tmp_path):
+    """Test: --no-build exits with code 2 if no artifact exists."""
+    # ACT
+    code = cli.main(["--store", str(tmp_path), "--no-build", "stationary"])
+
+    # ASSERT
+    assert code == 2
+
+
+def test_stationary_query(store, artifact, capsys):
+    """Test: stationary prints the field probabilities of the artifact."""
+    # ACT
+    code = cli.main(["--store", str(store)] + JAIL_2 + ["stationary"])
+
+    # ASSERT
+    assert code == 0
+    rows = json.loads(capsys.readouterr().out)
+    np.testing.assert_allclose([row["probability"] for row in rows], artifact.field_probabilities)
+
+
+def test_roi_query(store, artifact, capsys):
+    """Test: roi matches evaluate_investments for the requested opponent counts."""
+    expected = roi.evaluate_investments(roi.landings_per_turn(artifact.distribution), opponents=(1, 3))
+
+    # ACT
+    code = cli.main(["--store", str(store)] + JAIL_2 + ["roi", "--opponents", "1", "3", "--sort", "field"])
+
+    # ASSERT
+    assert code == 0
+    rows = json.loads(capsys.readouterr().out)
+    np.testing.assert_allclose([row["income_per_round"] for row in rows], expected["income_per_round"])
+
+
+def test_hitting_times_csv(store, artifact, capsys):
+    """Test: hitting-times as CSV has a header and an unreachable field 30."""
+    # ACT
+    code = cli.main(["--store", str(store)] + JAIL_2 + ["--format", "csv", "hitting-times", "--unit", "rolls"])
+
+    # ASSERT
+    assert code == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "field,name,expected_rolls"
+    assert lines[31].startswith("30,,inf")
+
+
+def test_unknown_rule_is_reported(tmp_path):
+    """Test: An unknown rule name exits with code 2."""
+    # ACT
+    code = cli.main(["--store", str(tmp_path), "--set", "no_such_rule=1", "stationary"])
+
+    # ASSERT
+    assert code == 2
+
+
+def test_cached_query_skips_numpy(tmp_path):
+    """Test: A query against an existing artifact imports neither numpy nor csv, pathlib or typing."""
+    cli.load_artifact(tmp_path, RuleConfig())
+    code = ("import sys; from monopoly_analysis import cli; "
+            f"cli.main(['--store', {str(tmp_path)!r}, 'roi', '--top', '1']); "
+            "loaded = {'numpy', 'csv', 'pathlib', 'typing'} & set(sys.modules); "
+            "assert not loaded, loaded")
+
+    # ACT
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+    # ASSERT
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_wrong_rule_type_is_reported(tmp_path, capsys):
+    """Test: A rule value of the wrong type exits with code 2 and a Fehler: message."""
+    # ACT
+    code = cli.main(["--store", str(tmp_path), "--config", '{"jail_rounds": "x"}', "stationary"])
+
+    # ASSERT
+    assert code == 2
+    assert capsys.readouterr().err.startswith("Fehler: Regel 'jail_rounds' erwartet eine ganze Zahl")
+
+
+def test_invalid_start_field_is_named(tmp_path, capsys):
+    """Test: hitting-times --from 30 names the go-to-jail field instead of an internal error."""
+    # ACT
+    code = cli.main(["--store", str(tmp_path), "hitting-times", "--from", "30"])
+
+    # ASSERT
+    assert code == 2
+    assert '30 = "Gehe ins Gefängnis"' in capsys.readouterr().err
+
+
+def test_corrupt_meta_is_rebuilt(tmp_path):
+    """Test: A truncated meta.json marks the artifact as stale and triggers a rebuild."""
+    cli.load_artifact(tmp_path, RuleConfig())
+    meta = tmp_path / RuleConfig().config_hash() / "meta.json"
+    meta.write_text(meta.read_text()[:10])
+
+    # ACT
+    artifact = cli.load_artifact(tmp_path, RuleConfig())
+
+    # ASSERT
+    assert json.loads(meta.read_text())["format_version"] == cli.ARTIFACT_FORMAT_VERSION
+    assert len(artifact["distribution"]) == 120
+
+
+def test_field_off_the_board_is_reported(tmp_path, capsys):
+    """Test: A card field off the board exits with code 2 instead of an IndexError."""
+    # ACT
+    code = cli.main(["--store", str(tmp_path), "--set", "chance_fields=[7,22,36,40]", "stationary"])
+
+    # ASSERT
+    assert code == 2
+    assert "chance_fields" in capsys.readouterr().err
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+import monopoly_analysis.probabilities as moprob
+from monopoly_analysis import solvers
+from monopoly_analysis.deck_model import DeckAwareModel
+
+
+def test_uniform_pointer_average_matches_memoryless_chain():
+    """Test: Averaging over uniformly distributed deck pointers reproduces the 1/16 model."""
+    obj = moprob.Probabilities()
+    expected = obj.create_transition_matrix(obj.create_state_space())
+    model = DeckAwareModel(obj, *DeckAwareModel.random_deck_orders(16, np.random.default_rng(3)))
+    n_pointers = model.n_chance * model.n_community
+
+    # ACT
+    matrix = model.build()
+    collapse = np.kron(np.eye(obj.codec.n_states), np.ones((n_pointers, 1)))
+    lumped = collapse.T @ (matrix @ collapse) / n_pointers
+
+    # ASSERT
+    assert matrix.shape == (30720, 30720)
+    np.testing.assert_allclose(np.asarray(lumped), expected, atol=1e-12)
+
+
+def test_stationary_solvers_accept_sparse_deck_matrix():
+    """Test: Deck-aware CSR matrix solves to a valid stationary distribution."""
+    model = DeckAwareModel()
+    matrix = model.build()
+
+    # ACT
+    result = solvers.solve_stationary(matrix, model.positions, method="krylov", tol=1e-10)
+
+    # ASSERT
+    assert result.distribution.shape == (model.n_states,)
+    assert result.residual < 1e-8
+    assert model.base_distribution(result.distribution).shape == (120,)
+    assert result.field_probabilities.sum() == pytest.approx(1.0)
@@ -0,0 +1,164 @@
+import numpy as np
+import pytest
+from monopoly_analysis.export import ColumnarReader, ColumnarWriter, export_sweep
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import MonopolyState
+from monopoly_analysis.sweep import config_grid, iter_sweep, run_sweep
+from monopoly_analysis.transient import TransientAnalysis
+
+SCHEMA = {"config": np.uint8, "value": np.float64}
+
+
+@pytest.fixture(scope="module")
+def columns(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("columns")
+    buffered = []
+    with ColumnarWriter(directory, SCHEMA, {"config": []}, chunk_rows=7) as writer:
+        for name in ("a", "b", "c"):
+            writer.append(config=writer.encode("config", name), value=np.arange(10.0))
+            buffered.append(max(len(buffer) for buffer in writer._buffer.values()))
+    return ColumnarReader(directory), buffered
+
+
+@pytest.fixture(scope="module")
+def configs():
+    return config_grid(jail_rounds=[1, 3])
+
+
+@pytest.fixture(scope="module")
+def by_field(tmp_path_factory, configs):
+    return export_sweep(iter(configs), tmp_path_factory.mktemp("by_field"), n_turns=5, chunk_rows=100)
+
+
+@pytest.fixture(scope="module")
+def points(configs):
+    return run_sweep(configs)
+
+
+def test_buffer_never_exceeds_chunk(columns):
+    """Test: Full chunks are flushed on append, the buffer never grows past chunk_rows."""
+    _, buffered = columns
+
+    # ACT
+    largest = max(buffered)
+
+    # ASSERT
+    assert largest <= 7
+
+
+def test_written_rows_are_read_back(columns):
+    """Test: All rows, chunks and dictionary entries are read back unchanged."""
+    reader, _ = columns
+
+    # ACT
+    values = reader.read(["value"])["value"]
+
+    # ASSERT
+    assert len(reader) == 30
+    assert len(reader.chunks) == 5
+    assert reader.dictionaries["config"] == ["a", "b", "c"]
+    np.testing.assert_array_equal(values, np.tile(np.arange(10.0), 3))
+
+
+def test_chunks_are_pruned_by_min_max(columns):
+    """Test: Filters skip chunks whose min/max range excludes the value."""
+    reader, _ = columns
+
+    # ACT
+    chunks = list(reader.iter_chunks(config="a"))
+
+    # ASSERT
+    # "a" liegt nur in den ersten beiden Chunks
+    assert [chunk["max"]["config"] for chunk in reader.chunks] == [0, 1, 2, 2, 2]
+    assert len(chunks) == 2
+
+
+def test_filter_by_dictionary_value(columns):
+    """Test: Filtering by a dictionary value returns exactly its rows, unknown values none."""
+    reader, _ = columns
+
+    # ACT
+    known = reader.read(["value"], config="c")["value"]
+    unknown = reader.read(config="unbekannt")["value"]
+
+    # ASSERT
+    np.testing.assert_array_equal(known, np.arange(10.0))
+    assert unknown.size == 0
+
+
+def test_existing_directory_is_rejected(tmp_path):
+    """Test: A writer refuses a directory that already holds a table."""
+    with ColumnarWriter(tmp_path, SCHEMA) as writer:
+        writer.append(config=[0], value=[1.0])
+
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        ColumnarWriter(tmp_path, SCHEMA)
+
+
+def test_export_sweep_metadata(by_field, configs):
+    """Test: The export has one row per config, turn and field, with configs and field names."""
+    # ACT
+    dictionaries = by_field.dictionaries
+
+    # ASSERT
+    assert len(by_field) == 2 * 6 * 40
+    assert dictionaries["config"] == [config.config_hash() for config in configs]
+    assert dictionaries["field"][39] == "Schlossallee"
+    assert by_field.metadata["configs"][configs[1].config_hash()]["jail_rounds"] == 3
+
+
+def test_export_sweep_stationary(by_field, configs, points):
+    """Test: turn=-1 holds the stationary field probabilities of the sweep."""
+    # ACT
+    stationary = by_field.read(["field", "probability"], config=configs[1], turn=-1)
+
+    # ASSERT
+    np.testing.assert_array_equal(stationary["field"], np.arange(40))
+    np.testing.assert_allclose(stationary["probability"], points[1].field_probabilities)
+
+
+def test_export_sweep_transient(by_field, configs, points):
+    """Test: Turns 1 to 5 match the transient history of the same config."""
+    expected = TransientAnalysis(points[0].transition_matrix).history(5, by_field=True)
+
+    # ACT
+    rows = by_field.read(config=configs[0], field=39, turn=range(1, 6))
+
+    # ASSERT
+    np.testing.assert_allclose(rows["probability"], expected[:, 39])
+
+
+def test_export_sweep_by_state(configs, tmp_path):
+    """Test: Exporting by state allows filtering and decoding MonopolyState values."""
+    reader = export_sweep(configs[:1], tmp_path, by_field=False)
+
+    # ACT
+    jail = reader.read(state=MonopolyState(10, 0, True))
+
+    # ASSERT
+    assert len(jail["probability"]) == 1
+    assert jail["field"][0] == 10
+    assert reader.decode("state", jail["state"]) == [[10, 0, True]]
+
+
+def test_iter_sweep_preserves_order():
+    """Test: Streamed points arrive in config order and match run_sweep."""
+    configs = config_grid(total_cards=[16, 20, 24])
+
+    # ACT
+    streamed = list(iter_sweep(iter(configs), n_workers=2, window=2))
+
+    # ASSERT
+    assert [point.config for point in streamed] == configs
+    assert isinstance(streamed[0].config, RuleConfig)
+    np.testing.assert_allclose(streamed[2].distribution, run_sweep(configs[2:])[0].distribution)
+
+
+def test_iter_sweep_results_are_read_only():
+    """Test: Streamed distributions cannot be modified in place."""
+    # ACT
+    [point] = iter_sweep(config_grid(total_cards=[16]), n_workers=1)
+
+    # ASSERT
+    assert not point.distribution.flags.writeable
@@ -0,0 +1,128 @@
+from dataclasses import replace
+import numpy as np
+import pytest
+from monopoly_analysis.game import STRATEGIES, GameSimulator, ThresholdStrategy
+
+N_GAMES = 500
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    return GameSimulator()
+
+
+@pytest.fixture(scope="module")
+def result(simulator):
+    return simulator.run(list(STRATEGIES), N_GAMES, max_rounds=200, seed=3)
+
+
+def test_one_winner_per_game(result):
+    """Test: Every game has a winner and the win rates of all strategies sum to one."""
+    # ACT
+    win_rates = result.win_rates()
+
+    # ASSERT
+    assert result.winner.shape == (N_GAMES,)
+    assert sum(win_rates.values()) == pytest.approx(1)
+    assert (result.rounds <= 200).all()
+
+
+def test_capped_games_go_to_richest_player(result):
+    """Test: At the round cap the player with the largest net worth wins."""
+    # ACT
+    winner_worth = result.net_worth[np.arange(N_GAMES), result.winner]
+
+    # ASSERT
+    assert (result.net_worth >= 0).all()
+    assert (winner_worth[result.capped] == result.net_worth[result.capped].max(axis=1)).all()
+
+
+def test_finished_games_leave_one_solvent_player(result):
+    """Test: A finished game has exactly one player with remaining net worth."""
+    # ACT
+    finished = ~result.capped
+
+    # ASSERT
+    assert ((result.net_worth[finished] > 0).sum(axis=1) == 1).all()
+
+
+def test_same_seed_same_games(simulator, result):
+    """Test: The same seed reproduces the same winners."""
+    # ACT
+    again = simulator.run(list(STRATEGIES), N_GAMES, max_rounds=200, seed=3)
+
+    # ASSERT
+    assert np.array_equal(result.winner, again.winner)
+
+
+def test_strategies_matter(simulator):
+    """Test: A player who never buys almost always loses against a buyer."""
+    passive = ThresholdStrategy("Passiv", groups=(), buy_railroads=False, buy_utilities=False)
+
+    # ACT
+    result = simulator.run([STRATEGIES[0], passive], 1000, seed=5)
+
+    # ASSERT
+    assert result.win_rates()["Käufer"] > 0.9
+
+
+def test_finished_and_capped_games_are_reported_separately(simulator):
+    """Test: Win rates over finished and capped games are reported next to the overall rates."""
+    # ACT
+    result = simulator.run(list(STRATEGIES), N_GAMES, max_rounds=100, seed=3)
+
+    # ASSERT
+    assert result.n_finished + result.n_capped == N_GAMES
+    assert 0 < result.n_capped < N_GAMES
+    for which in ("finished", "capped"):
+        assert sum(result.win_rates(which).values()) == pytest.approx(1)
+    name = STRATEGIES[0].name
+    assert result.win_rates()[name] * N_GAMES == pytest.approx(
+        result.win_rates("finished")[name] * result.n_finished + result.win_rates("capped")[name] * result.n_capped)
+
+
+def test_unknown_win_rate_selection_raises(result):
+    """Test: An unknown selection for win_rates raises ValueError."""
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        result.win_rates("unentschieden")
+
+
+def test_trading_finishes_games(simulator, result):
+    """Test: With set-completing trades almost every game ends by bankruptcy, without them most are capped."""
+    no_trading = GameSimulator(trade_premium=None)
+
+    # ACT
+    untraded = no_trading.run(list(STRATEGIES), N_GAMES, max_rounds=200, seed=3)
+
+    # ASSERT
+    assert result.n_finished > 0.95 * N_GAMES
+    assert untraded.n_capped > 0.5 * N_GAMES
+
+
+def test_refused_trades_change_nothing(simulator):
+    """Test: If every player refuses to sell, the games equal those without trading."""
+    lineup = [replace(strategy, sells_sets=False) for strategy in STRATEGIES]
+
+    # ACT
+    refused = simulator.run(lineup, N_GAMES, max_rounds=100, seed=4)
+    untraded = GameSimulator(trade_premium=None).run(lineup, N_GAMES, max_rounds=100, seed=4)
+
+    # ASSERT
+    np.testing.assert_array_equal(refused.winner, untraded.winner)
+    np.testing.assert_array_equal(refused.cash, untraded.cash)
+
+
+def test_matchups(simulator):
+    """Test: Matchup tables are complementary off the diagonal and carry the capped share."""
+    # ACT
+    table = simulator.matchups(STRATEGIES[:3], n_games=200, max_rounds=150, seed=1)
+
+    # ASSERT
+    off_diagonal = ~np.eye(3, dtype=bool)
+    assert table.win_rates.shape == (3, 3)
+    assert np.isnan(np.diag(table.win_rates)).all()
+    np.testing.assert_allclose((table.win_rates + table.win_rates.T)[off_diagonal], 1)
+    np.testing.assert_allclose((table.finished_win_rates + table.finished_win_rates.T)[off_diagonal], 1)
+    np.testing.assert_allclose(table.capped_share, table.capped_share.T)
+    assert ((table.capped_share[off_diagonal] >= 0) & (table.capped_share[off_diagonal] <= 1)).all()
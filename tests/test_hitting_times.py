@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from monopoly_analysis import hitting_times
+from monopoly_analysis.hitting_times import HittingTimes
+from monopoly_analysis.state_codec import StateCodec
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    return TransitionMatrixBuilder().build()
+
+
+def _direct_solve(analysis, absorbing, rhs):
+    keep = np.diag((~absorbing).astype(float))
+    return np.linalg.solve(np.eye(analysis.n_states) - analysis.transition_matrix @ keep, rhs)
+
+
+@pytest.mark.parametrize("unit", ["turns", "rolls"])
+def test_table_matches_direct_solves(matrix, unit):
+    """Test: Low-rank batched table equals one direct solve per field."""
+    analysis = HittingTimes(matrix)
+
+    # ACT
+    table = analysis.expected_hitting_times(unit)
+
+    # ASSERT
+    assert table.shape == (120, 40)
+    assert np.all(np.isinf(table[:, 30]))
+    for field in (0, 10, 24, 39):
+        expected = _direct_solve(analysis, np.isin(analysis.codec.positions, [field]), analysis.step_costs[unit])
+        np.testing.assert_allclose(table[:, field], expected, rtol=1e-9)
+
+
+def test_hit_schlossallee_before_los(matrix):
+    """Test: Probability of reaching Schlossallee before Los matches a direct solve."""
+    analysis = HittingTimes(matrix)
+    target = np.isin(analysis.codec.positions, [39])
+    avoid = np.isin(analysis.codec.positions, [0])
+
+    # ACT
+    result = analysis.hit_probability([39], [0])
+
+    # ASSERT
+    expected = _direct_solve(analysis, target | avoid, analysis.transition_matrix[:, target].sum(axis=1))
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    assert np.all((0 <= result) & (result <= 1))
+
+
+def test_table_is_cached(matrix):
+    """Test: Same matrix returns the cached table object."""
+    hitting_times.clear_cache()
+
+    # ACT
+    first = hitting_times.hitting_time_table(matrix)
+    second = hitting_times.hitting_time_table(matrix.copy())
+
+    # ASSERT
+    assert first is second
+
+
+def test_table_cache_is_keyed_by_codec(matrix):
+    """Test: The same matrix with another state codec gets its own cache entry."""
+    hitting_times.clear_cache()
+    first = hitting_times.hitting_time_table(matrix)
+
+    # ACT
+    same = hitting_times.hitting_time_table(matrix, StateCodec())
+    other = hitting_times.hitting_time_table(matrix, StateCodec(go_in_jail_field=31))
+
+    # ASSERT
+    assert same is first
+    assert other is not first
+    assert len(hitting_times._cache) == 2
@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.incremental import IncrementalModel
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.sweep import solve_config
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+def _reference_matrix(config):
+    probabilities = Probabilities(config)
+    return probabilities.create_transition_matrix(probabilities.create_state_space())
+
+
+def test_build_rows():
+    """Test: build_rows returns exactly the requested rows of the full matrix."""
+    builder = TransitionMatrixBuilder()
+    rows = np.array([0, 31, 32, 119])
+
+    # ACT
+    result = builder.build_rows(rows)
+
+    # ASSERT
+    assert np.array_equal(result, builder.build()[rows])
+
+
+def test_dependency_index():
+    """Test: Jail rules touch only jail states; card targets only states that reach a card field."""
+    model = IncrementalModel()
+
+    # ACT
+    index = model.dependency_index()
+
+    # ASSERT
+    assert np.array_equal(index["jail_rounds"], np.flatnonzero(model.codec.in_jail))
+    # Von Feld 22 aus ist mit 2-12 Augen kein Ereignisfeld erreichbar (24-34)
+    assert model.codec.encode(22, 0, False) not in index["chance_card_fixed_targets"]
+
+
+@pytest.mark.parametrize("delta", [{"chance_three_back": False},
+                                   {"jail_rounds": 1},
+                                   {"chance_card_fixed_targets": (0, 1, 5, 11, 24, 39)},
+                                   {"total_cards": 20}])
+def test_woodbury_update_matches_full_solve(delta):
+    """Test: A rank-k update reproduces matrix and distribution of a full rebuild."""
+    model = IncrementalModel()
+    index = model.dependency_index()
+
+    # ACT
+    rows = model.update(delta)
+
+    # ASSERT
+    assert set(rows) <= set(np.concatenate([index[name] for name in delta]))
+    np.testing.assert_allclose(model.transition_matrix, _reference_matrix(model.config), atol=1e-12)
+    np.testing.assert_allclose(model.distribution, solve_config(model.config).distribution, atol=1e-12)
+    assert model.rank_updates == 1 and model.refactorizations == 1
+
+
+def test_chance_card_to_community_field_is_updated():
+    """Test: Community-card changes reach chance fields whose fixed target is a community field."""
+    model = IncrementalModel(RuleConfig(chance_card_fixed_targets=(0, 1, 5, 11, 24, 39, 10, 2)))
+
+    # ACT
+    model.update(community_chest_fixed_targets=(0,))
+
+    # ASSERT
+    np.testing.assert_allclose(model.transition_matrix, _reference_matrix(model.config), atol=1e-12)
+    np.testing.assert_allclose(model.distribution, solve_config(model.config).distribution, atol=1e-12)
+
+
+def test_dependency_index_follows_chance_targets():
+    """Test: The index is rebuilt when a chance card starts leading to a community field."""
+    model = IncrementalModel()
+    before = model.dependency_index()["community_chest_fixed_targets"]
+
+    # ACT
+    model.update(chance_card_fixed_targets=(0, 1, 5, 11, 24, 39, 10, 2))
+    after = model.dependency_index()["community_chest_fixed_targets"]
+
+    # ASSERT
+    assert set(before) < set(after)
+    assert set(model.dependency_index()["chance_card_fixed_targets"]) <= set(after)
+
+
+def test_successive_updates_accumulate_rank():
+    """Test: Consecutive updates extend the same factorization instead of refactorizing."""
+    model = IncrementalModel()
+
+    # ACT
+    model.update(chance_three_back=False)
+    model.update(jail_rounds=1)
+
+    # ASSERT
+    assert model.refactorizations == 1 and model.rank_updates == 2
+    np.testing.assert_allclose(model.distribution, solve_config(model.config).distribution, atol=1e-12)
+
+
+def test_power_update():
+    """Test: The warm-started power method converges to the full solve."""
+    model = IncrementalModel()
+
+    # ACT
+    model.update(jail_rounds=1, method="power")
+
+    # ASSERT
+    np.testing.assert_allclose(model.field_probabilities, solve_config(model.config).field_probabilities,
+                               atol=1e-9)
+
+
+def test_unchanged_rule_changes_no_rows():
+    """Test: Setting a rule to its current value changes no rows."""
+    model = IncrementalModel()
+
+    # ACT
+    rows = model.update(total_cards=16)
+
+    # ASSERT
+    assert len(rows) == 0
+
+
+def test_state_space_change_rebuilds():
+    """Test: Moving the go-to-jail field rebuilds the whole model."""
+    model = IncrementalModel()
+
+    # ACT
+    rows = model.update(go_in_jail_field=31)
+
+    # ASSERT
+    assert len(rows) == model.codec.n_states
+    assert model.codec.go_in_jail_field == 31
+    np.testing.assert_allclose(model.distribution, solve_config(model.config).distribution, atol=1e-12)
+
+
+def test_unknown_rule_raises():
+    """Test: Unknown rule names raise ValueError."""
+    model = IncrementalModel()
+
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        model.update(dice_sides=8)
+
+
+def test_power_update_raises_without_convergence():
+    """Test: A power update that exhausts max_iter raises instead of storing the last iterate."""
+    model = IncrementalModel()
+    model.tol = 0.0
+    before = model.distribution.copy()
+
+    # ACT
+    with pytest.raises(RuntimeError):
+        model.update(jail_rounds=1, method="power")
+
+    # ASSERT
+    assert np.array_equal(model.distribution, before)
+
+
+def test_failed_update_keeps_previous_model():
+    """Test: A power update without convergence leaves rules and matrix at the previous state."""
+    model = IncrementalModel()
+    model.tol = 0.0
+    config, matrix = model.config, model.transition_matrix.copy()
+
+    # ACT
+    with pytest.raises(RuntimeError):
+        model.update(jail_rounds=1, method="power")
+
+    # ASSERT
+    assert model.config == config
+    assert model.probabilities.rules == config
+    np.testing.assert_array_equal(model.transition_matrix, matrix)
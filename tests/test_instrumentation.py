@@ -0,0 +1,116 @@
+import json
+import pytest
+from monopoly_analysis import solvers
+from monopoly_analysis.instrumentation import PROBABILITY_HOOKS, instrument
+from monopoly_analysis.probabilities import MonopolyState, Probabilities
+from monopoly_analysis.sweep import config_grid, run_sweep
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+@pytest.fixture(scope="module")
+def probabilities():
+    return Probabilities()
+
+
+@pytest.fixture(scope="module")
+def state_space(probabilities):
+    return probabilities.create_state_space()
+
+
+@pytest.fixture(scope="module")
+def recorded(probabilities, state_space):
+    events = []
+    with instrument(probabilities, callback=lambda name, seconds: events.append(name)) as recorder:
+        matrix = probabilities.create_transition_matrix(state_space)
+        solvers.clear_cache()
+        solvers.solve_stationary(matrix, probabilities.codec)
+        probabilities._missing_target(state_space[0], MonopolyState(30, 0, False))
+    return json.loads(recorder.to_json()), events
+
+
+def test_instance_calls_are_counted(recorded):
+    """Test: Builder, transition and solver stage calls of one instance are counted."""
+    report, _ = recorded
+
+    # ACT
+    calls = report["calls"]
+
+    # ASSERT
+    assert calls["create_transition_matrix"]["count"] == 1
+    assert calls["_add_transition"]["count"] > calls["_add_chance_card_transitions"]["count"]
+    assert calls["solve.direct"]["count"] == 1
+
+
+def test_transitions_per_source(recorded, state_space):
+    """Test: One row per source state; the first jail round fans out to several targets."""
+    report, _ = recorded
+
+    # ACT
+    rows = report["transitions_per_source"]
+
+    # ASSERT
+    assert len(rows) == len(state_space)
+    # Gefängnisrunde 1: bleiben + 6 Pasch-Ziele mit Karten
+    jail = next(row for row in rows if row["in_jail"] and row["counter"] == 0)
+    assert jail["transitions"] > 1
+
+
+def test_missing_targets_are_reported(recorded):
+    """Test: A missing target is counted and passed to the callback."""
+    report, events = recorded
+
+    # ACT
+    count = report["missing_targets"]["count"]
+
+    # ASSERT
+    assert count == 1
+    assert "missing_target" in events
+
+
+def test_missing_target_is_printed(probabilities, state_space, capsys):
+    """Test: A missing target still prints the original warning while instrumented."""
+    # ACT
+    with instrument(probabilities, solver_stages=False):
+        probabilities._missing_target(state_space[0], MonopolyState(30, 0, False))
+
+    # ASSERT
+    assert "nicht im state_space" in capsys.readouterr().out
+
+
+def test_instance_hooks_are_removed(recorded, probabilities):
+    """Test: After the block the original methods and solvers are restored."""
+    # ACT
+    leftover = [name for name in PROBABILITY_HOOKS if name in vars(probabilities)]
+
+    # ASSERT
+    assert leftover == []
+    assert solvers.SOLVERS["direct"] is solvers._solve_direct
+
+
+def test_instrument_all_instances():
+    """Test: Without an instance all Probabilities objects and sweep builders are recorded."""
+    # ACT
+    with instrument(solver_stages=False) as recorder:
+        Probabilities().create_transition_matrix(Probabilities().create_state_space())
+        run_sweep(config_grid(jail_rounds=(1, 2)))
+
+    # ASSERT
+    assert recorder.calls["_create_target_state"].count > 0
+    assert recorder.calls["TransitionMatrixBuilder.build"].count == 2
+    assert "matrix_hash" not in recorder.calls
+
+
+def test_class_hooks_are_removed():
+    """Test: After the block the class attributes are the original functions again."""
+    originals = {name: vars(Probabilities)[name] for name in PROBABILITY_HOOKS}
+    build = vars(TransitionMatrixBuilder)["build"]
+    with instrument(solver_stages=False):
+        wrapped = vars(Probabilities)["_add_transition"]
+
+    # ACT
+    restored = {name: vars(Probabilities)[name] for name in PROBABILITY_HOOKS}
+
+    # ASSERT
+    assert wrapped is not originals["_add_transition"]
+    assert all(restored[name] is originals[name] for name in PROBABILITY_HOOKS)
+    assert vars(TransitionMatrixBuilder)["build"] is build
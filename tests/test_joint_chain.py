@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from monopoly_analysis.joint_chain import JointChain, landing_event
+from monopoly_analysis.solvers import normalize_rows
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+@pytest.fixture(scope="module")
+def builder():
+    return TransitionMatrixBuilder()
+
+
+def test_round_operator_equals_kronecker_product(builder):
+    """Test: Implicit round operator matches the dense Kronecker product."""
+    chain = JointChain(builder.build(), n_players=2, per_turn=False)
+    vector = np.random.default_rng(0).random(chain.n_states)
+    single = normalize_rows(builder.build())
+
+    # ACT
+    result = chain.matvec(vector)
+
+    # ASSERT
+    np.testing.assert_allclose(result, vector @ np.kron(single, single), atol=1e-12)
+
+
+def test_product_stationary_is_fixed_point(builder):
+    """Test: Product of single-player stationary vectors is invariant under a full round."""
+    chain = JointChain(builder.build(), n_players=3)
+
+    # ACT
+    stationary = chain.stationary()
+
+    # ASSERT
+    assert stationary.shape == (120, 120, 120)
+    np.testing.assert_allclose(chain.apply_round(stationary), stationary, atol=1e-12)
+    np.testing.assert_allclose(chain.field_marginal(stationary, 2).sum(), 1.0)
+
+
+def test_first_event_probabilities_sum_to_one(builder):
+    """Test: Landing-before-passing-Los probabilities are a proper distribution."""
+    matrix = builder.build()
+    chain = JointChain(matrix, n_players=2)
+    events = {1: landing_event(matrix, chain.codec, [37, 39]), 0: builder.build_passing_go()}
+
+    # ACT
+    result = chain.first_event_probabilities(events)
+
+    # ASSERT
+    assert sum(result.values()) == pytest.approx(1.0)
+    assert 0.0 < result[1] < 0.5 < result[0]
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.mdp import ACTIONS, GAME_PHASES, JailMDP, _cache, action_matrices, clear_cache
+from monopoly_analysis.probabilities import MonopolyState
+
+FIRST_ROUND = MonopolyState(10, 0, True)
+
+
+@pytest.fixture(scope="module")
+def mdp():
+    return JailMDP()
+
+
+@pytest.fixture(scope="module")
+def by_policy(mdp):
+    return mdp.solve(method="policy")
+
+
+@pytest.fixture(scope="module")
+def by_value(mdp):
+    return mdp.solve(method="value")
+
+
+def test_action_matrices_are_stochastic():
+    """Test: One row-stochastic matrix per action; the passing-Los mass never exceeds the transition."""
+    # ACT
+    transitions, passing_go = action_matrices()
+
+    # ASSERT
+    assert transitions.shape == (len(ACTIONS), 120, 120)
+    np.testing.assert_allclose(transitions.sum(axis=2), 1)
+    assert (passing_go <= transitions + 1e-15).all()
+
+
+def test_action_matrices_are_cached():
+    """Test: Repeated calls return the cached matrices."""
+    # ACT
+    first, second = action_matrices()[0], action_matrices()[0]
+
+    # ASSERT
+    assert first is second
+
+
+def test_action_matrix_cache_is_bounded(monkeypatch):
+    """Test: The action-matrix cache keeps at most max_entries rule variants."""
+    clear_cache()
+    monkeypatch.setattr(_cache, "max_entries", 2)
+
+    # ACT
+    for jail_rounds in (1, 2, 3):
+        action_matrices(RuleConfig(jail_rounds=jail_rounds))
+
+    # ASSERT
+    assert len(_cache) == 2
+    assert RuleConfig(jail_rounds=1).config_hash() not in _cache
+
+
+@pytest.mark.parametrize("phase", [phase.name for phase in GAME_PHASES])
+def test_policy_and_value_iteration_agree(by_policy, by_value, phase):
+    """Test: Policy and value iteration find the same policy and values."""
+    # ACT
+    policy, values = by_value[phase].policy, by_value[phase].values
+
+    # ASSERT
+    assert np.array_equal(by_policy[phase].policy, policy)
+    np.testing.assert_allclose(by_policy[phase].values, values, rtol=1e-8)
+
+
+@pytest.mark.parametrize("phase", [phase.name for phase in GAME_PHASES])
+def test_only_roll_outside_jail(mdp, by_policy, phase):
+    """Test: Outside jail the only action is "roll"."""
+    # ACT
+    policy = by_policy[phase].policy
+
+    # ASSERT
+    assert (policy[~mdp.codec.in_jail] == 0).all()
+
+
+def test_pay_early_roll_late(mdp, by_policy):
+    """Test: In the first jail round pay early in the game and roll late in the game."""
+    # ACT
+    early = mdp.policy_table(by_policy["früh"])[FIRST_ROUND]
+    late = mdp.policy_table(by_policy["spät"])[FIRST_ROUND]
+
+    # ASSERT
+    assert early == "pay"
+    assert late == "roll"
+
+
+def test_cheap_card_is_preferred():
+    """Test: A cheap get-out-of-jail card is used instead of paying."""
+    with_card = JailMDP(card_value=10)
+
+    # ACT
+    policy = with_card.policy_table(with_card.solve()["früh"])
+
+    # ASSERT
+    assert policy[FIRST_ROUND] == "card"
@@ -18,3 +18,24 @@ def test_doubles_probs():
         12: 0.0278
     }
     assert result == expected
+
+
+def test_state_codec_matches_state_space_order():
+    """Test: Closed-form encode/decode reproduces create_state_space indices."""
+    obj = moprob.Probabilities()
+    states = obj.create_state_space()
+    codec = obj.codec
+
+    # ACT
+    encoded = codec.encode([s.position for s in states], [s.counter for s in states], [s.in_jail for s in states])
+    positions, counters, in_jail = codec.decode(encoded)
+
+    # ASSERT
+    assert codec.n_states == len(states)
+    assert list(encoded) == list(range(len(states)))
+    assert codec.states() == states
+    assert [s.position for s in states] == positions.tolist()
+    assert [s.counter for s in states] == counters.tolist()
+    assert [s.in_jail for s in states] == in_jail.tolist()
+    assert codec.index_of(30, 0, False) == -1
+    assert codec.index_of(5, 1, True) == -1
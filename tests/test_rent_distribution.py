@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from monopoly_analysis import roi
+from monopoly_analysis.rent_distribution import RentDistributionEngine, group_property_sets
+from monopoly_analysis.sweep import solve_config
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return RentDistributionEngine(resolution=2)
+
+
+@pytest.fixture(scope="module")
+def holdings(engine):
+    return group_property_sets(engine.game_version, level=2)["orange"]
+
+
+@pytest.fixture(scope="module")
+def single(engine, holdings):
+    return engine.distribution(holdings, n_turns=10, name="orange")
+
+
+def test_mass_is_conserved(single):
+    """Test: pmf plus truncated tail sums to one, and the tail is negligible."""
+    # ACT
+    total = single.pmf.sum() + single.truncated_mass
+
+    # ASSERT
+    assert total == pytest.approx(1)
+    assert single.truncated_mass < 1e-10
+
+
+def test_mean_equals_turns_times_expected_rent(engine, holdings, single):
+    """Test: Starting stationary, the mean is n_turns × expected rent per turn."""
+    landing_rates = roi.landings_per_turn(solve_config(engine.config).distribution, engine.codec)
+
+    # ACT
+    mean = single.mean()
+
+    # ASSERT
+    assert mean == pytest.approx(10 * landing_rates @ engine.rent_vector(holdings), rel=1e-9)
+
+
+def test_percentiles_are_ordered(single):
+    """Test: The 5th, 50th and 95th percentiles are non-decreasing."""
+    # ACT
+    low, median, high = single.percentile((5, 50, 95))
+
+    # ASSERT
+    assert low <= median <= high
+
+
+def test_independent_opponents_are_convolved(engine, holdings, single):
+    """Test: Three opponents triple the mean and scale the standard deviation by √3."""
+    # ACT
+    three = engine.distribution(holdings, n_turns=10, opponents=3)
+
+    # ASSERT
+    assert three.mean() == pytest.approx(3 * single.mean(), rel=1e-9)
+    assert three.std() == pytest.approx(np.sqrt(3) * single.std(), rel=1e-6)
+    assert (three.pmf >= 0).all()
+
+
+def test_percentile_table():
+    """Test: One row per property set with ordered percentiles and negligible truncation."""
+    engine = RentDistributionEngine()
+
+    # ACT
+    table = engine.percentile_table(n_turns=5, percentiles=(50, 99))
+
+    # ASSERT
+    assert list(table["property_set"]) == list(group_property_sets(engine.game_version))
+    assert (table["percentiles"][:, 0] <= table["percentiles"][:, 1]).all()
+    assert (table["truncated_mass"] < 1e-10).all()
+
+
+def test_lowest_group_rents_are_kept():
+    """Test: By default the grid follows the rents, so the purple base rents 2 and 4 are not rounded away."""
+    engine = RentDistributionEngine()
+    purple = {1: 0, 3: 0}
+    landing_rates = roi.landings_per_turn(solve_config(engine.config).distribution, engine.codec)
+
+    # ACT
+    result = engine.distribution(purple, n_turns=5)
+
+    # ASSERT
+    assert result.resolution == 4
+    assert result.mean() == pytest.approx(5 * landing_rates @ engine.rent_vector(purple), rel=1e-9)
+
+
+def test_utility_has_no_rent_vector(engine):
+    """Test: Utilities depend on the dice sum and are rejected."""
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        engine.rent_vector({12: 0})
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from monopoly_analysis import roi, solvers
+from monopoly_analysis.game_board import GermanMonopoly
+from monopoly_analysis.probabilities import Probabilities
+
+
+@pytest.fixture(scope="module")
+def landing_rates():
+    probabilities = Probabilities()
+    matrix = probabilities.create_transition_matrix(probabilities.create_state_space())
+    stationary = solvers.solve_stationary(matrix, probabilities.codec)
+    return roi.landings_per_turn(stationary.distribution, probabilities.codec)
+
+
+def test_landings_per_turn(landing_rates):
+    """Test: A turn lands at least once on average and never on field 30."""
+    # ACT
+    total = landing_rates.sum()
+
+    # ASSERT
+    assert total > 1
+    assert landing_rates[30] == 0
+
+
+def test_one_row_per_scenario_street_level_and_opponents(landing_rates):
+    """Test: evaluate_investments returns the full scenario × street × level × opponents grid."""
+    # ACT
+    results = roi.evaluate_investments(np.stack([landing_rates, 2 * landing_rates]), opponents=(1, 3))
+
+    # ASSERT
+    assert len(results) == 2 * len(GermanMonopoly().streets) * 6 * 2
+
+
+def test_hotel_row_on_schlossallee(landing_rates):
+    """Test: Investment, income and break-even of a hotel on field 39 follow the street data."""
+    street = GermanMonopoly().streets[39]
+    results = roi.evaluate_investments(landing_rates, opponents=(3,))
+
+    # ACT
+    row = results[(results["field"] == 39) & (results["level"] == 5)][0]
+
+    # ASSERT
+    assert row["investment"] == street.price + 5 * street.house_cost
+    assert np.isclose(row["income_per_round"], 3 * landing_rates[39] * street.rents[5])
+    assert np.isclose(row["break_even_rounds"], row["investment"] / row["income_per_round"])
+
+
+def test_income_scales_with_landing_rates(landing_rates):
+    """Test: Doubling the landing rates of a scenario doubles its income."""
+    # ACT
+    results = roi.evaluate_investments(np.stack([landing_rates, 2 * landing_rates]))
+
+    # ASSERT
+    doubled = results[results["scenario"] == 1]["income_per_round"]
+    np.testing.assert_allclose(doubled, 2 * results[results["scenario"] == 0]["income_per_round"])
+
+
+def test_full_set_doubles_base_rent(landing_rates):
+    """Test: A complete colour group doubles the rent of undeveloped streets only."""
+    base = roi.evaluate_investments(landing_rates)
+
+    # ACT
+    full_set = roi.evaluate_investments(landing_rates, full_set=True)
+
+    # ASSERT
+    level_zero = base["level"] == 0
+    np.testing.assert_allclose(full_set["rent"][level_zero], 2 * base["rent"][level_zero])
+    np.testing.assert_allclose(full_set["rent"][~level_zero], base["rent"][~level_zero])
+
+
+def test_rank_investments(landing_rates):
+    """Test: The top-ranked investment has the highest ROI."""
+    results = roi.evaluate_investments(landing_rates)
+
+    # ACT
+    best = roi.rank_investments(results, top=1)[0]
+
+    # ASSERT
+    assert best["roi"] == results["roi"].max()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.sensitivity import StationarySensitivity
+from monopoly_analysis.sweep import solve_config
+
+
+@pytest.fixture(scope="module")
+def result():
+    return StationarySensitivity().jacobian()
+
+
+def test_jacobian_shape_and_parameters(result):
+    """Test: One Jacobian row per rule parameter, one column per field."""
+    # ACT
+    shape = result.jacobian.shape
+
+    # ASSERT
+    assert shape == (len(result.parameters), 40)
+    assert "chance_three_back" in result.parameters
+    assert "jail_release_round[1]" in result.parameters
+
+
+def test_distribution_stays_normalized(result):
+    """Test: Every Jacobian row sums to zero, the distribution keeps total mass 1."""
+    # ACT
+    row_sums = result.jacobian.sum(axis=1)
+
+    # ASSERT
+    np.testing.assert_allclose(row_sums, 0, atol=1e-12)
+
+
+def test_total_cards_matches_central_difference(result):
+    """Test: The derivative by total_cards (made continuous) equals a central difference."""
+    step = 1e-4
+
+    # ACT
+    difference = (solve_config(RuleConfig(total_cards=16 + step)).field_probabilities
+                  - solve_config(RuleConfig(total_cards=16 - step)).field_probabilities) / (2 * step)
+
+    # ASSERT
+    np.testing.assert_allclose(result["total_cards"], difference, atol=1e-9)
+
+
+def test_linear_prediction_for_removed_card(result):
+    """Test: Removing the "three back" card is predicted well by the linear approximation."""
+    exact = solve_config(RuleConfig(chance_three_back=False)).field_probabilities - result.field_probabilities
+
+    # ACT
+    predicted = -result["chance_three_back"] / 16
+
+    # ASSERT
+    assert np.abs(predicted - exact).max() < 0.05 * np.abs(exact).max()
+
+
+def test_paying_early_reduces_jail_time(result):
+    """Test: A higher release probability in the first jail round lowers the mass on field 10."""
+    # ACT
+    derivative = result["jail_release_round[0]"][10]
+
+    # ASSERT
+    assert derivative < 0
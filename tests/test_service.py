@@ -0,0 +1,134 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.service import QueryService, request
+from monopoly_analysis.sweep import solve_config
+
+PAYLOAD = {"config": {"jail_rounds": 2}}
+
+
+def _serve(calls):
+    """
+    Startet einen Service auf einem freien Port, schickt die Anfragen
+    nacheinander über eine Verbindung und gibt die Antworten zurück.
+    """
+    async def scenario():
+        service = QueryService(executor=ThreadPoolExecutor(1))
+        server = await service.serve("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        try:
+            return [await request(reader, writer, *call) for call in calls]
+        finally:
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            service.close()
+
+    return asyncio.run(scenario())
+
+
+@pytest.fixture(scope="module")
+def coalesced():
+    service = QueryService(max_entries=2, executor=ThreadPoolExecutor(2))
+
+    async def scenario():
+        return await asyncio.gather(*(service.landing(PAYLOAD) for _ in range(10)))
+
+    results = asyncio.run(scenario())
+    service.close()
+    return service, results
+
+
+def test_concurrent_requests_are_coalesced(coalesced):
+    """Test: Ten concurrent requests for one config trigger a single build."""
+    service, results = coalesced
+
+    # ACT
+    metrics = service.metrics
+
+    # ASSERT
+    assert metrics.builds == 1
+    assert metrics.coalesced == 9
+    assert all(result == results[0] for result in results)
+
+
+def test_landing_matches_solver(coalesced):
+    """Test: The landing response contains the field probabilities of the solver."""
+    _, results = coalesced
+
+    # ACT
+    probabilities = results[0]["field_probabilities"]
+
+    # ASSERT
+    np.testing.assert_allclose(probabilities, solve_config(RuleConfig(jail_rounds=2)).field_probabilities)
+
+
+def test_cache_is_bounded():
+    """Test: The result cache never holds more than max_entries configs."""
+    service = QueryService(max_entries=2, executor=ThreadPoolExecutor(1))
+
+    async def scenario():
+        for jail_rounds in (1, 2, 3):
+            await service.landing({"config": {"jail_rounds": jail_rounds}})
+
+    # ACT
+    asyncio.run(scenario())
+    service.close()
+
+    # ASSERT
+    assert len(service.cache) == 2
+
+
+def test_http_roi():
+    """Test: POST /roi returns the requested fields."""
+    # ACT
+    [(status, body)] = _serve([("POST", "/roi", {"fields": [39], "levels": [3]})])
+
+    # ASSERT
+    assert status == 200
+    assert [row["field"] for row in body["rows"]] == [39]
+
+
+@pytest.mark.parametrize("call, expected", [(("POST", "/roi", {"config": {"jail_rounds": 7}}), 400),
+                                            (("POST", "/roi", {"config": {"railroads": []}}), 400),
+                                            (("GET", "/nirgends"), 404)])
+def test_http_errors(call, expected):
+    """Test: Invalid configs and boards answer 400, unknown routes 404."""
+    # ACT
+    [(status, _)] = _serve([call])
+
+    # ASSERT
+    assert status == expected
+
+
+def test_http_metrics():
+    """Test: /metrics counts requests and errors per route."""
+    # ACT
+    *_, (status, metrics) = _serve([("POST", "/roi", {"fields": [39]}),
+                                    ("POST", "/roi", {"config": {"jail_rounds": 7}}),
+                                    ("GET", "/metrics")])
+
+    # ASSERT
+    assert status == 200
+    assert metrics["routes"]["/roi"]["requests"] == 2
+    assert metrics["routes"]["/roi"]["errors"] == 1
+
+
+def test_metrics_ignore_query_strings():
+    """Test: Requests with arbitrary query strings are recorded under their route path."""
+    service = QueryService(executor=ThreadPoolExecutor(1))
+
+    async def scenario():
+        for token in range(5):
+            await service.handle("GET", f"/health?x={token}", b"")
+
+    # ACT
+    asyncio.run(scenario())
+    service.close()
+
+    # ASSERT
+    assert list(service.metrics.requests) == ["/health"]
+    assert service.metrics.requests["/health"] == 5
@@ -0,0 +1,61 @@
+import numpy as np
+import monopoly_analysis.probabilities as moprob
+from monopoly_analysis import solvers
+from monopoly_analysis.simulation import MonteCarloSimulator
+
+
+def test_simulation_matches_stationary_distribution():
+    """Test: Empirical visit frequencies converge to the analytic stationary vector."""
+    obj = moprob.Probabilities()
+    states = obj.create_state_space()
+    stationary = solvers.solve_stationary(obj.create_transition_matrix(states), states)
+
+    # ACT
+    result = MonteCarloSimulator().run(n_players=20_000, n_steps=100, burn_in=50, seed=42)
+
+    # ASSERT
+    assert result.counts.sum() == result.n_turns == 2_000_000
+    np.testing.assert_allclose(result.frequencies, stationary.distribution, atol=2e-3)
+    np.testing.assert_allclose(result.field_frequencies(states), stationary.field_probabilities, atol=2e-3)
+
+
+def test_simulation_is_reproducible():
+    """Test: Same seed gives identical counts."""
+    sim = MonteCarloSimulator()
+
+    # ACT
+    first = sim.run(n_players=1_000, n_steps=10, seed=7)
+    second = sim.run(n_players=1_000, n_steps=10, seed=7)
+
+    # ASSERT
+    np.testing.assert_array_equal(first.counts, second.counts)
+
+
+def test_go_to_jail_field_is_never_occupied():
+    """Test: Nobody ends a move on field 30."""
+    sim = MonteCarloSimulator()
+    rng = np.random.default_rng(0)
+    position = np.full(5_000, 20, dtype=np.int16)
+    counter = np.zeros(5_000, dtype=np.int8)
+    in_jail = np.zeros(5_000, dtype=bool)
+
+    # ACT
+    for _ in range(20):
+        sim.step(position, counter, in_jail, rng)
+
+    # ASSERT
+    assert not np.any(position == 30)
+    assert np.all(position[in_jail] == 10)
+
+
+def test_parallel_run_is_reproducible_per_worker_count():
+    """Test: Parallel runs are bit-identical for the same seed and worker count."""
+    sim = MonteCarloSimulator()
+
+    # ACT
+    first = sim.run_parallel(n_players=3_000, n_steps=20, n_workers=2, burn_in=10, seed=11, max_batch=1_000)
+    second = sim.run_parallel(n_players=3_000, n_steps=20, n_workers=2, burn_in=10, seed=11, max_batch=1_000)
+
+    # ASSERT
+    np.testing.assert_array_equal(first.counts, second.counts)
+    assert first.counts.sum() == first.n_turns == 60_000
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import monopoly_analysis.probabilities as moprob
+from monopoly_analysis import solvers
+
+
+@pytest.fixture(scope="module")
+def chain():
+    obj = moprob.Probabilities()
+    states = obj.create_state_space()
+    return obj.create_transition_matrix(states), states
+
+
+@pytest.mark.parametrize("method", ["direct", "power", "krylov"])
+def test_backends_agree(chain, method):
+    """Test: All backends return the same stationary distribution."""
+    matrix, states = chain
+    reference = solvers.solve_stationary(matrix, states, method="direct")
+
+    # ACT
+    result = solvers.solve_stationary(matrix, states, method=method, tol=1e-13)
+
+    # ASSERT
+    np.testing.assert_allclose(result.distribution, reference.distribution, atol=1e-9)
+    assert result.field_probabilities.sum() == pytest.approx(1.0)
+    assert result.field_probabilities[30] == 0.0
+    assert result.residual < 1e-9
+
+
+def test_jail_is_most_visited_field(chain):
+    """Test: Field 10 (visiting + in jail) has the highest long-run probability."""
+    matrix, states = chain
+
+    # ACT
+    result = solvers.solve_stationary(matrix, states)
+
+    # ASSERT
+    assert int(np.argmax(result.field_probabilities)) == 10
+
+
+def test_results_are_cached(chain):
+    """Test: Repeated queries with an equal matrix return the cached result."""
+    matrix, states = chain
+    solvers.clear_cache()
+
+    # ACT
+    first = solvers.solve_stationary(matrix, states, method="power")
+    second = solvers.solve_stationary(matrix.copy(), states, method="power")
+
+    # ASSERT
+    assert first is second
+
+
+def test_cache_is_bounded(chain, monkeypatch):
+    """Test: The result cache evicts the least recently used entry beyond max_entries."""
+    matrix, states = chain
+    solvers.clear_cache()
+    monkeypatch.setattr(solvers._cache, "max_entries", 2)
+
+    # ACT
+    first = solvers.solve_stationary(matrix, states, method="direct")
+    solvers.solve_stationary(matrix, states, method="power")
+    solvers.solve_stationary(matrix, states, method="power", max_iter=5_000)
+
+    # ASSERT
+    assert len(solvers._cache) == 2
+    assert solvers.solve_stationary(matrix, states, method="direct") is not first
@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+from monopoly_analysis import sweep
+from monopoly_analysis.game_board import RuleConfig
+from monopoly_analysis.probabilities import Probabilities
+from monopoly_analysis.sweep import MatrixCache, config_grid, run_sweep
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+def test_rule_config_is_hashable_value():
+    """Test: Equal rules compare and hash equal regardless of list or tuple input."""
+    # ACT
+    config = RuleConfig(chance_fields=[7, 22, 36])
+
+    # ASSERT
+    assert config == RuleConfig()
+    assert hash(config) == hash(RuleConfig())
+    assert config.config_hash() != RuleConfig(jail_rounds=1).config_hash()
+
+
+def test_rule_config_rejects_invalid_jail_rounds():
+    """Test: jail_rounds outside 1-3 raises ValueError."""
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        RuleConfig(jail_rounds=4)
+
+
+@pytest.mark.parametrize("rules", [{"chance_fields": (7, 22, 36, 40)},
+                                   {"community_fields": (-1,)},
+                                   {"chance_card_fixed_targets": (0, 45)},
+                                   {"railroads": ()},
+                                   {"jail_field": 30},
+                                   {"total_cards": 0}])
+def test_rule_config_rejects_invalid_board(rules):
+    """Test: Fields off the board, missing railroads or a jail on the go-to-jail field raise ValueError."""
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        RuleConfig(**rules)
+
+
+def test_builder_follows_reference_for_rule_variants():
+    """Test: The vectorized builder reproduces create_transition_matrix for non-default rules."""
+    probabilities = Probabilities(RuleConfig(jail_rounds=1, total_cards=20, chance_three_back=False))
+    reference = probabilities.create_transition_matrix(probabilities.create_state_space())
+
+    # ACT
+    matrix = TransitionMatrixBuilder(probabilities).build()
+
+    # ASSERT
+    np.testing.assert_allclose(matrix, reference, atol=1e-12)
+
+
+def test_config_grid():
+    """Test: config_grid is the cartesian product with the last axis running fastest."""
+    # ACT
+    configs = config_grid(jail_rounds=[1, 3], total_cards=[16, 20])
+
+    # ASSERT
+    assert len(configs) == 4
+    assert configs[1] == RuleConfig(jail_rounds=1, total_cards=20)
+
+
+def test_sweep_keeps_order_and_fills_cache(tmp_path):
+    """Test: run_sweep returns points in config order, bounded in memory, all written to disk."""
+    configs = config_grid(jail_rounds=[1, 3], total_cards=[16, 20])
+    cache = MatrixCache(max_entries=3, directory=tmp_path)
+
+    # ACT
+    points = run_sweep(configs, cache=cache)
+
+    # ASSERT
+    assert [point.config for point in points] == configs
+    assert len(cache) == 3
+    assert len(list(tmp_path.glob("*.npz"))) == 4
+    assert not points[0].transition_matrix.flags.writeable
+
+
+def test_paying_immediately_reduces_jail_probability():
+    """Test: With jail_rounds=1 field 10 is visited less often than with three rounds."""
+    # ACT
+    immediate, three_rounds = run_sweep([RuleConfig(jail_rounds=1), RuleConfig(jail_rounds=3)])
+
+    # ASSERT
+    assert immediate.field_probabilities[10] < three_rounds.field_probabilities[10]
+
+
+def test_fresh_cache_reads_from_disk(tmp_path):
+    """Test: A new cache loads earlier results from disk and only solves new configs."""
+    configs = config_grid(jail_rounds=[1, 3], total_cards=[16, 20])
+    points = run_sweep(configs, cache=MatrixCache(directory=tmp_path))
+    fresh = MatrixCache(directory=tmp_path)
+
+    # ACT
+    rerun = run_sweep(configs + [RuleConfig(jail_rounds=2)], n_workers=2, cache=fresh)
+
+    # ASSERT
+    assert fresh.disk_hits == 4 and fresh.misses == 1
+    assert np.array_equal(rerun[3].distribution, points[3].distribution)
+    assert not rerun[0].transition_matrix.flags.writeable
+
+
+def test_parallel_cache_writers_publish_complete_files(tmp_path):
+    """Test: Concurrent writers of the same config each use their own temporary file."""
+    point = run_sweep([RuleConfig(jail_rounds=2)])[0]
+    caches = [MatrixCache(directory=tmp_path) for _ in range(8)]
+
+    # ACT
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(MatrixCache.put, caches, [point] * len(caches)))
+
+    # ASSERT
+    assert [path.name for path in tmp_path.iterdir()] == [caches[0]._path(point.config.config_hash()).name]
+    stored = MatrixCache(directory=tmp_path).get(point.config)
+    assert np.array_equal(stored.distribution, point.distribution)
+
+
+def test_builder_version_invalidates_disk_cache(tmp_path, monkeypatch):
+    """Test: After a builder version bump files written by the old builder are not read."""
+    config = RuleConfig(jail_rounds=2)
+    run_sweep([config], cache=MatrixCache(directory=tmp_path))
+    monkeypatch.setattr(sweep, "BUILDER_VERSION", sweep.BUILDER_VERSION + 1)
+    fresh = MatrixCache(directory=tmp_path)
+
+    # ACT
+    cached = fresh.get(config)
+
+    # ASSERT
+    assert cached is None
+    assert fresh.misses == 1
+
+
+def test_memory_tier_is_bounded():
+    """Test: The in-memory tier keeps at most max_entries configs."""
+    cache = MatrixCache(max_entries=2)
+
+    # ACT
+    run_sweep(config_grid(jail_rounds=[1, 2, 3]), cache=cache)
+
+    # ASSERT
+    assert len(cache) == 2
+    assert cache.max_entries == 2
+    assert cache.get(RuleConfig(jail_rounds=1)) is None
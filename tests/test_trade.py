@@ -0,0 +1,187 @@
+import numpy as np
+import pytest
+from monopoly_analysis import roi
+from monopoly_analysis.game_board import GermanMonopoly
+from monopoly_analysis.trade import BANK, NO_FIELD, TRADE_DTYPE, TradeModel, evaluate_trades, rank_trades
+
+
+def brute_force_income(model: TradeModel, owner: np.ndarray, player: int) -> float:
+    # Referenz: Miete je Gegnerzug direkt aus den Feldern des Spielers
+    total = 0.0
+    for group in range(len(model.group_sizes)):
+        members = model.field[model.group == group]
+        mine = members[owner[members] == player]
+        if len(mine) == len(members):
+            total += model.full_income[group]
+        elif len(mine):
+            rates = model.base_rent[np.isin(model.field, mine)].sum()
+            total += rates * model.multipliers[group, len(mine)]
+    return total
+
+
+@pytest.fixture(scope="module")
+def model():
+    return TradeModel.from_config()
+
+
+@pytest.fixture(scope="module")
+def board():
+    return GermanMonopoly()
+
+
+@pytest.fixture(scope="module")
+def owner(model):
+    rng = np.random.default_rng(3)
+    owner = np.full(40, BANK)
+    owner[model.field] = rng.integers(0, 3, len(model.field))
+    owner[[37, 39]] = (0, 1)
+    return owner
+
+
+@pytest.fixture(scope="module")
+def results(model, owner):
+    return evaluate_trades(owner, model, cash_offers=(-100, 0, 100))
+
+
+def test_models_are_cached():
+    """Test: The same configuration and level return the cached model."""
+    # ACT
+    first, second = TradeModel.from_config(level=3), TradeModel.from_config(level=3)
+
+    # ASSERT
+    assert first is second
+
+
+def test_model_covers_all_properties(model):
+    """Test: The model holds one row per street, railroad and utility."""
+    # ACT
+    n_fields = len(model.field)
+
+    # ASSERT
+    assert n_fields == 28
+    assert model.group_sizes.sum() == 28
+
+
+def test_full_set_income_and_build_cost(board):
+    """Test: A full dark-blue set earns the level-3 rents and costs three houses per street."""
+    model = TradeModel.from_config(level=3)
+    dark_blue = model.group_names.index("dunkelblau")
+    landing_39 = model.base_rent[model.field == 39][0] / board.streets[39].rents[0]
+    landing_37 = model.base_rent[model.field == 37][0] / board.streets[37].rents[0]
+
+    # ACT
+    income = model.full_income[dark_blue]
+
+    # ASSERT
+    assert income == pytest.approx(landing_39 * 1400 + landing_37 * 1100)
+    assert model.build_cost[dark_blue] == 3 * 2 * 200
+
+
+def test_railroads_pay_eight_times_base_rent(model):
+    """Test: Four railroads earn eight times the base rent."""
+    railroads = model.group_names.index("Bahnhöfe")
+
+    # ACT
+    income = model.full_income[railroads]
+
+    # ASSERT
+    assert income == pytest.approx(8 * model.base_rent[model.group == railroads].sum())
+
+
+def test_level_zero_doubles_base_rent(board):
+    """Test: Without houses a full set earns double the base rent."""
+    model = TradeModel.from_landing_rates(np.full(40, 0.1), board, level=0)
+
+    # ACT
+    income = model.full_income[model.group_names.index("dunkelblau")]
+
+    # ASSERT
+    assert income == pytest.approx(0.1 * 2 * (35 + 50))
+
+
+def test_candidate_count(model, owner, results):
+    """Test: Every swap between different owners and every one-sided offer appears once per cash offer."""
+    n_owned = len(model.field)
+    per_player = np.bincount(owner[model.field], minlength=3)
+
+    # ACT
+    n_swaps = n_owned ** 2 - (per_player ** 2).sum()
+
+    # ASSERT
+    assert len(results) == 3 * (n_swaps + 2 * n_owned)
+
+
+def test_deltas_match_brute_force(model, owner, results):
+    """Test: Income and net deltas equal a direct recomputation after the trade."""
+    rows = results[np.random.default_rng(3).choice(len(results), 200, replace=False)]
+
+    # ACT
+    expected = []
+    for row in rows:
+        after = owner.copy()
+        after[row["offered"]] = row["partner"]
+        if row["requested"] != NO_FIELD:
+            after[row["requested"]] = row["proposer"]
+        proposer = brute_force_income(model, after, row["proposer"]) - brute_force_income(model, owner, row["proposer"])
+        partner = brute_force_income(model, after, row["partner"]) - brute_force_income(model, owner, row["partner"])
+        expected.append((2 * proposer, 2 * proposer - partner, 2 * partner - proposer))
+
+    # ASSERT
+    np.testing.assert_allclose(rows[["income_delta", "net_delta", "partner_net_delta"]].tolist(), expected,
+                               atol=1e-12)
+
+
+def test_completing_a_set(results):
+    """Test: Getting Schlossallee completes dark blue for player 0 and includes the build cost."""
+    # ACT
+    # Spieler 1 tauscht Schlossallee gegen Parkstraße: Spieler 0 vervollständigt Dunkelblau
+    deal = results[(results["proposer"] == 0) & (results["requested"] == 39) & (results["offered"] != 37)
+                   & (results["cash"] == 100)]
+
+    # ASSERT
+    assert deal["completes_set"].all()
+    assert (deal["build_cost"] == 1200).all()
+    np.testing.assert_allclose(deal["break_even_rounds"], 1300 / deal["net_delta"])
+
+
+def test_rank_by_net_delta(results):
+    """Test: The default ranking puts the largest net delta first."""
+    # ACT
+    ranked = rank_trades(results, top=10)
+
+    # ASSERT
+    assert len(ranked) == 10
+    assert ranked[0]["net_delta"] == results["net_delta"].max()
+
+
+def test_rank_by_break_even_with_partner_horizon(results):
+    """Test: Ranking by break-even is ascending and respects the partner horizon."""
+    # ACT
+    fastest = rank_trades(results, key="break_even_rounds", partner_horizon=50)
+
+    # ASSERT
+    assert (fastest["break_even_rounds"][:-1] <= fastest["break_even_rounds"][1:]).all()
+    assert (fastest["partner_break_even_rounds"] <= 50).all()
+
+
+def test_landing_rates_match_roi(model):
+    """Test: The landing rates implied by the base rents are positive and sum to less than one."""
+    streets = roi.property_table()
+
+    # ACT
+    rates = model.base_rent[:len(streets["field"])] / streets["rents"][:, 0]
+
+    # ASSERT
+    assert (rates > 0).all()
+    assert rates.sum() < 1
+
+
+def test_empty_board_has_no_candidates(model):
+    """Test: A board without owned properties yields an empty result instead of an error."""
+    # ACT
+    result = evaluate_trades(np.full(40, BANK), model)
+
+    # ASSERT
+    assert result.dtype == TRADE_DTYPE
+    assert len(result) == 0
+    assert len(rank_trades(result, top=5)) == 0
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from monopoly_analysis import solvers
+from monopoly_analysis.transient import TransientAnalysis
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    return TransientAnalysis(TransitionMatrixBuilder().build(), per_turn=False)
+
+
+def test_stream_and_jump_agree(analysis):
+    """Test: Repeated squaring gives the same distribution as stepwise streaming."""
+    # ACT
+    streamed = list(analysis.stream(37, by_field=True))
+    jumped = analysis.distribution_at(37, by_field=True)
+
+    # ASSERT
+    assert len(streamed) == 37
+    np.testing.assert_allclose(jumped, streamed[-1], atol=1e-12)
+    assert analysis.distribution_at(0)[0] == 1.0
+
+
+def test_first_roll_from_los(analysis):
+    """Test: After one roll from Los, field 7 (chance) keeps only the non-moving cards."""
+    # ACT
+    first = analysis.distribution_at(1, by_field=True)
+
+    # ASSERT
+    assert first.sum() == pytest.approx(1.0)
+    assert first[7] == pytest.approx(0.1667 / 1.0003 * 7 / 16)
+
+
+def test_long_run_converges_to_stationary():
+    """Test: Per-turn distribution at k=200 approaches the stationary turn-start distribution."""
+    analysis = TransientAnalysis(TransitionMatrixBuilder().build())
+    stationary = solvers.solve_stationary(analysis.step_matrix, analysis.codec)
+
+    # ACT
+    result = analysis.history(200)
+
+    # ASSERT
+    assert result.shape == (200, 40)
+    np.testing.assert_allclose(result[-1], stationary.field_probabilities, atol=1e-9)
@@ -0,0 +1,29 @@
+import numpy as np
+import monopoly_analysis.probabilities as moprob
+from monopoly_analysis.transition_builder import TransitionMatrixBuilder
+
+
+def test_matches_reference_builder():
+    """Test: Vectorized matrix equals the recursive reference implementation."""
+    obj = moprob.Probabilities()
+    states = obj.create_state_space()
+
+    # ACT
+    expected = obj.create_transition_matrix(states)
+    result = TransitionMatrixBuilder(obj).build(states)
+
+    # ASSERT
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_landing_kernel_rows_sum_to_one():
+    """Test: Every landing field distributes its full probability mass."""
+    builder = TransitionMatrixBuilder()
+
+    # ACT
+    result = builder.landing_kernel.sum(axis=1)
+
+    # ASSERT
+    np.testing.assert_allclose(result, np.ones(40), atol=1e-12)
+    assert builder.landing_kernel[30, builder.jail_column] == 1.0